@@ -0,0 +1,165 @@
+"""Simulate the dispatch of queued batch jobs oldest first and with the FairShareScheduler.
+
+Replays a synthetic job arrival trace on a fixed number of workers: a heavy user queues a burst of jobs, while light
+users queue jobs at a steady rate. Reports the percentiles of the time each user's jobs waited in the queue.
+
+No database is needed, the scheduler is called the same way the queues call it when workers claim jobs.
+
+Example:
+```
+python benchmarks/fair_share.py --workers 8 --burst 500 --light-users 5
+```
+"""
+import datetime
+import heapq
+import random
+import statistics
+import uuid
+from collections import Counter, defaultdict
+
+import click
+
+from openeo_fastapi.client.queue import QueuedJob
+from openeo_fastapi.client.scheduler import FairShareScheduler
+
+START = datetime.datetime(2024, 1, 1)
+
+
+def _trace(
+    burst: int, light_users: int, light_rate: float, horizon: float, rng: random.Random
+) -> tuple[list[tuple[float, QueuedJob]], dict]:
+    """Generate the job arrivals, as the time in seconds and the queued job."""
+    users = {"heavy": uuid.uuid4()}
+    users.update({f"light-{i}": uuid.uuid4() for i in range(light_users)})
+
+    arrivals = []
+    for i in range(burst):
+        arrivals.append((i * 0.1, users["heavy"]))
+    for name, user_id in users.items():
+        if name == "heavy":
+            continue
+        time = rng.expovariate(light_rate)
+        while time < horizon:
+            arrivals.append((time, user_id))
+            time += rng.expovariate(light_rate)
+
+    trace = [
+        (
+            time,
+            QueuedJob(
+                job_id=uuid.uuid4(),
+                user_id=user_id,
+                enqueued_at=START + datetime.timedelta(seconds=time),
+            ),
+        )
+        for time, user_id in sorted(arrivals, key=lambda arrival: arrival[0])
+    ]
+    return trace, {user_id: name for name, user_id in users.items()}
+
+
+def _oldest_first(waiting, running, limit, now):
+    """Select the oldest jobs, as the queues do without a scheduler."""
+    return sorted(waiting, key=lambda job: job.enqueued_at)[:limit]
+
+
+def _simulate(trace, select, workers: int, mean_duration: float, seed: int) -> dict:
+    """Replay the trace and return the waits of the jobs per user."""
+    rng = random.Random(seed)
+    durations = {job.job_id: rng.expovariate(1 / mean_duration) for _, job in trace}
+
+    # Events are (time, kind, sequence, job), kind 0 for an arrival and 1 for a completion.
+    events = [(time, 0, sequence, job) for sequence, (time, job) in enumerate(trace)]
+    sequence = len(events)
+    heapq.heapify(events)
+    waiting = {}
+    running = Counter()
+    waits = defaultdict(list)
+
+    while events:
+        time, kind, _, job = heapq.heappop(events)
+        if kind == 0:
+            waiting[job.job_id] = job
+        else:
+            running[job.user_id] -= 1
+
+        # Dispatch once all the events at this time are handled.
+        if events and events[0][0] == time:
+            continue
+
+        free = workers - sum(running.values())
+        if free <= 0 or not waiting:
+            continue
+
+        now = START + datetime.timedelta(seconds=time)
+        for dispatched in select(list(waiting.values()), dict(running), free, now):
+            del waiting[dispatched.job_id]
+            running[dispatched.user_id] += 1
+            waits[dispatched.user_id].append(
+                (now - dispatched.enqueued_at).total_seconds()
+            )
+            heapq.heappush(
+                events, (time + durations[dispatched.job_id], 1, sequence, dispatched)
+            )
+            sequence += 1
+
+    return waits
+
+
+def _percentile(values: list[float], percentile: int) -> float:
+    """The percentile of the values."""
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[percentile - 1]
+
+
+@click.command()
+@click.option("--workers", default=8, type=int, help="The number of jobs run at once.")
+@click.option("--burst", default=500, type=int, help="The jobs the heavy user queues.")
+@click.option("--light-users", default=5, type=int, help="The number of light users.")
+@click.option(
+    "--light-rate",
+    default=0.01,
+    type=float,
+    help="The jobs per second of a light user.",
+)
+@click.option("--horizon", default=3600.0, type=float, help="The seconds of arrivals.")
+@click.option("--mean-duration", default=60.0, type=float, help="The mean job seconds.")
+@click.option("--max-running", default=None, type=int, help="The cap per user.")
+@click.option("--aging", default=0.001, type=float, help="The score gained per second.")
+@click.option("--seed", default=42, type=int, help="The seed of the trace.")
+def benchmark(
+    workers,
+    burst,
+    light_users,
+    light_rate,
+    horizon,
+    mean_duration,
+    max_running,
+    aging,
+    seed,
+):
+    """Compare the queue waits per user when dispatching oldest first and by fair share."""
+    trace, names = _trace(burst, light_users, light_rate, horizon, random.Random(seed))
+    scheduler = FairShareScheduler(max_running=max_running, aging=aging)
+
+    for label, select in [
+        ("oldest first", _oldest_first),
+        ("fair share", scheduler.select),
+    ]:
+        waits = _simulate(trace, select, workers, mean_duration, seed)
+
+        click.echo(f"== {label}")
+        click.echo(f"{'user':<10}{'jobs':>6}{'p50 s':>10}{'p90 s':>10}{'p99 s':>10}")
+        for user_id, name in names.items():
+            user_waits = waits[user_id]
+            if not user_waits:
+                continue
+            click.echo(
+                f"{name:<10}{len(user_waits):>6}"
+                + "".join(f"{_percentile(user_waits, p):>10.0f}" for p in [50, 90, 99])
+            )
+        click.echo()
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -8,7 +8,8 @@ from starlette.responses import JSONResponse, RedirectResponse
 
 from openeo_fastapi.api import models
 from openeo_fastapi.api.types import Error
-from openeo_fastapi.client.auth import Authenticator
+from openeo_fastapi.client.auth import Authenticator, close_async_client
+from openeo_fastapi.client.psql.async_engine import close_async_engine
 
 HIDDEN_PATHS = ["/openapi.json", "/docs", "/docs/oauth2-redirect", "/redoc"]
 
@@ -357,13 +358,26 @@ class OpenEOApi:
         self.router.add_api_route(
             name="get_results",
             path=f"{self.client.settings.OPENEO_PREFIX}/jobs" + "/{job_id}/results",
-            response_model=models.Collection,
+            response_model=models.JobsGetResultsResponse,
             response_model_exclude_unset=False,
             response_model_exclude_none=True,
             methods=["GET"],
             endpoint=self.client.jobs.get_results,
         )
 
+    def register_get_result_asset(self):
+        """Register endpoint for downloading a result file of a batch job (GET /jobs/{job_id}/results/{asset})."""
+        self.router.add_api_route(
+            name="get_result_asset",
+            path=f"{self.client.settings.OPENEO_PREFIX}/jobs"
+            + "/{job_id}/results/{asset:path}",
+            response_model=None,
+            response_model_exclude_unset=False,
+            response_model_exclude_none=True,
+            methods=["GET"],
+            endpoint=self.client.jobs.get_result_asset,
+        )
+
     def register_start_job(self):
         """Register endpoint for starting batch job processing (GET /jobs/{job_id})."""
         self.router.add_api_route(
@@ -465,6 +479,7 @@ class OpenEOApi:
         self.register_get_estimate()
         self.register_get_logs()
         self.register_get_results()
+        self.register_get_result_asset()
         self.register_start_job()
         self.register_cancel_job()
         self.register_list_files()
@@ -473,6 +488,16 @@ class OpenEOApi:
         self.register_delete_file()
         self.register_well_known()
 
+    def register_lifespan_events(self):
+        """Register the startup and shutdown hooks for resources that live as long as the application."""
+        if self.client.collections:
+            self.app.add_event_handler("startup", self.client.collections.open_session)
+            self.app.add_event_handler(
+                "shutdown", self.client.collections.close_session
+            )
+        self.app.add_event_handler("shutdown", close_async_client)
+        self.app.add_event_handler("shutdown", close_async_engine)
+
     def http_exception_handler(self, request, exception):
         """
         Register exception handler to turn python exceptions into expected OpenEO error output.
@@ -542,6 +567,7 @@ class OpenEOApi:
         self.register_core()
         self.register_get_capabilities()
         self.app.include_router(router=self.router)
+        self.register_lifespan_events()
         self.app.add_exception_handler(HTTPException, self.http_exception_handler)
         # starlette.exceptions.HTTPException is not a subclass of fastapi.HTTPException.
         self.app.add_exception_handler(
@@ -13,7 +13,9 @@ from openeo_fastapi.api.types import (
     Extent,
     File,
     FileFormat,
+    Level,
     Link,
+    LogEntry,
     Process,
     RFC3339Datetime,
     StacProvider,
@@ -473,7 +475,40 @@ class JobsGetResponse(BaseModel):
 class JobsGetLogsResponse(BaseModel):
     """Reponse model for GET (/jobs/{job_id}/logs)."""
 
-    logs: list[Any]
+    level: Optional[Level] = None
+    logs: list[LogEntry]
+    links: list[Link]
+
+
+class JobsResultAsset(BaseModel):
+    """Model of a result file in the response of GET (/jobs/{job_id}/results)."""
+
+    href: str
+    type: Optional[str] = None
+    title: Optional[str] = None
+    roles: Optional[list[str]] = None
+    file_size: Optional[int] = Field(None, alias="file:size")
+    file_checksum: Optional[str] = Field(
+        None,
+        alias="file:checksum",
+        description="The multihash of the file, as defined by the STAC file extension.",
+    )
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class JobsGetResultsResponse(BaseModel):
+    """Reponse model for GET (/jobs/{job_id}/results), a STAC Item listing the result files."""
+
+    stac_version: str
+    stac_extensions: Optional[list[str]] = None
+    type: str = "Feature"
+    id: str
+    geometry: Optional[dict[str, Any]] = None
+    bbox: Optional[list[float]] = None
+    properties: dict[str, Any]
+    assets: dict[str, JobsResultAsset]
     links: list[Link]
 
 
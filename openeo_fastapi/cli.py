@@ -7,6 +7,7 @@ from alembic import command
 from alembic.config import Config
 
 from openeo_fastapi.templates import (
+    REVISION_SCRIPT_IMPORTS,
     get_app_template,
     get_models_template,
     get_revision_template,
@@ -54,6 +55,17 @@ def new(path):
 
     command.init(alembic_cfg, directory=alembic_dir)
 
+    script_template = alembic_dir / "script.py.mako"
+    with fs.open(script_template, "r") as f:
+        script = f.read()
+    with fs.open(script_template, "w") as f:
+        f.write(
+            script.replace(
+                "import sqlalchemy as sa\n",
+                "import sqlalchemy as sa\n" + REVISION_SCRIPT_IMPORTS,
+            )
+        )
+
     fs.touch(init_file)
 
     fs.touch(app_file)
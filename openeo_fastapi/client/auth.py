@@ -3,24 +3,38 @@
 Classes:
     - User: Framework for defining and extending the logic for working with BatchJobs.
     - Authenticator: Class holding the abstract validation method used for authentication for API endpoints.
+    - AsyncAuthenticator: Class holding the async validation method, a drop in replacement for the Authenticator.
     - AuthMethod: Enum defining the available auth methods.
     - AuthToken: Pydantic model for breaking and validating an OpenEO Token into it's consituent parts.
+    - IssuerCache: Process wide cache for the configuration and JWKS of token Issuers.
+    - TokenCache: Process wide cache of validated tokens and the Users they resolved to.
+    - UserCache: Process wide cache of the Users by their OIDC subject.
     - IssuerHandler: Class for handling the AuthToken and validating against the revelant token Issuer and AuthMethod.
+    - AsyncIssuerHandler: IssuerHandler making its requests to the Issuer without blocking the event loop.
 """
+import asyncio
 import datetime
+import hashlib
+import re
+import threading
+import time
 import uuid
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from enum import Enum
-from typing import List
+from typing import Any, Awaitable, Callable, Hashable, List, Optional
 
+import httpx
 import requests
 from fastapi import Header, HTTPException
 from jose import jwt
 from jose.exceptions import JWTError
-from pydantic import BaseModel, ValidationError, validator
+from pydantic import BaseModel, ValidationError, root_validator, validator
 
 from openeo_fastapi.api.types import Error
-from openeo_fastapi.client.psql.engine import Filter, create, get_first_or_default
+from openeo_fastapi.client.policies import PolicyMatcher, compile_policies
+from openeo_fastapi.client.psql import async_engine
+from openeo_fastapi.client.psql.engine import get_or_create
 from openeo_fastapi.client.psql.models import UserORM
 from openeo_fastapi.client.settings import AppSettings
 
@@ -28,6 +42,7 @@ ALGORITHMS = ["RS256"]
 OIDC_WELLKNOWN_CONFIG_PATH = "/.well-known/openid-configuration"
 OIDC_USERINFO = "userinfo_endpoint"
 OIDC_JWKS = "jwks_uri"
+CACHE_CONTROL_MAX_AGE = re.compile(r"max-age=(\d+)")
 
 
 class User(BaseModel):
@@ -68,36 +83,141 @@ class Authenticator(ABC):
         Returns:
             User: The authenticated user.
         """
-        if not authorization:
-            raise HTTPException(
-                status_code=401,
-                detail=Error(
-                    code="TokenInvalid",
-                    message="No authorization header provided.",
-                ),
-            )
+        _require_authorization(authorization)
+
+        cached_user = TOKEN_CACHE.get(authorization)
+        if cached_user:
+            return cached_user
 
         settings = AppSettings()
+        TOKEN_CACHE.max_entries = settings.OIDC_TOKEN_CACHE_MAX_ENTRIES
 
-        policies = None
-        if settings.OIDC_POLICIES:
-            policies = settings.OIDC_POLICIES
-        issuer = IssuerHandler(issuer_uri=settings.OIDC_URL, policies=policies)
+        issuer = _issuer_handler(settings, IssuerHandler)
 
         user_info = issuer.validate_token(authorization)
 
-        found_user = get_first_or_default(
-            User, Filter(column_name="oidc_sub", value=user_info["sub"])
+        user = _get_or_create_user(user_info)
+        TOKEN_CACHE.set(authorization, user, ttl=settings.OIDC_TOKEN_CACHE_TTL)
+        return user
+
+
+class AsyncAuthenticator(ABC):
+    """Basic class to hold the async validation call, which can replace Authenticator.validate on the api.
+
+    Example:
+    ```
+    api.override_authentication(AsyncAuthenticator.validate)
+    ```
+    """
+
+    @abstractmethod
+    async def validate(authorization: str = Header(default=None)):
+        """Validate the authorisation header and create a new user, without blocking the event loop.
+
+        Args:
+            authorization (str): The authorisation header content from the request headers.
+
+        Returns:
+            User: The authenticated user.
+        """
+        _require_authorization(authorization)
+
+        cached_user = TOKEN_CACHE.get(authorization)
+        if cached_user:
+            return cached_user
+
+        settings = AppSettings()
+        TOKEN_CACHE.max_entries = settings.OIDC_TOKEN_CACHE_MAX_ENTRIES
+
+        issuer = _issuer_handler(settings, AsyncIssuerHandler)
+
+        user_info = await issuer.validate_token(authorization)
+
+        user = await _get_or_create_user_async(user_info)
+        TOKEN_CACHE.set(authorization, user, ttl=settings.OIDC_TOKEN_CACHE_TTL)
+        return user
+
+
+def _require_authorization(authorization: Optional[str]):
+    """Raise if no authorization header was provided."""
+    if not authorization:
+        raise HTTPException(
+            status_code=401,
+            detail=Error(
+                code="TokenInvalid",
+                message="No authorization header provided.",
+            ),
         )
 
-        if found_user:
-            return found_user
 
-        user = User(user_id=uuid.uuid4(), oidc_sub=user_info["sub"])
+def _issuer_handler(settings: AppSettings, handler: type):
+    """Create the IssuerHandler for the OIDC provider in the settings.
+
+    Args:
+        settings (AppSettings): The AppSettings that the application will use.
+        handler (type): The IssuerHandler class to create.
+
+    Returns:
+        IssuerHandler: The issuer handler.
+    """
+    policies = None
+    if settings.OIDC_POLICIES:
+        policies = settings.OIDC_POLICIES
+    return handler(
+        issuer_uri=settings.OIDC_URL,
+        policies=policies,
+        cache_ttl=settings.OIDC_CACHE_TTL,
+        jwks_refresh_interval=settings.OIDC_JWKS_REFRESH_INTERVAL,
+        userinfo_from_token=settings.OIDC_USERINFO_FROM_TOKEN,
+        audience=settings.OIDC_AUDIENCE,
+    )
+
+
+def _get_or_create_user(user_info: dict) -> User:
+    """Get the user for the validated user info, creating the user if they are new.
+
+    Args:
+        user_info (dict): The user info of the validated token.
+
+    Returns:
+        User: The user.
+    """
+    sub = user_info["sub"]
 
-        create(create_object=user)
+    user = USER_CACHE.get(sub)
+    if user:
         return user
 
+    user = get_or_create(
+        create_object=User(user_id=uuid.uuid4(), oidc_sub=sub),
+        unique_column="oidc_sub",
+    )
+    USER_CACHE.set(sub, user, max_entries=AppSettings().OIDC_USER_CACHE_MAX_ENTRIES)
+    return user
+
+
+async def _get_or_create_user_async(user_info: dict) -> User:
+    """Get the user for the validated user info with the async engine, creating the user if they are new.
+
+    Args:
+        user_info (dict): The user info of the validated token.
+
+    Returns:
+        User: The user.
+    """
+    sub = user_info["sub"]
+
+    user = USER_CACHE.get(sub)
+    if user:
+        return user
+
+    user = await async_engine.get_or_create(
+        create_object=User(user_id=uuid.uuid4(), oidc_sub=sub),
+        unique_column="oidc_sub",
+    )
+    USER_CACHE.set(sub, user, max_entries=AppSettings().OIDC_USER_CACHE_MAX_ENTRIES)
+    return user
+
 
 class AuthMethod(Enum):
     """Enum defining known auth methods."""
@@ -136,11 +256,338 @@ class AuthToken(BaseModel):
         return cls(**dict(zip(["method", "provider", "token"], token.split("/"))))
 
 
+def cache_ttl_from_response(response: requests.Response, default: float) -> float:
+    """Get the seconds a response may be cached for from its Cache-Control header.
+
+    Args:
+        response (Response): The response from the issuer.
+        default (float): The ttl to use when the response does not specify one.
+
+    Returns:
+        float: The seconds the response may be cached for, 0 if it must not be cached.
+    """
+    cache_control = response.headers.get("Cache-Control", "").lower()
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return 0.0
+    max_age = CACHE_CONTROL_MAX_AGE.search(cache_control)
+    if max_age:
+        return float(max_age.group(1))
+    return default
+
+
+class IssuerCache:
+    """Process wide cache for the configuration and JWKS of token Issuers.
+
+    Each key is fetched by one thread at a time, other threads requesting the same key wait for that fetch. A key is
+    refetched at most once per min_interval, even if it expired or was not allowed to be cached.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the IssuerCache."""
+        self._entries: dict[Hashable, tuple[Any, float, float]] = {}
+        self._locks: dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _key_lock(self, key: Hashable) -> threading.Lock:
+        """Get the lock guarding the fetch of a key."""
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def get(
+        self, key: Hashable, force: bool = False, min_interval: float = 0.0
+    ) -> Optional[Any]:
+        """Get the cached value for the key if it is still valid.
+
+        Args:
+            key (Hashable): The key of the value.
+            force (bool): Treat the value as expired, unless it was fetched less than min_interval seconds ago.
+            min_interval (float): The minimum seconds between refetches of the key, the value is returned even if it
+                expired before.
+
+        Returns:
+            The cached value, or None if it needs to be fetched.
+        """
+        entry = self._entries.get(key)
+        if entry:
+            value, fetched_at, expires_at = entry
+            now = time.monotonic()
+            if now - fetched_at < min_interval:
+                return value
+            if not force and now < expires_at:
+                return value
+        return None
+
+    def put(self, key: Hashable, value: Any, ttl: float):
+        """Store the value for the key.
+
+        Args:
+            key (Hashable): The key of the value.
+            value (Any): The value to store.
+            ttl (float): The seconds the value may be cached for. A value with a ttl of 0 is expired right away, and
+                only kept to limit the refetches to one per min_interval.
+        """
+        now = time.monotonic()
+        self._entries[key] = (value, now, now + max(ttl, 0))
+
+    def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], tuple[Any, float]],
+        force: bool = False,
+        min_interval: float = 0.0,
+    ) -> Any:
+        """Get the cached value for the key, fetching it if it is missing or expired.
+
+        Args:
+            key (Hashable): The key of the value.
+            fetch (Callable): Callable returning the value and the seconds it may be cached for.
+            force (bool): Refetch the value even if it has not expired.
+            min_interval (float): The minimum seconds between refetches of the key, forced or not.
+
+        Returns:
+            The cached or fetched value.
+        """
+        with self._key_lock(key):
+            value = self.get(key, force=force, min_interval=min_interval)
+            if value is not None:
+                return value
+
+            value, ttl = fetch()
+            self.put(key, value, ttl)
+            return value
+
+    async def get_or_fetch_async(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[tuple[Any, float]]],
+        force: bool = False,
+        min_interval: float = 0.0,
+    ) -> Any:
+        """Get the cached value for the key, fetching it with an async callable if it is missing or expired.
+
+        Unlike get_or_fetch, concurrent fetches of the same key are not coalesced, as a thread lock would block the
+        event loop.
+
+        Args:
+            key (Hashable): The key of the value.
+            fetch (Callable): Async callable returning the value and the seconds it may be cached for.
+            force (bool): Refetch the value even if it has not expired.
+            min_interval (float): The minimum seconds between refetches of the key, forced or not.
+
+        Returns:
+            The cached or fetched value.
+        """
+        value = self.get(key, force=force, min_interval=min_interval)
+        if value is not None:
+            return value
+
+        value, ttl = await fetch()
+        self.put(key, value, ttl)
+        return value
+
+    def clear(self):
+        """Remove all cached values."""
+        with self._lock:
+            self._entries.clear()
+
+
+ISSUER_CACHE = IssuerCache()
+
+
+def token_expiry(authorization: str) -> Optional[float]:
+    """Get the expiry of the token in the authorization header, without verifying the token.
+
+    Only use this for tokens which have already been verified.
+
+    Args:
+        authorization (str): The authorisation header content from the request headers.
+
+    Returns:
+        float: The exp claim of the token as a unix timestamp, or None if the token has no exp claim.
+    """
+    try:
+        claims = jwt.get_unverified_claims(AuthToken.from_token(authorization).token)
+        return float(claims["exp"])
+    except (JWTError, ValidationError, KeyError, TypeError, ValueError):
+        return None
+
+
+class TokenCache:
+    """Process wide cache of validated tokens and the Users they resolved to.
+
+    Tokens are stored by their sha256 hash and are never kept beyond their exp claim. Tokens without an exp claim
+    are not cached. The invalidate methods can be used to drop entries, e.g. when a user is blocked.
+    """
+
+    def __init__(self, max_entries: int = 10000) -> None:
+        """Initialize the TokenCache.
+
+        Args:
+            max_entries (int): The number of tokens kept before the least recently used is forgotten.
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(authorization: str) -> str:
+        """Hash the authorization header so tokens are not held in memory."""
+        return hashlib.sha256(authorization.encode("utf-8")).hexdigest()
+
+    def get(self, authorization: str) -> Optional[Any]:
+        """Get the User a token was validated for.
+
+        Args:
+            authorization (str): The authorisation header content from the request headers.
+
+        Returns:
+            User: The cached User, or None if the token is not cached or has expired.
+        """
+        key = self._key(authorization)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            user, expires_at = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return user
+
+    def set(self, authorization: str, user: Any, ttl: float):
+        """Remember the User a token was validated for.
+
+        Args:
+            authorization (str): The authorisation header content from the request headers.
+            user (User): The User the token was validated for.
+            ttl (float): The maximum seconds to remember the token for.
+        """
+        exp = token_expiry(authorization)
+        if ttl <= 0 or exp is None:
+            return
+
+        expires_at = min(time.time() + ttl, exp)
+        if expires_at <= time.time():
+            return
+
+        key = self._key(authorization)
+        with self._lock:
+            self._entries[key] = (user, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, authorization: str):
+        """Forget a token.
+
+        Args:
+            authorization (str): The authorisation header content from the request headers.
+        """
+        with self._lock:
+            self._entries.pop(self._key(authorization), None)
+
+    def invalidate_user(self, user_id: uuid.UUID):
+        """Forget all tokens that resolved to a user.
+
+        Args:
+            user_id (uuid.UUID): The id of the user.
+        """
+        with self._lock:
+            for key in [
+                key
+                for key, (user, _) in self._entries.items()
+                if user.user_id == user_id
+            ]:
+                del self._entries[key]
+
+    def clear(self):
+        """Forget all tokens."""
+        with self._lock:
+            self._entries.clear()
+
+
+TOKEN_CACHE = TokenCache()
+
+
+class UserCache:
+    """Process wide cache of the Users by their OIDC subject.
+
+    The user_id of a subject never changes once stored, so entries do not expire. The least recently used entries
+    are forgotten beyond max_entries, and invalidate can be used to drop a user, e.g. when it is deleted.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the UserCache."""
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, sub: str) -> Optional[Any]:
+        """Get the User for an OIDC subject.
+
+        Args:
+            sub (str): The OIDC subject.
+
+        Returns:
+            User: The cached User, or None if the subject is not cached.
+        """
+        with self._lock:
+            user = self._entries.get(sub)
+            if user is not None:
+                self._entries.move_to_end(sub)
+            return user
+
+    def set(self, sub: str, user: Any, max_entries: int = 10000):
+        """Remember the User for an OIDC subject.
+
+        Args:
+            sub (str): The OIDC subject.
+            user (User): The User stored for the subject.
+            max_entries (int): The number of users kept before the least recently used is forgotten.
+        """
+        if max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[sub] = user
+            self._entries.move_to_end(sub)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, sub: str):
+        """Forget the User for an OIDC subject.
+
+        Args:
+            sub (str): The OIDC subject.
+        """
+        with self._lock:
+            self._entries.pop(sub, None)
+
+    def clear(self):
+        """Forget all users."""
+        with self._lock:
+            self._entries.clear()
+
+
+USER_CACHE = UserCache()
+
+
 class IssuerHandler(BaseModel):
     """General token handler for querying provided tokens against issuers."""
 
     issuer_uri: str
     policies: list[str] = None
+    cache_ttl: float = 300.0
+    jwks_refresh_interval: float = 30.0
+    userinfo_from_token: bool = False
+    audience: Optional[str] = None
+    policy_matcher: Optional[PolicyMatcher] = None
+
+    class Config:
+        """Pydantic model class config."""
+
+        arbitrary_types_allowed = True
+        validate_assignment = True
 
     @validator("issuer_uri", pre=True)
     def remove_trailing_slash(cls, v, values, **kwargs):
@@ -148,6 +595,15 @@ class IssuerHandler(BaseModel):
             return v.removesuffix("/")
         return v
 
+    @root_validator(skip_on_failure=True)
+    def compile_policy_matcher(cls, values):
+        """Compile the policies when the handler is built or its policies are replaced, not on every request."""
+        policies = values.get("policies")
+        values["policy_matcher"] = (
+            compile_policies(tuple(policies)) if policies else None
+        )
+        return values
+
     def _get_issuer_config(self):
         """Get the well known config of the issuer url.
 
@@ -178,14 +634,207 @@ class IssuerHandler(BaseModel):
         """Get the jwks uri from the issuer config.
 
         Args:
-            issuer_config (dict): The url of the user info endpoint to request.
+            issuer_config (dict): The issuer config containing the jwks uri.
 
         Returns:
             Direct response object from the request.
         """
-        jwks_uri = issuer_config.json()[OIDC_JWKS]
+        jwks_uri = issuer_config[OIDC_JWKS]
         return requests.get(jwks_uri)
 
+    def _issuer_config_from_response(self, resp) -> tuple[dict, float]:
+        """Check the response for the issuer config.
+
+        Args:
+            resp (Response): The response from the well known config of the issuer.
+
+        Raises:
+            HTTPException: Raises an exception with relevant status code and descriptive message of failure.
+
+        Returns:
+            tuple[dict, float]: The issuer config and the seconds it may be cached for.
+        """
+        if resp.status_code != 200:
+            raise HTTPException(
+                status_code=500,
+                detail=Error(
+                    code="InvalidIssuerConfig",
+                    message="The issuer config is not available. Tokens cannot be validated currently. Try again later.",
+                ),
+            )
+        return resp.json(), cache_ttl_from_response(resp, self.cache_ttl)
+
+    def _jwks_from_response(self, resp) -> tuple[list, float]:
+        """Check the response for the jwks.
+
+        Args:
+            resp (Response): The response from the jwks uri of the issuer.
+
+        Raises:
+            HTTPException: Raises an exception with relevant status code and descriptive message of failure.
+
+        Returns:
+            tuple[list, float]: The keys of the issuer and the seconds they may be cached for.
+        """
+        if resp.status_code != 200:
+            raise HTTPException(
+                status_code=500,
+                detail=Error(
+                    code="InvalidIssuerConfig",
+                    message=f"Key: jwks_uri is not available at the oidc config {OIDC_WELLKNOWN_CONFIG_PATH} location.",
+                ),
+            )
+        return resp.json()["keys"], cache_ttl_from_response(resp, self.cache_ttl)
+
+    def _userinfo_from_response(self, resp) -> dict:
+        """Check the response for the user info.
+
+        Args:
+            resp (Response): The response from the user info endpoint of the issuer.
+
+        Raises:
+            HTTPException: Raises an exception with relevant status code and descriptive message of failure.
+
+        Returns:
+            dict: The user info.
+        """
+        if resp.status_code != 200:
+            raise HTTPException(
+                status_code=500,
+                detail=Error(
+                    code="InvalidIssuerConfig",
+                    message=f"Key: {OIDC_USERINFO} is not available at the oidc config {OIDC_WELLKNOWN_CONFIG_PATH} location.",
+                ),
+            )
+        return resp.json()
+
+    def _userinfo_from_token(self, payload: Any) -> Optional[dict]:
+        """Use the verified token payload as the user info, if it holds the claims needed to authorize the user.
+
+        Args:
+            payload (Any): The verified payload of the token.
+
+        Returns:
+            dict: The payload, or None if the user info needs to be requested from the issuer.
+        """
+        if not self.userinfo_from_token or not isinstance(payload, dict):
+            return None
+        if "sub" not in payload:
+            return None
+        if self.policy_matcher:
+            if not self.policy_matcher.has_claims(payload):
+                return None
+        return payload
+
+    def _apply_policies(self, userinfo: dict) -> dict:
+        """Only admit users who match one of the policies, if policies have been set for this provider.
+
+        Args:
+            userinfo (dict): The user info from the issuer.
+
+        Raises:
+            HTTPException: Raises an exception with relevant status code and descriptive message of failure.
+
+        Returns:
+            dict: The user info.
+        """
+        if self.policy_matcher:
+            if self.policy_matcher.matches(userinfo):
+                return userinfo
+
+            raise HTTPException(
+                status_code=401,
+                detail=Error(
+                    code="TokenInvalid",
+                    message=f"No existing access policy applies to user. Contact backend provider.",
+                ),
+            )
+
+        return userinfo
+
+    def _parse_token(self, token: str) -> AuthToken:
+        """Parse the OpenEO token, only OIDC tokens can be validated.
+
+        Args:
+            token (str): The OpenEO token to be parsed.
+
+        Raises:
+            HTTPException: Raises an exception with relevant status code and descriptive message of failure.
+
+        Returns:
+            AuthToken: The parsed token.
+        """
+        if not token:
+            raise HTTPException(
+                status_code=401,
+                detail=Error(
+                    code="TokenInvalid", message="No authorization token provided."
+                ),
+            )
+
+        try:
+            parsed_token = AuthToken.from_token(token)
+        except ValidationError:
+            raise HTTPException(
+                status_code=401,
+                detail=Error(
+                    code="TokenInvalid", message=f"The provided token is not valid."
+                ),
+            )
+
+        if parsed_token.method.value == AuthMethod.OIDC.value:
+            return parsed_token
+
+        raise HTTPException(
+            status_code=401,
+            detail=Error(
+                code="TokenCantBeValidated",
+                message=f"The provided token cannot be validated.",
+            ),
+        )
+
+    def _get_cached_issuer_config(self) -> dict:
+        """Get the well known config of the issuer url from the ISSUER_CACHE.
+
+        Raises:
+            HTTPException: Raises an exception with relevant status code and descriptive message of failure.
+
+        Returns:
+            dict: The issuer config.
+        """
+
+        def fetch():
+            return self._issuer_config_from_response(self._get_issuer_config())
+
+        return ISSUER_CACHE.get_or_fetch(
+            ("config", self.issuer_uri), fetch, min_interval=self.jwks_refresh_interval
+        )
+
+    def _get_cached_oidc_jwks(self, issuer_config: dict, force: bool = False) -> list:
+        """Get the jwks of the issuer from the ISSUER_CACHE.
+
+        Args:
+            issuer_config (dict): The issuer config containing the jwks uri.
+            force (bool): Refetch the jwks, e.g. when the issuer rotated its keys. Refetches are limited to one per
+                jwks_refresh_interval.
+
+        Raises:
+            HTTPException: Raises an exception with relevant status code and descriptive message of failure.
+
+        Returns:
+            list: The keys of the issuer.
+        """
+
+        def fetch():
+            return self._jwks_from_response(self._get_oidc_jwks(issuer_config))
+
+        return ISSUER_CACHE.get_or_fetch(
+            ("jwks", issuer_config.get(OIDC_JWKS)),
+            fetch,
+            force=force,
+            min_interval=self.jwks_refresh_interval,
+        )
+
     def _validate_token(self, token, jwks):
         """Ensure the token is valid by verifying the token using the jwts of the issuer.
 
@@ -218,7 +867,8 @@ class IssuerHandler(BaseModel):
                 rsa_key,
                 algorithms=ALGORITHMS,
                 issuer=self.issuer_uri,
-                options={"verify_aud": False},
+                audience=self.audience,
+                options={"verify_aud": bool(self.audience)},
             )
             return payload
 
@@ -235,32 +885,19 @@ class IssuerHandler(BaseModel):
             JSON from the response object from the request.
         """
 
-        issuer_oidc_config = self._get_issuer_config()
-
-        if issuer_oidc_config.status_code != 200:
-            raise HTTPException(
-                status_code=500,
-                detail=Error(
-                    code="InvalidIssuerConfig",
-                    message="The issuer config is not available. Tokens cannot be validated currently. Try again later.",
-                ),
-            )
+        issuer_oidc_config = self._get_cached_issuer_config()
 
-        jwks_resp = self._get_oidc_jwks(issuer_oidc_config)
-
-        if issuer_oidc_config.status_code != 200:
-            raise HTTPException(
-                status_code=500,
-                detail=Error(
-                    code="InvalidIssuerConfig",
-                    message=f"Key: jwks_uri is not available at the oidc config {OIDC_WELLKNOWN_CONFIG_PATH} location.",
-                ),
-            )
-
-        jwks = jwks_resp.json()["keys"]
+        jwks = self._get_cached_oidc_jwks(issuer_oidc_config)
 
         try:
             token_valid = self._validate_token(token, jwks)
+            if not token_valid:
+                # The token may be signed with a key the issuer rotated in since the jwks where cached.
+                refreshed_jwks = self._get_cached_oidc_jwks(
+                    issuer_oidc_config, force=True
+                )
+                if refreshed_jwks is not jwks:
+                    token_valid = self._validate_token(token, refreshed_jwks)
         except JWTError:
             raise HTTPException(
                 status_code=401,
@@ -271,38 +908,15 @@ class IssuerHandler(BaseModel):
 
         if token_valid:
             # We can see if the user can be authenticated.
-            userinfo_uri = issuer_oidc_config.json()[OIDC_USERINFO]
-
-            resp = self._get_user_info(userinfo_uri, token)
-            if resp.status_code != 200:
-                raise HTTPException(
-                    status_code=500,
-                    detail=Error(
-                        code="InvalidIssuerConfig",
-                        message=f"Key: {OIDC_USERINFO} is not available at the oidc config {OIDC_WELLKNOWN_CONFIG_PATH} location.",
-                    ),
-                )
-
-            userinfo = resp.json()
-
-            # If policies have been set for this provider, only allow users who match.
-            if self.policies:
-                for policy in self.policies:
-                    key, value = policy.split(",")
+            userinfo = self._userinfo_from_token(token_valid)
+            if userinfo is None:
+                userinfo_uri = issuer_oidc_config[OIDC_USERINFO]
 
-                    for info in userinfo[key]:
-                        if info == value:
-                            return userinfo
-
-                raise HTTPException(
-                    status_code=401,
-                    detail=Error(
-                        code="TokenInvalid",
-                        message=f"No existing access policy applies to user. Contact backend provider.",
-                    ),
+                userinfo = self._userinfo_from_response(
+                    self._get_user_info(userinfo_uri, token)
                 )
 
-            return userinfo
+            return self._apply_policies(userinfo)
 
         raise HTTPException(
             status_code=401,
@@ -323,17 +937,168 @@ class IssuerHandler(BaseModel):
         Returns:
             The JSON as dictionary from _validate_oidc_token.
         """
-        if not token:
-            raise HTTPException(
-                status_code=401,
-                detail=Error(
-                    code="TokenInvalid", message="No authorization token provided."
-                ),
-            )
+        parsed_token = self._parse_token(token)
+        return self._authenticate_oidc_user(parsed_token.token)
+
+
+_async_client: Optional[httpx.AsyncClient] = None
+_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Get the shared, pooled httpx.AsyncClient used for requests to the Issuer.
+
+    The client is created on first use for the running event loop, using the OIDC_HTTP_* AppSettings.
+
+    Returns:
+        httpx.AsyncClient: The shared client.
+    """
+    global _async_client, _async_client_loop
+
+    loop = asyncio.get_running_loop()
+    if (
+        _async_client is None
+        or _async_client.is_closed
+        or _async_client_loop is not loop
+    ):
+        settings = AppSettings()
+        _async_client = httpx.AsyncClient(
+            timeout=settings.OIDC_HTTP_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=settings.OIDC_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.OIDC_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+        _async_client_loop = loop
+    return _async_client
+
+
+async def close_async_client():
+    """Close the shared httpx.AsyncClient. Intended to be called from the application shutdown hook."""
+    global _async_client, _async_client_loop
+
+    if (
+        _async_client is not None
+        and not _async_client.is_closed
+        and _async_client_loop is asyncio.get_running_loop()
+    ):
+        await _async_client.aclose()
+    _async_client = None
+    _async_client_loop = None
+
+
+class AsyncIssuerHandler(IssuerHandler):
+    """IssuerHandler making its requests to the Issuer with the shared httpx.AsyncClient."""
+
+    async def _get_issuer_config(self):
+        """Get the well known config of the issuer url.
+
+        Returns:
+            Direct response object from the request.
+        """
+        return await get_async_client().get(
+            self.issuer_uri + OIDC_WELLKNOWN_CONFIG_PATH
+        )
+
+    async def _get_user_info(self, info_endpoint, token):
+        """Get the user info from  known config of the issuer url.
+
+        Args:
+            info_endpoint (str): The url of the user info endpoint to request.
+            token (str): The token to be used as the bearer token in the authorization header.
+
+        Returns:
+            Direct response object from the request.
+        """
+        return await get_async_client().get(
+            info_endpoint,
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {token}",
+            },
+        )
+
+    async def _get_oidc_jwks(self, issuer_config):
+        """Get the jwks uri from the issuer config.
+
+        Args:
+            issuer_config (dict): The issuer config containing the jwks uri.
+
+        Returns:
+            Direct response object from the request.
+        """
+        return await get_async_client().get(issuer_config[OIDC_JWKS])
+
+    async def _get_cached_issuer_config(self) -> dict:
+        """Get the well known config of the issuer url from the ISSUER_CACHE.
+
+        Raises:
+            HTTPException: Raises an exception with relevant status code and descriptive message of failure.
+
+        Returns:
+            dict: The issuer config.
+        """
+
+        async def fetch():
+            return self._issuer_config_from_response(await self._get_issuer_config())
+
+        return await ISSUER_CACHE.get_or_fetch_async(
+            ("config", self.issuer_uri), fetch, min_interval=self.jwks_refresh_interval
+        )
+
+    async def _get_cached_oidc_jwks(
+        self, issuer_config: dict, force: bool = False
+    ) -> list:
+        """Get the jwks of the issuer from the ISSUER_CACHE.
+
+        Args:
+            issuer_config (dict): The issuer config containing the jwks uri.
+            force (bool): Refetch the jwks, e.g. when the issuer rotated its keys. Refetches are limited to one per
+                jwks_refresh_interval.
+
+        Raises:
+            HTTPException: Raises an exception with relevant status code and descriptive message of failure.
+
+        Returns:
+            list: The keys of the issuer.
+        """
+
+        async def fetch():
+            return self._jwks_from_response(await self._get_oidc_jwks(issuer_config))
+
+        return await ISSUER_CACHE.get_or_fetch_async(
+            ("jwks", issuer_config.get(OIDC_JWKS)),
+            fetch,
+            force=force,
+            min_interval=self.jwks_refresh_interval,
+        )
+
+    async def _authenticate_oidc_user(self, token: str):
+        """Validate the provided oidc token against the oidc provider.
+
+        Args:
+            token (str): The token to be used as the bearer token in the authorization header.
+
+        Raises:
+            HTTPException: Raises an exception with relevant status code and descriptive message of failure.
+
+        Returns:
+            JSON from the response object from the request.
+        """
+        issuer_oidc_config = await self._get_cached_issuer_config()
+
+        jwks = await self._get_cached_oidc_jwks(issuer_oidc_config)
 
         try:
-            parsed_token = AuthToken.from_token(token)
-        except ValidationError:
+            token_valid = self._validate_token(token, jwks)
+            if not token_valid:
+                # The token may be signed with a key the issuer rotated in since the jwks where cached.
+                refreshed_jwks = await self._get_cached_oidc_jwks(
+                    issuer_oidc_config, force=True
+                )
+                if refreshed_jwks is not jwks:
+                    token_valid = self._validate_token(token, refreshed_jwks)
+        except JWTError:
             raise HTTPException(
                 status_code=401,
                 detail=Error(
@@ -341,13 +1106,35 @@ class IssuerHandler(BaseModel):
                 ),
             )
 
-        if parsed_token.method.value == AuthMethod.OIDC.value:
-            return self._authenticate_oidc_user(parsed_token.token)
+        if token_valid:
+            userinfo = self._userinfo_from_token(token_valid)
+            if userinfo is None:
+                userinfo_uri = issuer_oidc_config[OIDC_USERINFO]
+
+                userinfo = self._userinfo_from_response(
+                    await self._get_user_info(userinfo_uri, token)
+                )
+
+            return self._apply_policies(userinfo)
 
         raise HTTPException(
             status_code=401,
             detail=Error(
-                code="TokenCantBeValidated",
-                message=f"The provided token cannot be validated.",
+                code="TokenInvalid", message=f"The provided token is not valid."
             ),
         )
+
+    async def validate_token(self, token: str):
+        """Try to validate the token against the give OIDC provider.
+
+        Args:
+            token (str): The OpenEO token to be parsed and validated against the oidc provider.
+
+        Raises:
+            HTTPException: Raises an exception with relevant status code and descriptive message of failure.
+
+        Returns:
+            The JSON as dictionary from _validate_oidc_token.
+        """
+        parsed_token = self._parse_token(token)
+        return await self._authenticate_oidc_user(parsed_token.token)
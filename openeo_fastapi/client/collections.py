@@ -1,18 +1,40 @@
 """Class and model to define the framework and partial application logic for interacting with Collections.
 
 Classes:
+    - CacheEntry: A value held in a CollectionCache and the time it was fetched.
+    - CacheStats: Counters describing the effectiveness of a CollectionCache.
+    - CollectionCache: Framework for caching proxied collection metadata with stale-while-revalidate.
+    - InMemoryCollectionCache: The default in-process LRU CollectionCache.
+    - SerializedResponse: A response body serialized and compressed once, to be served many times.
     - CollectionRegister: Framework for defining and extending the logic for working with Collections.
 """
+import asyncio
+import gzip
+import hashlib
+import json
 import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, Optional
 
 import aiohttp
-from fastapi import HTTPException
+from attrs import define, field
+from fastapi import HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
+from starlette.background import BackgroundTask
 
 from openeo_fastapi.api.models import Collection, Collections
 from openeo_fastapi.api.types import Endpoint, Error
 from openeo_fastapi.client.register import EndpointRegister
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 logger = logging.getLogger(__name__)
 
 COLLECTIONS_ENDPOINTS = [
@@ -35,18 +57,371 @@ COLLECTIONS_ENDPOINTS = [
 ]
 
 
+async def rewrite_stream(
+    chunks: AsyncIterator[bytes], old: bytes, new: bytes
+) -> AsyncIterator[bytes]:
+    """Replace all occurrences of old with new in a stream of bytes, including those split across chunks.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The stream to rewrite.
+        old (bytes): The bytes to replace.
+        new (bytes): The replacement bytes.
+
+    Yields:
+        bytes: The rewritten stream, only holding back enough bytes to detect a split occurrence.
+    """
+    keep = len(old) - 1
+    buffer = b""
+
+    async for chunk in chunks:
+        buffer += chunk
+
+        parts = []
+        start = 0
+        while (index := buffer.find(old, start)) != -1:
+            parts.append(buffer[start:index])
+            parts.append(new)
+            start = index + len(old)
+
+        safe = max(start, len(buffer) - keep)
+        parts.append(buffer[start:safe])
+        buffer = buffer[safe:]
+
+        out = b"".join(parts)
+        if out:
+            yield out
+
+    if buffer:
+        yield buffer
+
+
+@define
+class CacheEntry:
+    """A value held in a CollectionCache and the time it was fetched."""
+
+    value: Any
+    fetched_at: float = field(factory=time.monotonic)
+
+    def age(self) -> float:
+        """The seconds since the value was fetched."""
+        return time.monotonic() - self.fetched_at
+
+
+@define
+class CacheStats:
+    """Counters describing the effectiveness of a CollectionCache."""
+
+    hits: int = 0
+    """Requests served from a fresh entry."""
+    stale_hits: int = 0
+    """Requests served from a stale entry while it was refreshed in the background."""
+    misses: int = 0
+    """Requests that had to wait for the upstream."""
+    refreshes: int = 0
+    """Upstream fetches started by the cache, coalesced across concurrent requests."""
+    refresh_errors: int = 0
+    """Upstream fetches that raised an exception."""
+    evictions: int = 0
+    """Entries dropped to respect the maximum number of entries."""
+
+
+class CollectionCache(ABC):
+    """Framework for caching proxied collection metadata.
+
+    Entries younger than the ttl are served directly. Entries older than the ttl, but within the stale_ttl window,
+    are served while a refresh runs in the background. Only one refresh per key is in flight at a time, concurrent
+    requests for the same key wait on the same refresh.
+
+    Subclasses only need to provide the storage, i.e. _get_entry, _set_entry, _delete_entry and _clear.
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float = 0.0) -> None:
+        """Initialize the CollectionCache.
+
+        Args:
+            ttl (float): The seconds an entry is considered fresh.
+            stale_ttl (float): The seconds after the ttl that an entry is served while it is refreshed.
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.stats = CacheStats()
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    @abstractmethod
+    async def _get_entry(self, key: Hashable) -> Optional[CacheEntry]:
+        """Get the entry stored for the key, or None."""
+        pass
+
+    @abstractmethod
+    async def _set_entry(self, key: Hashable, entry: CacheEntry):
+        """Store the entry for the key."""
+        pass
+
+    @abstractmethod
+    async def _delete_entry(self, key: Hashable):
+        """Remove the entry for the key if it exists."""
+        pass
+
+    @abstractmethod
+    async def _clear(self):
+        """Remove all entries."""
+        pass
+
+    async def invalidate(self, key: Optional[Hashable] = None):
+        """Invalidate the entry for a key, or all entries if no key is provided.
+
+        Args:
+            key (Hashable): The key to invalidate.
+        """
+        if key is None:
+            await self._clear()
+        else:
+            await self._delete_entry(key)
+
+    async def _refresh(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]):
+        """Fetch a new value for the key and store it. None values are not stored."""
+        self.stats.refreshes += 1
+        try:
+            value = await fetch()
+        except Exception:
+            self.stats.refresh_errors += 1
+            raise
+
+        if value is not None:
+            await self._set_entry(key, CacheEntry(value=value))
+        return value
+
+    def _get_inflight(self, key: Hashable) -> Optional[asyncio.Task]:
+        """Get the refresh in flight for the key on the running event loop."""
+        task = self._inflight.get(key)
+        if task and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            return task
+        return None
+
+    def _start_refresh(
+        self, key: Hashable, fetch: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Task:
+        """Start a refresh for the key, unless one is already in flight."""
+        task = self._get_inflight(key)
+        if task:
+            return task
+
+        task = asyncio.ensure_future(self._refresh(key, fetch))
+        self._inflight[key] = task
+
+        def _done(done_task: asyncio.Task):
+            if self._inflight.get(key) is done_task:
+                del self._inflight[key]
+            if not done_task.cancelled() and done_task.exception():
+                logger.warning(
+                    "Refreshing cache entry %r failed: %s", key, done_task.exception()
+                )
+
+        task.add_done_callback(_done)
+        return task
+
+    async def set(self, key: Hashable, value: Any):
+        """Store a value fetched outside of the cache, e.g. one derived from another fetch.
+
+        Args:
+            key (Hashable): The key of the value.
+            value (Any): The value, None values are not stored.
+        """
+        if value is not None:
+            await self._set_entry(key, CacheEntry(value=value))
+
+    async def get_or_refresh(
+        self, key: Hashable, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Get the value for the key, fetching it if it is missing or expired.
+
+        Args:
+            key (Hashable): The key of the value.
+            fetch (Callable): An async callable returning the value for the key, or None if there is no value.
+
+        Returns:
+            The cached or fetched value.
+        """
+        entry = await self._get_entry(key)
+
+        if entry is not None:
+            age = entry.age()
+            if age < self.ttl:
+                self.stats.hits += 1
+                return entry.value
+            if age < self.ttl + self.stale_ttl:
+                self.stats.stale_hits += 1
+                self._start_refresh(key, fetch)
+                return entry.value
+
+        self.stats.misses += 1
+        return await asyncio.shield(self._start_refresh(key, fetch))
+
+
+class InMemoryCollectionCache(CollectionCache):
+    """The default in-process LRU CollectionCache."""
+
+    def __init__(self, ttl: float, stale_ttl: float = 0.0, max_entries: int = 1024):
+        """Initialize the InMemoryCollectionCache.
+
+        Args:
+            ttl (float): The seconds an entry is considered fresh.
+            stale_ttl (float): The seconds after the ttl that an entry is served while it is refreshed.
+            max_entries (int): The number of entries kept before the least recently used is evicted.
+        """
+        super().__init__(ttl=ttl, stale_ttl=stale_ttl)
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+
+    async def _get_entry(self, key: Hashable) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    async def _set_entry(self, key: Hashable, entry: CacheEntry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def _delete_entry(self, key: Hashable):
+        self._entries.pop(key, None)
+
+    async def _clear(self):
+        self._entries.clear()
+
+
+@define
+class SerializedResponse:
+    """A response body serialized and compressed once, to be served many times."""
+
+    body: bytes
+    """The identity encoded response body."""
+    etag: str
+    """The strong entity tag of the identity encoded body."""
+    encoded: dict[str, bytes] = field(factory=dict)
+    """The response body compressed with each available content coding."""
+    media_type: str = "application/json"
+
+    @classmethod
+    def from_content(cls, content: Any):
+        """Serialize the content the same way a JSONResponse would, and prepare the compressed variants.
+
+        Args:
+            content (Any): The json serializable content of the response.
+
+        Returns:
+            SerializedResponse: The prepared response.
+        """
+        body = json.dumps(
+            jsonable_encoder(content, by_alias=True, exclude_none=True),
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+        encoded = {"gzip": gzip.compress(body, mtime=0)}
+        if brotli:
+            encoded["br"] = brotli.compress(body)
+
+        return cls(
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()}"',
+            encoded=encoded,
+        )
+
+    def _etag_for(self, coding: Optional[str]) -> str:
+        """Each content coding is a different representation and needs its own strong entity tag."""
+        if not coding:
+            return self.etag
+        return f'{self.etag[:-1]}-{coding}"'
+
+    def _matches(self, if_none_match: str) -> bool:
+        """Check the If-None-Match header against the entity tags of all representations."""
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in tags:
+            return True
+        known = {self._etag_for(coding) for coding in [None, *self.encoded]}
+        return bool(tags & known)
+
+    def _negotiate(self, accept_encoding: str) -> Optional[str]:
+        """Pick the preferred content coding that was prepared and is accepted by the client."""
+        accepted = set()
+        for coding in accept_encoding.split(","):
+            name, *params = coding.split(";")
+            quality = 1.0
+            for param in params:
+                key, _, value = param.strip().partition("=")
+                if key == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            if quality > 0:
+                accepted.add(name.strip().lower())
+
+        for coding in ["br", "gzip"]:
+            if coding in self.encoded and coding in accepted:
+                return coding
+        return None
+
+    def to_response(self, request: Optional[Request] = None) -> Response:
+        """Build the response for a request, honouring If-None-Match and Accept-Encoding.
+
+        Args:
+            request (Request): The incoming request.
+
+        Returns:
+            Response: A 304 response if the client already has the representation, else the prepared body.
+        """
+        headers = request.headers if request else {}
+        coding = self._negotiate(headers.get("accept-encoding", ""))
+
+        response_headers = {
+            "ETag": self._etag_for(coding),
+            "Vary": "Accept-Encoding",
+        }
+
+        if self._matches(headers.get("if-none-match", "")):
+            return Response(status_code=304, headers=response_headers)
+
+        if coding:
+            response_headers["Content-Encoding"] = coding
+            return Response(
+                content=self.encoded[coding],
+                media_type=self.media_type,
+                headers=response_headers,
+            )
+
+        return Response(
+            content=self.body, media_type=self.media_type, headers=response_headers
+        )
+
+
 class CollectionRegister(EndpointRegister):
     """The CollectionRegister to regulate the application logic for the API behaviour."""
 
-    def __init__(self, settings) -> None:
+    def __init__(self, settings, cache: Optional[CollectionCache] = None) -> None:
         """Initialize the CollectionRegister.
 
         Args:
             settings (AppSettings): The AppSettings that the application will use.
+            cache (CollectionCache): The cache for collection metadata, defaults to an InMemoryCollectionCache.
         """
         super().__init__()
         self.endpoints = self._initialize_endpoints()
         self.settings = settings
+        self.cache = cache or InMemoryCollectionCache(
+            ttl=settings.STAC_CACHE_TTL,
+            stale_ttl=settings.STAC_CACHE_STALE_TTL,
+            max_entries=settings.STAC_CACHE_MAX_ENTRIES,
+        )
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._collection_index: dict[str, str] = {}
 
     def _initialize_endpoints(self) -> list[Endpoint]:
         """Initialize the endpoints for the register.
@@ -56,11 +431,122 @@ class CollectionRegister(EndpointRegister):
         """
         return COLLECTIONS_ENDPOINTS
 
-    async def _proxy_request(self, path):
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create a new client session with the connection pool configured in the AppSettings.
+
+        Returns:
+            aiohttp.ClientSession: The pooled session to use for proxying to the STAC catalogue.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self.settings.STAC_CONNECTION_LIMIT,
+            limit_per_host=self.settings.STAC_CONNECTION_LIMIT_PER_HOST,
+            keepalive_timeout=self.settings.STAC_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=self.settings.STAC_DNS_CACHE_TTL,
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=self.settings.STAC_REQUEST_TIMEOUT,
+            connect=self.settings.STAC_CONNECT_TIMEOUT,
+        )
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    async def open_session(self):
+        """Open the shared client session. Intended to be called from the application startup hook."""
+        if (
+            self._session is not None
+            and not self._session.closed
+            and self._session_loop is asyncio.get_running_loop()
+        ):
+            return
+
+        # A session bound to another event loop can't be closed from this one, so it is replaced.
+        self._session = self._create_session()
+        self._session_loop = asyncio.get_running_loop()
+
+    async def close_session(self):
+        """Close the shared client session. Intended to be called from the application shutdown hook."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared client session, opening it if it is not available for the running event loop.
+
+        Returns:
+            aiohttp.ClientSession: The pooled session to use for proxying to the STAC catalogue.
+        """
+        await self.open_session()
+        return self._session
+
+    def _upstreams(self) -> list[str]:
+        """The urls of all STAC catalogues being proxied to, starting with the STAC_API_URL."""
+        return [self.settings.STAC_API_URL, *(self.settings.STAC_API_URLS or [])]
+
+    async def _upstream_for(self, collection_id) -> str:
+        """Get the url of the STAC catalogue that owns the collection.
+
+        The collection id to catalogue index is kept in the CollectionCache next to the collections, so it is shared
+        by everything using the cache, whoever fetched the collections. Without a cache it is kept on the register,
+        and rebuilt when a collection is missing from it, e.g. one added to a catalogue since. Unknown collections are
+        routed to the STAC_API_URL.
+
+        Args:
+            collection_id (str): The collection id to route.
+
+        Returns:
+            str: The url of the STAC catalogue to proxy to.
+        """
+        if not self.settings.STAC_API_URLS:
+            return self.settings.STAC_API_URL
+
+        if self.settings.STAC_CACHE_TTL:
+            index = await self._cached(
+                "collections", self._fetch_collection_index, variant="index"
+            )
+        else:
+            index = self._collection_index
+            if collection_id not in index:
+                index = await self._fetch_collection_index() or {}
+                self._collection_index = index
+
+        return (index or {}).get(collection_id, self.settings.STAC_API_URL)
+
+    def _build_collection_index(
+        self, responses: list[tuple[str, dict]]
+    ) -> dict[str, str]:
+        """Map each collection id to the first catalogue listing it."""
+        index = {}
+        for upstream, resp in responses:
+            for collection in resp["collections"]:
+                index.setdefault(collection.get("id"), upstream)
+        return index
+
+    async def _fetch_collection_index(self) -> Optional[dict[str, str]]:
+        """Fetch the collections from all catalogues and map each collection id to its catalogue.
+
+        Returns:
+            Optional[dict[str, str]]: The catalogue url per collection id, or None if no catalogue returned any.
+        """
+        responses = await self._fetch_upstream_collections()
+        if not responses:
+            return None
+        return self._build_collection_index(responses)
+
+    async def _store_collection_index(self, index: dict[str, str]):
+        """Keep the index built while fetching the collections, so routing does not fetch them again."""
+        self._collection_index = index
+        if self.settings.STAC_CACHE_TTL and self.settings.STAC_API_URLS:
+            await self.cache.set(self._cache_key("collections", "index"), index)
+
+    async def _proxy_request(
+        self, path, params: Optional[dict] = None, upstream: Optional[str] = None
+    ):
         """Proxy the request with aiohttp.
 
         Args:
             path (str): The path to proxy to the STAC catalogue.
+            params (dict): The query parameters to forward to the STAC catalogue.
+            upstream (str): The url of the STAC catalogue to proxy to, defaults to the STAC_API_URL.
 
         Raises:
             HTTPException: Raises an exception with relevant status code and descriptive message of failure.
@@ -68,11 +554,154 @@ class CollectionRegister(EndpointRegister):
         Returns:
             The response dictionary from the request.
         """
-        async with aiohttp.ClientSession() as client:
-            async with client.get(self.settings.STAC_API_URL + path) as response:
-                resp = await response.json()
-                if response.status == 200:
-                    return resp
+        client = await self._get_session()
+        async with client.get(
+            (upstream or self.settings.STAC_API_URL) + path,
+            **({"params": params} if params else {}),
+        ) as response:
+            resp = await response.json()
+            if response.status == 200:
+                return resp
+
+    def _cache_key(self, path: str, variant: Optional[str] = None) -> tuple:
+        """The cache key for a proxied path, the whitelist is included as it changes the result.
+
+        Args:
+            path (str): The path proxied to the STAC catalogue.
+            variant (str): Distinguishes different representations of the same path.
+
+        Returns:
+            tuple: The key to use with the CollectionCache.
+        """
+        whitelist = self.settings.STAC_COLLECTIONS_WHITELIST
+        return (path, tuple(whitelist) if whitelist else None, variant)
+
+    async def _cached(
+        self,
+        path: str,
+        fetch: Callable[[], Awaitable[Any]],
+        variant: Optional[str] = None,
+    ) -> Any:
+        """Get the value for the path from the cache, fetching it when it is missing or expired.
+
+        Args:
+            path (str): The path proxied to the STAC catalogue.
+            fetch (Callable): An async callable returning the value for the path, or None if there is no value.
+            variant (str): Distinguishes different representations of the same path.
+
+        Returns:
+            The cached or fetched value.
+        """
+        if not self.settings.STAC_CACHE_TTL:
+            return await fetch()
+        return await self.cache.get_or_refresh(self._cache_key(path, variant), fetch)
+
+    async def _fetch_collection(self, collection_id) -> Optional[Collection]:
+        """Fetch and validate a single collection from the STAC catalogue.
+
+        Args:
+            collection_id (str): The collection id to request from the proxy.
+
+        Returns:
+            Collection: The validated collection, or None if the catalogue did not return it.
+        """
+        resp = await self._proxy_request(
+            f"collections/{collection_id}",
+            upstream=await self._upstream_for(collection_id),
+        )
+        if resp:
+            return Collection(**resp)
+        return None
+
+    async def _fetch_upstream_collections(self) -> list[tuple[str, dict]]:
+        """Fetch the collections from all STAC catalogues concurrently.
+
+        Catalogues which fail or don't respond within the STAC_UPSTREAM_TIMEOUT are skipped, unless all of them fail.
+
+        Raises:
+            Exception: The error of the first catalogue if no catalogue could be reached.
+
+        Returns:
+            list[tuple[str, dict]]: The catalogue url and response dictionary of each catalogue that returned collections.
+        """
+        upstreams = self._upstreams()
+        timeout = self.settings.STAC_UPSTREAM_TIMEOUT if len(upstreams) > 1 else None
+        results = await asyncio.gather(
+            *[
+                asyncio.wait_for(
+                    self._proxy_request("collections", upstream=upstream),
+                    timeout=timeout,
+                )
+                for upstream in upstreams
+            ],
+            return_exceptions=True,
+        )
+
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if len(errors) == len(upstreams):
+            raise errors[0]
+
+        responses = []
+        for upstream, result in zip(upstreams, results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "Skipping STAC catalogue %s, listing collections failed: %r",
+                    upstream,
+                    result,
+                )
+            elif result:
+                responses.append((upstream, result))
+        return responses
+
+    async def _fetch_collections(self) -> Optional[Collections]:
+        """Fetch all collections from the STAC catalogue and validate the whitelisted ones.
+
+        Returns:
+            Collections: The validated collections, or None if the catalogue did not return any.
+        """
+        responses = await self._fetch_upstream_collections()
+
+        if not responses:
+            return None
+
+        seen = set()
+        valid_collections = []
+        for upstream, resp in responses:
+            for collection in resp["collections"]:
+                if collection.get("id") in seen:
+                    continue
+                seen.add(collection.get("id"))
+
+                if (
+                    self.settings.STAC_COLLECTIONS_WHITELIST
+                    and collection.get("id")
+                    not in self.settings.STAC_COLLECTIONS_WHITELIST
+                ):
+                    continue
+                try:
+                    valid_collections.append(Collection(**collection))
+                except (ValidationError, Exception) as e:
+                    logger.warning(
+                        "Dropping collection %r from response due to validation error: %s",
+                        collection.get("id"),
+                        e,
+                    )
+
+        await self._store_collection_index(self._build_collection_index(responses))
+
+        _, primary = responses[0]
+        return Collections(collections=valid_collections, links=primary["links"])
+
+    async def _fetch_serialized_collections(self) -> Optional[SerializedResponse]:
+        """Fetch all collections from the STAC catalogue and serialize them for the response.
+
+        Returns:
+            SerializedResponse: The serialized collections, or None if the catalogue did not return any.
+        """
+        collections = await self._fetch_collections()
+        if not collections:
+            return None
+        return SerializedResponse.from_content(collections)
 
     async def get_collection(self, collection_id):
         """
@@ -95,63 +724,128 @@ class CollectionRegister(EndpointRegister):
             not self.settings.STAC_COLLECTIONS_WHITELIST
             or collection_id in self.settings.STAC_COLLECTIONS_WHITELIST
         ):
-            path = f"collections/{collection_id}"
-            resp = await self._proxy_request(path)
+            collection = await self._cached(
+                f"collections/{collection_id}",
+                lambda: self._fetch_collection(collection_id),
+            )
 
-            if resp:
-                return Collection(**resp)
+            if collection:
+                return collection
             raise HTTPException(status_code=404, detail=not_found)
         raise HTTPException(status_code=404, detail=not_found)
 
-    async def get_collections(self):
+    async def get_collections(self, request: Request = None):
         """
         Returns Basic metadata for all datasets
 
+        Args:
+            request (Request): The incoming request, used for conditional and compressed responses.
+
         Raises:
             HTTPException: Raises an exception with relevant status code and descriptive message of failure.
 
         Returns:
-            Collections: The proxied request returned as a Collections object.
+            Collections: The proxied request returned as a Collections object. When STAC_COLLECTIONS_PRESERIALIZE
+            is set, a Response built from the pre-serialized Collections is returned instead.
         """
-        path = "collections"
-        resp = await self._proxy_request(path)
+        if self.settings.STAC_COLLECTIONS_PRESERIALIZE:
+            collections = await self._cached(
+                "collections", self._fetch_serialized_collections, variant="serialized"
+            )
+        else:
+            collections = await self._cached("collections", self._fetch_collections)
 
-        if not resp:
+        if not collections:
             raise HTTPException(
                 status_code=404,
                 detail=Error(code="NotFound", message="No Collections found."),
             )
 
-        valid_collections = []
-        for collection in resp["collections"]:
-            if (
-                self.settings.STAC_COLLECTIONS_WHITELIST
-                and collection.get("id") not in self.settings.STAC_COLLECTIONS_WHITELIST
-            ):
-                continue
-            try:
-                valid_collections.append(Collection(**collection))
-            except (ValidationError, Exception) as e:
-                logger.warning(
-                    "Dropping collection %r from response due to validation error: %s",
-                    collection.get("id"),
-                    e,
-                )
+        if isinstance(collections, SerializedResponse):
+            return collections.to_response(request)
+        return collections
+
+    def _api_url(self) -> str:
+        """The url of this deployment of the api, used to rewrite links from the STAC catalogue."""
+        scheme = "https" if self.settings.API_TLS else "http"
+        return f"{scheme}://{self.settings.API_DNS}{self.settings.OPENEO_PREFIX}/"
+
+    async def _stream_proxy_request(self, path, params: dict, upstream: str):
+        """Proxy the request with aiohttp, streaming the body back instead of parsing it.
+
+        Links to collections of the STAC catalogue, e.g. the next and prev pagination links, are rewritten to
+        point at this api. Large bodies may take longer than the STAC_REQUEST_TIMEOUT, so the streamed request only
+        times out when connecting or when the catalogue stops sending data for the STAC_READ_TIMEOUT.
+
+        Args:
+            path (str): The path to proxy to the STAC catalogue.
+            params (dict): The query parameters to forward to the STAC catalogue.
+            upstream (str): The url of the STAC catalogue to proxy to.
+
+        Returns:
+            StreamingResponse: The streamed response, or None if the catalogue did not respond with 200.
+        """
+        client = await self._get_session()
+        timeout = aiohttp.ClientTimeout(
+            total=None,
+            connect=self.settings.STAC_CONNECT_TIMEOUT,
+            sock_read=self.settings.STAC_READ_TIMEOUT,
+        )
+        response = await client.get(
+            upstream + path,
+            timeout=timeout,
+            **({"params": params} if params else {}),
+        )
+
+        if response.status != 200:
+            response.release()
+            return None
+
+        upstream_collections = (upstream + "collections/").encode("utf-8")
+        local_collections = (self._api_url() + "collections/").encode("utf-8")
 
-        return Collections(collections=valid_collections, links=resp["links"])
+        async def body():
+            try:
+                async for chunk in rewrite_stream(
+                    response.content.iter_chunked(self.settings.STAC_ITEMS_CHUNK_SIZE),
+                    upstream_collections,
+                    local_collections,
+                ):
+                    yield chunk
+            finally:
+                response.release()
+
+        # The background task releases the connection if the client disconnects before the body is consumed.
+        return StreamingResponse(
+            body(),
+            media_type=response.headers.get("Content-Type", "application/geo+json"),
+            background=BackgroundTask(response.release),
+        )
 
-    async def get_collection_items(self, collection_id):
+    async def get_collection_items(
+        self,
+        collection_id,
+        limit: Optional[int] = None,
+        token: Optional[str] = None,
+        bbox: Optional[str] = None,
+        datetime: Optional[str] = None,
+    ):
         """
         Returns Basic metadata for all datasets.
 
         Args:
             collection_id (str): The collection id to request from the proxy.
+            limit (int): The maximum number of items in the page, forwarded to the STAC catalogue.
+            token (str): The pagination token of the page, forwarded to the STAC catalogue.
+            bbox (str): The comma separated bounding box to filter by, forwarded to the STAC catalogue.
+            datetime (str): The datetime or interval to filter by, forwarded to the STAC catalogue.
 
         Raises:
             HTTPException: Raises an exception with relevant status code and descriptive message of failure.
 
         Returns:
-            The direct response from the request to the stac catalogue.
+            The direct response from the request to the stac catalogue. When STAC_ITEMS_STREAMING is set, a
+            StreamingResponse passing the body of the stac catalogue through.
         """
         not_found = HTTPException(
             status_code=404,
@@ -160,12 +854,27 @@ class CollectionRegister(EndpointRegister):
             ),
         )
 
+        params = {
+            key: str(value)
+            for key, value in {
+                "limit": limit,
+                "token": token,
+                "bbox": bbox,
+                "datetime": datetime,
+            }.items()
+            if value is not None
+        }
+
         if (
             not self.settings.STAC_COLLECTIONS_WHITELIST
             or collection_id in self.settings.STAC_COLLECTIONS_WHITELIST
         ):
             path = f"collections/{collection_id}/items"
-            resp = await self._proxy_request(path)
+            upstream = await self._upstream_for(collection_id)
+            if self.settings.STAC_ITEMS_STREAMING:
+                resp = await self._stream_proxy_request(path, params, upstream)
+            else:
+                resp = await self._proxy_request(path, params, upstream)
 
             if resp:
                 return resp
@@ -199,7 +908,9 @@ class CollectionRegister(EndpointRegister):
             or collection_id in self.settings.STAC_COLLECTIONS_WHITELIST
         ):
             path = f"collections/{collection_id}/items/{item_id}"
-            resp = await self._proxy_request(path)
+            resp = await self._proxy_request(
+                path, upstream=await self._upstream_for(collection_id)
+            )
 
             if resp:
                 return resp
@@ -0,0 +1,340 @@
+"""Class to run the synchronous processing of POST /result in a bounded pool of worker processes.
+
+Processing a graph in the request thread lets one heavy graph stall the API worker serving it. The SyncJobExecutor
+instead hands each graph to one of a fixed number of worker processes, while the request waits asynchronously. A worker
+that runs past the deadline of the request, or whose client disconnected, is killed and replaced, so abandoned graphs do
+not keep occupying the pool. When every worker is busy and the waiting room is full, new requests are refused with 429
+and a Retry-After hint instead of queueing up behind each other.
+
+Classes:
+    - SyncResult: The result of a synchronous job, as returned by the execute function.
+    - SyncJobExecutor: Runs synchronous jobs in a bounded pool of worker processes with admission control.
+"""
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, NamedTuple, Optional
+
+from fastapi import Response
+from fastapi.exceptions import HTTPException
+
+from openeo_fastapi.api.types import Error
+
+DURATION_SMOOTHING = 0.2
+
+
+class SyncResult(NamedTuple):
+    """The result of a synchronous job, as returned by the execute function."""
+
+    content: Any
+    """The result, bytes or str are returned as is, anything else is returned as JSON."""
+    media_type: str = "application/json"
+    """The media type of the result."""
+    costs: Optional[float] = None
+    """The costs of the processing, returned in the OpenEO-Costs header."""
+
+
+def _serve(connection, execute: Callable[[dict], SyncResult]):
+    """Run the process graphs received on the connection until it is closed, in the worker process."""
+    while True:
+        try:
+            process = connection.recv()
+        except (EOFError, OSError):
+            return
+
+        try:
+            connection.send((True, execute(process)))
+        except Exception as error:
+            connection.send((False, f"{type(error).__name__}: {error}"))
+
+
+class _Worker:
+    """A worker process and the connection to send it process graphs."""
+
+    def __init__(self, context, execute: Callable[[dict], SyncResult]) -> None:
+        self.connection, child = context.Pipe()
+        self.process = context.Process(
+            target=_serve, args=(child, execute), daemon=True
+        )
+        self.process.start()
+        child.close()
+
+    def call(self, process: dict) -> tuple[bool, Any]:
+        """Send the process graph to the worker and wait for the result."""
+        self.connection.send(process)
+        return self.connection.recv()
+
+    def kill(self):
+        """Kill the worker process."""
+        self.process.kill()
+        self.process.join()
+
+    def close(self):
+        """Close the connection, once no thread is using it anymore."""
+        self.connection.close()
+
+    def stop(self):
+        """Kill the worker process and close the connection."""
+        self.kill()
+        self.close()
+
+
+def _stop_spawned(spawn: asyncio.Future):
+    """Stop the worker started for a request which was canceled while it was starting."""
+    if not spawn.cancelled() and spawn.exception() is None:
+        asyncio.get_running_loop().run_in_executor(None, spawn.result().stop)
+
+
+class SyncJobExecutor:
+    """Runs synchronous jobs in a bounded pool of worker processes with admission control.
+
+    Up to max_workers graphs run at once, and up to max_queued further requests wait for a free worker, first come
+    first served. Requests beyond that are refused with 429 right away.
+
+    Example:
+    ```
+    def execute(process: dict) -> SyncResult:
+        return SyncResult(content=run_graph(process["process_graph"]), media_type="image/tiff")
+
+    jobs = JobsRegister(settings, links, executor=SyncJobExecutor(execute, max_workers=4, timeout=60))
+    ```
+    """
+
+    def __init__(
+        self,
+        execute: Callable[[dict], SyncResult],
+        max_workers: Optional[int] = None,
+        max_queued: Optional[int] = None,
+        timeout: float = 300.0,
+        start_method: str = "spawn",
+        poll_interval: float = 0.05,
+    ) -> None:
+        """Initialize the SyncJobExecutor.
+
+        Args:
+            execute (Callable[[dict], SyncResult]): Runs the process, with the process_graph, in a worker process. Must be
+                picklable, e.g. a module level function.
+            max_workers (Optional[int]): The number of graphs run at once, defaults to the number of CPUs.
+            max_queued (Optional[int]): The number of requests waiting for a free worker, defaults to max_workers.
+            timeout (float): The seconds a request may take, including waiting for a free worker.
+            start_method (str): The multiprocessing start method of the worker processes.
+            poll_interval (float): The seconds between checks for a free worker, the deadline and the client.
+        """
+        self.execute = execute
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queued = self.max_workers if max_queued is None else max_queued
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+
+        self._context = multiprocessing.get_context(start_method)
+        self._lock = threading.Lock()
+        self._idle: list[_Worker] = []
+        self._workers = 0
+        self._admitted = 0
+        self._waiting: deque = deque()
+        self._mean_duration: Optional[float] = None
+
+    def retry_after(self) -> int:
+        """Estimate the seconds until a new request would be admitted.
+
+        Returns:
+            int: The seconds, at least 1.
+        """
+        with self._lock:
+            ahead = len(self._waiting) + 1
+            duration = self._mean_duration or 1.0
+        return max(math.ceil(duration * ahead / self.max_workers), 1)
+
+    def _admit(self) -> object:
+        """Admit the request to the waiting room, or refuse it with 429."""
+        with self._lock:
+            if self._admitted < self.max_workers + self.max_queued:
+                self._admitted += 1
+                ticket = object()
+                self._waiting.append(ticket)
+                return ticket
+
+        raise HTTPException(
+            status_code=429,
+            detail=Error(
+                code="TooManyRequests",
+                message="All the workers for synchronous processing are busy, retry later or use a batch job.",
+            ),
+            headers={"Retry-After": str(self.retry_after())},
+        )
+
+    def _try_acquire(self, ticket: object) -> tuple[bool, Optional[_Worker]]:
+        """Take an idle worker, or a slot to start a new one, if it is the ticket's turn."""
+        with self._lock:
+            if not self._waiting or self._waiting[0] is not ticket:
+                return False, None
+            if self._idle:
+                self._waiting.popleft()
+                return True, self._idle.pop()
+            if self._workers < self.max_workers:
+                self._waiting.popleft()
+                self._workers += 1
+                return True, None
+            return False, None
+
+    def _release(self, ticket: object, acquired: bool, worker: Optional[_Worker]):
+        """Leave the waiting room and return the worker to the pool, None if it can not be reused."""
+        with self._lock:
+            self._admitted -= 1
+            if ticket in self._waiting:
+                self._waiting.remove(ticket)
+            if not acquired:
+                return
+            if worker is not None:
+                self._idle.append(worker)
+            else:
+                self._workers -= 1
+
+    def _record_duration(self, duration: float):
+        """Update the moving average of the run durations used for the Retry-After hint."""
+        with self._lock:
+            if self._mean_duration is None:
+                self._mean_duration = duration
+            else:
+                self._mean_duration += DURATION_SMOOTHING * (
+                    duration - self._mean_duration
+                )
+
+    def _timeout_error(self) -> HTTPException:
+        """The error for a request past its deadline."""
+        return HTTPException(
+            status_code=504,
+            detail=Error(
+                code="ProcessingTimeout",
+                message=f"The processing did not finish within {self.timeout} seconds, use a batch job instead.",
+            ),
+        )
+
+    async def _discard(self, worker: _Worker, call: Optional[asyncio.Future]):
+        """Kill a worker that can not be reused, wait for the call running on it to end and close its connection.
+
+        The worker can only be stopped by killing it, the pool starts a new one when needed.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, worker.kill)
+        if call is not None:
+            await asyncio.wait({call})
+            if not call.cancelled():
+                call.exception()
+        worker.close()
+
+    async def run(
+        self,
+        process: dict,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    ) -> Response:
+        """Run the process in a worker process and return its result.
+
+        Args:
+            process (dict): The process, with the process_graph, to run.
+            is_disconnected (Optional[Callable[[], Awaitable[bool]]]): Checks if the client disconnected, e.g.
+                Request.is_disconnected, the processing is canceled if it did.
+
+        Raises:
+            HTTPException: 429 if the pool is saturated, 504 if the deadline passed, 500 if the processing failed.
+
+        Returns:
+            Response: The result, with the OpenEO-Costs header if the execute function reported costs. A 499 response if
+            the client disconnected.
+        """
+        deadline = time.monotonic() + self.timeout
+        ticket = self._admit()
+        acquired = False
+        worker = None
+        call = None
+        reusable = False
+
+        async def gone() -> bool:
+            return is_disconnected is not None and await is_disconnected()
+
+        try:
+            while True:
+                acquired, worker = self._try_acquire(ticket)
+                if acquired:
+                    break
+                if time.monotonic() >= deadline:
+                    raise self._timeout_error()
+                if await gone():
+                    return Response(status_code=499)
+                await asyncio.sleep(self.poll_interval)
+
+            # Starting, killing and joining the worker processes blocks, so it is done in threads.
+            loop = asyncio.get_running_loop()
+            if worker is None:
+                spawn = loop.run_in_executor(None, _Worker, self._context, self.execute)
+                try:
+                    worker = await asyncio.shield(spawn)
+                except asyncio.CancelledError:
+                    spawn.add_done_callback(_stop_spawned)
+                    raise
+
+            started = time.monotonic()
+            call = loop.run_in_executor(None, worker.call, process)
+            while True:
+                remaining = deadline - time.monotonic()
+                done, _ = await asyncio.wait(
+                    {call}, timeout=max(min(self.poll_interval, remaining), 0)
+                )
+                if done:
+                    break
+                if remaining <= 0:
+                    raise self._timeout_error()
+                if await gone():
+                    return Response(status_code=499)
+
+            try:
+                succeeded, result = call.result()
+            except (EOFError, OSError):
+                raise HTTPException(
+                    status_code=500,
+                    detail=Error(
+                        code="Internal",
+                        message="The worker process processing the job exited unexpectedly.",
+                    ),
+                )
+            reusable = True
+            self._record_duration(time.monotonic() - started)
+
+            if not succeeded:
+                raise HTTPException(
+                    status_code=500,
+                    detail=Error(
+                        code="Internal",
+                        message=f"The processing failed: {result}",
+                    ),
+                )
+        finally:
+            try:
+                if worker is not None and not reusable:
+                    # Shielded, so the worker is also stopped when the request itself is canceled.
+                    await asyncio.shield(self._discard(worker, call))
+            finally:
+                self._release(ticket, acquired, worker if reusable else None)
+
+        result = SyncResult(*result)
+        content = result.content
+        if not isinstance(content, (bytes, str)):
+            content = json.dumps(content)
+
+        headers = {}
+        if result.costs is not None:
+            headers["OpenEO-Costs"] = str(result.costs)
+        return Response(content=content, media_type=result.media_type, headers=headers)
+
+    def close(self):
+        """Kill the idle worker processes."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._workers -= len(idle)
+        for worker in idle:
+            worker.stop()
@@ -2,28 +2,46 @@
 
 Classes:
     - JobsRegister: Framework for defining and extending the logic for working with BatchJobs.
+    - AsyncJobsRegister: JobsRegister interacting with the database through the async engine.
     - Job: The pydantic model used as an in memory representation of an OpenEO Job.
 """
+import asyncio
+import base64
 import datetime
+import json
 import uuid
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
+from urllib.parse import quote, urlencode
 
-from fastapi import Depends, Response
+from fastapi import Depends, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import HTTPException
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Extra
 from sqlalchemy.exc import IntegrityError
 
 from openeo_fastapi.api.models import (
     BatchJob,
+    JobsGetLogsResponse,
     JobsGetResponse,
+    JobsGetResultsResponse,
     JobsRequest,
+    JobsResultAsset,
     ProcessGraphWithMetadata,
 )
-from openeo_fastapi.api.types import Endpoint, Error, Status
+from openeo_fastapi.api.types import Endpoint, Error, Level, Link, LogEntry, Status
 from openeo_fastapi.client.auth import Authenticator, User
-from openeo_fastapi.client.psql.engine import Filter, _list, create, get, modify
+from openeo_fastapi.client.logs import JobLogStore, PostgresJobLogStore
+from openeo_fastapi.client.psql import async_engine
+from openeo_fastapi.client.psql.engine import Filter, _list_page, create, get, update
 from openeo_fastapi.client.psql.models import JobORM
 from openeo_fastapi.client.register import EndpointRegister
+from openeo_fastapi.client.results import AssetResponse, ResultStore
+
+if TYPE_CHECKING:
+    from openeo_fastapi.client.executor import SyncJobExecutor
+    from openeo_fastapi.client.queue import JobQueue
 
 JOBS_ENDPOINTS = [
     Endpoint(
@@ -66,9 +84,24 @@ JOBS_ENDPOINTS = [
         path="/jobs/{job_id}/results",
         methods=["DELETE"],
     ),
+    Endpoint(
+        path="/jobs/{job_id}/results/{asset}",
+        methods=["GET"],
+    ),
 ]
 
 
+JOBS_PAGE_ORDER = ["created", "job_id"]
+JOBS_PAGE_MAX_LIMIT = 1000
+"""The largest page of jobs a client may request."""
+JOBS_LIST_COLUMNS = ["job_id", "status", "created", "title", "description"]
+STAC_FILE_EXTENSION = "https://stac-extensions.github.io/file/v2.1.0/schema.json"
+ACTIVE_STATUSES = [Status.queued, Status.running]
+"""The statuses of jobs that may still log, the streamed logs end for jobs in any other status."""
+LOGS_KEEPALIVE_INTERVAL = 15.0
+"""The seconds between the comments sent to keep idle streamed logs from being closed by proxies."""
+
+
 class Job(BaseModel):
     """Pydantic model representing an OpenEO Job."""
 
@@ -110,17 +143,44 @@ class Job(BaseModel):
 class JobsRegister(EndpointRegister):
     """The JobRegister to regulate the application logic for the API behaviour."""
 
-    def __init__(self, settings, links) -> None:
+    def __init__(
+        self,
+        settings,
+        links,
+        queue: Optional["JobQueue"] = None,
+        executor: Optional["SyncJobExecutor"] = None,
+        results: Optional[ResultStore] = None,
+        log_store: Optional[JobLogStore] = None,
+    ) -> None:
         """Initialize the JobRegister.
 
         Args:
             settings (AppSettings): The AppSettings that the application will use.
             links (Links): The Links to be used in some function responses.
+            queue (Optional[JobQueue]): The queue started jobs are added to, defaults to the PostgresJobQueue.
+            executor (Optional[SyncJobExecutor]): Runs the synchronous jobs of POST /result, unsupported without one.
+            results (Optional[ResultStore]): The store the job results are served from, defaults to the RESULTS_STORE.
+            log_store (Optional[JobLogStore]): The store the job logs are served from, defaults to the PostgresJobLogStore.
         """
         super().__init__()
         self.endpoints = self._initialize_endpoints()
         self.settings = settings
         self.links = links
+        self.executor = executor
+
+        if results is None and settings.RESULTS_STORE:
+            results = ResultStore(
+                settings.RESULTS_STORE, chunk_size=settings.RESULTS_CHUNK_SIZE
+            )
+        self.results = results
+        self.log_store = log_store or PostgresJobLogStore()
+
+        if queue is None:
+            # Imported here, as the queue module depends on the Job model.
+            from openeo_fastapi.client.queue import PostgresJobQueue
+
+            queue = PostgresJobQueue()
+        self.queue = queue
 
     def _initialize_endpoints(self) -> list[Endpoint]:
         """Initialize the endpoints for the register.
@@ -130,28 +190,160 @@ class JobsRegister(EndpointRegister):
         """
         return JOBS_ENDPOINTS
 
-    # TODO Apply the limit
+    def _get_user_job(self, job_id: uuid.UUID, user: User) -> Job:
+        """Get the user's BatchJob.
+
+        Args:
+            job_id (JobId): A UUID job id.
+            user (User): The User returned from the Authenticator.
+
+        Raises:
+            HTTPException: Raises a 404 if there is no such job, or it belongs to another user.
+
+        Returns:
+            Job: The job.
+        """
+        job = get(get_model=Job, primary_key=job_id)
+        if not job or job.user_id != user.user_id:
+            raise HTTPException(
+                status_code=404,
+                detail=Error(
+                    code="JobNotFound", message=f"No job found with id: {job_id}"
+                ),
+            )
+        return job
+
+    def _get_finished_job(self, job_id: uuid.UUID, user: User) -> Job:
+        """Get the finished job of the user, for serving its results.
+
+        Args:
+            job_id (uuid.UUID): A UUID job id.
+            user (User): The User returned from the Authenticator.
+
+        Raises:
+            HTTPException: 404 if the job does not exist, 400 if it has not finished and 501 without a result store.
+
+        Returns:
+            Job: The job.
+        """
+        job = self._get_user_job(job_id, user)
+        if job.status != Status.finished:
+            raise HTTPException(
+                status_code=400,
+                detail=Error(
+                    code="JobNotFinished",
+                    message="Job has not finished computing the results yet. Please try again later.",
+                ),
+            )
+
+        if not self.results:
+            raise HTTPException(
+                status_code=501,
+                detail=Error(
+                    code="FeatureUnsupported", message="Feature not supported."
+                ),
+            )
+        return job
+
+    def _page_filters(self, user: User) -> list[Filter]:
+        """The filters selecting the user's BatchJobs, leaving out synchronous jobs.
+
+        Args:
+            user (User): The User returned from the Authenticator.
+
+        Returns:
+            list[Filter]: The filters.
+        """
+        return [
+            Filter(column_name="user_id", value=user.user_id),
+            Filter(column_name="synchronous", value=False),
+        ]
+
+    def _page_after(self, token: Optional[str]) -> Optional[list]:
+        """Decode the pagination token into the created time and job id of the last job of the previous page.
+
+        Args:
+            token (Optional[str]): The token from the next link of the previous page.
+
+        Raises:
+            HTTPException: Raises an exception with relevant status code and descriptive message of failure.
+
+        Returns:
+            Optional[list]: The keyset to continue after, or None for the first page.
+        """
+        if not token:
+            return None
+        try:
+            created, job_id = json.loads(base64.urlsafe_b64decode(token.encode()))
+            return [datetime.datetime.fromisoformat(created), uuid.UUID(job_id)]
+        except (ValueError, TypeError):
+            raise HTTPException(
+                status_code=400,
+                detail=Error(
+                    code="PaginationTokenInvalid",
+                    message=f"The pagination token {token} is invalid.",
+                ),
+            )
+
+    def _page_response(
+        self, jobs: list[Job], more: bool, limit: Optional[int]
+    ) -> JobsGetResponse:
+        """Create the JobsGetResponse for a page of jobs, with a next link if there are more jobs.
+
+        Args:
+            jobs (list[Job]): The jobs in the page.
+            more (bool): Whether there is a next page.
+            limit (Optional[int]): The limit applied to the page.
+
+        Returns:
+            JobsGetResponse: A list of the user's BatchJobs.
+        """
+        links = []
+        if more:
+            last = jobs[-1]
+            token = base64.urlsafe_b64encode(
+                json.dumps([last.created.isoformat(), str(last.job_id)]).encode()
+            ).decode()
+            scheme = "https" if self.settings.API_TLS else "http"
+            query = urlencode({"limit": limit, "token": token})
+            links.append(
+                Link(
+                    rel="next",
+                    href=f"{scheme}://{self.settings.API_DNS}{self.settings.OPENEO_PREFIX}/jobs?{query}",
+                )
+            )
+
+        # TODO BatchJob and Job describe the same thing, these want to be harmonized.
+        return JobsGetResponse(
+            jobs=[BatchJob(**job.dict()) for job in jobs], links=links
+        )
+
     def list_jobs(
-        self, limit: Optional[int] = 10, user: User = Depends(Authenticator.validate)
+        self,
+        limit: int = Query(10, ge=1, le=JOBS_PAGE_MAX_LIMIT),
+        token: Optional[str] = None,
+        user: User = Depends(Authenticator.validate),
     ):
         """List the user's most recent BatchJobs.
 
         Args:
-            limit (int): The limit to apply to the length of the list.
+            limit (int): The limit to apply to the length of the list, between 1 and JOBS_PAGE_MAX_LIMIT.
+            token (str): The pagination token from the next link of the previous page.
             user (User): The User returned from the Authenticator.
 
         Returns:
             JobsGetResponse: A list of the user's BatchJobs.
         """
-        # Invoke list function from handler
-        _filter = Filter(column_name="user_id", value=user.user_id)
-
-        job_list = _list(list_model=Job, filter_with=_filter)
-
-        # TODO BatchJob and Job describe the same thing, these want to be harmonized.
-        jobs = [BatchJob(**job.dict()) for job in job_list if not job.synchronous]
+        job_list, more = _list_page(
+            list_model=Job,
+            filter_with=self._page_filters(user),
+            order_by=JOBS_PAGE_ORDER,
+            limit=limit,
+            after=self._page_after(token),
+            columns=JOBS_LIST_COLUMNS,
+        )
 
-        return JobsGetResponse(jobs=jobs, links=[])
+        return self._page_response(job_list, more, limit)
 
     def create_job(
         self, body: JobsRequest, user: User = Depends(Authenticator.validate)
@@ -203,6 +395,17 @@ class JobsRegister(EndpointRegister):
             },
         )
 
+    def _patch_values(self, body: JobsRequest) -> dict:
+        """Get the columns to update for the fields provided in the JobsRequest, the same fields Job.patch applies.
+
+        Args:
+            body (JobsRequest): The Job Request that should be used to update the BatchJob.
+
+        Returns:
+            dict: The new values of the columns to update.
+        """
+        return {k: v for k, v in body.dict().items() if v and k in Job.__fields__}
+
     def update_job(
         self,
         job_id: uuid.UUID,
@@ -222,20 +425,17 @@ class JobsRegister(EndpointRegister):
         Returns:
             Response: A general FastApi response to signify the changes where made as expected.
         """
-        # Patch the job with any changes
-        job = get(get_model=Job, primary_key=job_id)
         # TODO Add check to ensure user owns job.
         # TODO Add job locked raise if status is running or queued.
-        patched_job = job.patch(body)
-
-        # Call engine modify with a new model!
-        modified = modify(modify_object=patched_job)
+        # Update only the changed columns, in a single statement.
+        modified = update(
+            update_model=Job, primary_key=job_id, values=self._patch_values(body)
+        )
         if not modified:
             raise HTTPException(
-                status_code=500,
+                status_code=404,
                 detail=Error(
-                    code="Internal",
-                    message="Server could not update the the job with the new process graph.",
+                    code="JobNotFound", message=f"No job found with id: {job_id}"
                 ),
             )
 
@@ -303,22 +503,147 @@ class JobsRegister(EndpointRegister):
             detail=Error(code="FeatureUnsupported", message="Feature not supported."),
         )
 
-    def logs(self, job_id: uuid.UUID, user: User = Depends(Authenticator.validate)):
-        """Get the logs for the BatchJob.
+    async def _read_logs(
+        self, job_id: uuid.UUID, offset: Optional[str], level: Level, limit: int
+    ) -> tuple[list[LogEntry], bool]:
+        """Read a page of the logs of the job from the log store.
+
+        Args:
+            job_id (uuid.UUID): A UUID job id.
+            offset (Optional[str]): The id of the last entry already read.
+            level (Level): The lowest severity level to return.
+            limit (int): The maximum number of entries to return.
+
+        Raises:
+            HTTPException: Raises a 400 if the offset is invalid.
+
+        Returns:
+            tuple[list[LogEntry], bool]: The entries, and whether there are more.
+        """
+        try:
+            return await run_in_threadpool(
+                self.log_store.read, job_id, offset, level, limit
+            )
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail=Error(
+                    code="OffsetInvalid",
+                    message=f"The offset {offset} is not the id of a log entry.",
+                ),
+            )
+
+    async def _stream_logs(
+        self,
+        request: Request,
+        job_id: uuid.UUID,
+        offset: Optional[str],
+        entries: list[LogEntry],
+        more: bool,
+        level: Level,
+        limit: int,
+    ):
+        """Stream the logs of the job as server-sent events, while the job is queued or running and the client is connected.
+
+        Args:
+            request (Request): The request, used to notice the client disconnecting.
+            job_id (uuid.UUID): A UUID job id.
+            offset (Optional[str]): The id of the last entry received before the first page.
+            entries (list[LogEntry]): The first page of entries.
+            more (bool): Whether there are more entries after the first page.
+            level (Level): The lowest severity level to return.
+            limit (int): The maximum number of entries read at once.
+
+        Yields:
+            str: The events, a log event per entry with the entry id as event id, and an end event with the status
+            of the job once it is neither queued nor running.
+        """
+        idle = 0.0
+        while True:
+            for entry in entries:
+                payload = json.dumps(jsonable_encoder(entry, exclude_none=True))
+                yield f"id: {entry.id}\nevent: log\ndata: {payload}\n\n"
+            if entries:
+                offset = entries[-1].id
+                idle = 0.0
+
+            if not more:
+                if await request.is_disconnected():
+                    return
+                await asyncio.sleep(self.settings.LOGS_POLL_INTERVAL)
+                idle += self.settings.LOGS_POLL_INTERVAL
+                if idle >= LOGS_KEEPALIVE_INTERVAL:
+                    idle = 0.0
+                    yield ": keepalive\n\n"
+
+                # The status is read before the logs, so the entries logged before the job ended are still sent.
+                job = await run_in_threadpool(get, get_model=Job, primary_key=job_id)
+                status = job.status if job else Status.canceled
+                entries, more = await self._read_logs(job_id, offset, level, limit)
+                if not entries and status not in ACTIVE_STATUSES:
+                    yield f"event: end\ndata: {status.value}\n\n"
+                    return
+            else:
+                entries, more = await self._read_logs(job_id, offset, level, limit)
+
+    async def logs(
+        self,
+        job_id: uuid.UUID,
+        request: Request,
+        offset: Optional[str] = None,
+        level: Level = Level.debug,
+        limit: Optional[int] = None,
+        user: User = Depends(Authenticator.validate),
+    ):
+        """Get the logs for the BatchJob, page by page.
+
+        Requests accepting text/event-stream get the logs as server-sent events instead, and are sent the new entries
+        while the job runs. The Last-Event-ID header continues a stream after the last entry received.
 
         Args:
             job_id (JobId): A UUID job id.
-            body (JobsRequest): The Job Request that should be used to create the new BatchJob.
+            request (Request): The request, with the Accept and Last-Event-ID headers.
+            offset (Optional[str]): The id of the last entry already received.
+            level (Level): The lowest severity level to return.
+            limit (Optional[int]): The maximum number of entries to return, at most the LOGS_PAGE_SIZE.
             user (User): The User returned from the Authenticator.
 
         Raises:
             HTTPException: Raises an exception with relevant status code and descriptive message of failure.
 
+        Returns:
+            JobsGetLogsResponse: The entries after the offset, with a next link if there are more.
         """
-        raise HTTPException(
-            status_code=501,
-            detail=Error(code="FeatureUnsupported", message="Feature not supported."),
-        )
+        job = await run_in_threadpool(self._get_user_job, job_id, user)
+        page_size = self.settings.LOGS_PAGE_SIZE
+        limit = min(limit, page_size) if limit and limit > 0 else page_size
+
+        if "text/event-stream" in request.headers.get("accept", ""):
+            offset = offset or request.headers.get("last-event-id")
+            entries, more = await self._read_logs(job.job_id, offset, level, limit)
+            return StreamingResponse(
+                self._stream_logs(
+                    request, job.job_id, offset, entries, more, level, limit
+                ),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
+
+        entries, more = await self._read_logs(job.job_id, offset, level, limit)
+
+        links = []
+        if more:
+            scheme = "https" if self.settings.API_TLS else "http"
+            query = urlencode(
+                {"offset": entries[-1].id, "level": level.value, "limit": limit}
+            )
+            links.append(
+                Link(
+                    rel="next",
+                    href=f"{scheme}://{self.settings.API_DNS}{self.settings.OPENEO_PREFIX}/jobs/{job.job_id}/logs?{query}",
+                )
+            )
+        return JobsGetLogsResponse(level=level, logs=entries, links=links)
 
     def get_results(
         self, job_id: uuid.UUID, user: User = Depends(Authenticator.validate)
@@ -327,22 +652,100 @@ class JobsRegister(EndpointRegister):
 
         Args:
             job_id (JobId): A UUID job id.
-            body (JobsRequest): The Job Request that should be used to create the new BatchJob.
             user (User): The User returned from the Authenticator.
 
         Raises:
             HTTPException: Raises an exception with relevant status code and descriptive message of failure.
 
+        Returns:
+            JSONResponse: A STAC Item with the result files as assets, with their sizes and checksums.
         """
-        raise HTTPException(
-            status_code=501,
-            detail=Error(code="FeatureUnsupported", message="Feature not supported."),
+        job = self._get_finished_job(job_id, user)
+
+        scheme = "https" if self.settings.API_TLS else "http"
+        results_url = f"{scheme}://{self.settings.API_DNS}{self.settings.OPENEO_PREFIX}/jobs/{job.job_id}/results"
+
+        created = job.created.strftime("%Y-%m-%dT%H:%M:%SZ")
+        properties = {"datetime": created, "created": created}
+        if job.title is not None:
+            properties["title"] = job.title
+        if job.description is not None:
+            properties["description"] = job.description
+
+        document = JobsGetResultsResponse(
+            stac_version=self.settings.STAC_VERSION,
+            stac_extensions=[STAC_FILE_EXTENSION],
+            id=str(job.job_id),
+            properties=properties,
+            assets={
+                asset.name: JobsResultAsset(
+                    href=f"{results_url}/{quote(asset.name)}",
+                    type=asset.media_type,
+                    title=asset.name,
+                    roles=asset.roles,
+                    file_size=asset.size,
+                    file_checksum=asset.checksum,
+                )
+                for asset in self.results.assets(job.job_id)
+            },
+            links=[Link(href=results_url, rel="self", type="application/json")],
+        )
+
+        content = jsonable_encoder(document, by_alias=True, exclude_none=True)
+        # A STAC Item always has a geometry, null as the footprint of the results is not known.
+        content["geometry"] = document.geometry
+        return JSONResponse(content=content)
+
+    def get_result_asset(
+        self,
+        job_id: uuid.UUID,
+        asset: str,
+        request: Request,
+        user: User = Depends(Authenticator.validate),
+    ):
+        """Download a result file of the BatchJob.
+
+        The file is streamed, and single byte ranges can be requested with the Range header.
+
+        Args:
+            job_id (JobId): A UUID job id.
+            asset (str): The path of the file relative to the results of the job.
+            request (Request): The request, with the Range and If-Range headers.
+            user (User): The User returned from the Authenticator.
+
+        Raises:
+            HTTPException: Raises an exception with relevant status code and descriptive message of failure.
+
+        Returns:
+            AssetResponse: The streamed file, or the requested range of it.
+        """
+        job = self._get_finished_job(job_id, user)
+
+        try:
+            result_asset = self.results.asset(job.job_id, asset)
+        except FileNotFoundError:
+            raise HTTPException(
+                status_code=404,
+                detail=Error(
+                    code="NotFound",
+                    message=f"The job {job_id} has no result {asset}.",
+                ),
+            )
+
+        return AssetResponse(
+            self.results,
+            job.job_id,
+            result_asset,
+            range_header=request.headers.get("range"),
+            if_range=request.headers.get("if-range"),
         )
 
     def start_job(
         self, job_id: uuid.UUID, user: User = Depends(Authenticator.validate)
     ):
-        """Start the processing for the BatchJob.
+        """Start the processing for the BatchJob, adding it to the queue.
+
+        Starting a job which is already queued or running has no effect.
 
         Args:
             job_id (JobId): A UUID job id.
@@ -352,16 +755,19 @@ class JobsRegister(EndpointRegister):
         Raises:
             HTTPException: Raises an exception with relevant status code and descriptive message of failure.
 
+        Returns:
+            Response: A general FastApi response to signify the job was queued.
         """
-        raise HTTPException(
-            status_code=501,
-            detail=Error(code="FeatureUnsupported", message="Feature not supported."),
-        )
+        job = self._get_user_job(job_id, user)
+        if job.status not in [Status.queued, Status.running]:
+            self.queue.enqueue(job)
+
+        return Response(status_code=202, content="The job was queued.")
 
     def cancel_job(
         self, job_id: uuid.UUID, user: User = Depends(Authenticator.validate)
     ):
-        """Cancel the processing of the BatchJob.
+        """Cancel the processing of the BatchJob, removing it from the queue.
 
         Args:
             job_id (JobId): A UUID job id.
@@ -370,11 +776,13 @@ class JobsRegister(EndpointRegister):
         Raises:
             HTTPException: Raises an exception with relevant status code and descriptive message of failure.
 
+        Returns:
+            Response: A general FastApi response to signify the job was canceled.
         """
-        raise HTTPException(
-            status_code=501,
-            detail=Error(code="FeatureUnsupported", message="Feature not supported."),
-        )
+        job = self._get_user_job(job_id, user)
+        self.queue.cancel(job.job_id)
+
+        return Response(status_code=204)
 
     def delete_job(
         self, job_id: uuid.UUID, user: User = Depends(Authenticator.validate)
@@ -395,22 +803,190 @@ class JobsRegister(EndpointRegister):
             detail=Error(code="FeatureUnsupported", message="Feature not supported."),
         )
 
-    def process_sync_job(
+    async def process_sync_job(
         self,
+        request: Request,
         body: JobsRequest = JobsRequest(),
         user: User = Depends(Authenticator.validate),
     ):
-        """Start the processing of a synchronous Job.
+        """Process a synchronous Job with the executor and return its result.
+
+        The processing is canceled if the client disconnects before the result is ready.
+
+        Args:
+            request (Request): The request, used to notice the client disconnecting.
+            body (JobsRequest): The Job Request with the process to run.
+            user (User): The User returned from the Authenticator.
+
+        Raises:
+            HTTPException: Raises an exception with relevant status code and descriptive message of failure.
+
+        Returns:
+            Response: The result of the processing.
+        """
+        if not self.executor:
+            raise HTTPException(
+                status_code=501,
+                detail=Error(
+                    code="FeatureUnsupported", message="Feature not supported."
+                ),
+            )
+
+        if not body.process:
+            raise HTTPException(
+                status_code=400,
+                detail=Error(
+                    code="ProcessGraphMissing",
+                    message="No valid process graph specified.",
+                ),
+            )
+
+        return await self.executor.run(
+            body.process.dict(exclude_none=True), request.is_disconnected
+        )
+
+
+class AsyncJobsRegister(JobsRegister):
+    """The JobsRegister with the database interactions made through the async engine, so they do not occupy the threadpool.
+
+    Example:
+    ```
+    client = OpenEOCore(..., jobs=AsyncJobsRegister(settings, links))
+    ```
+    """
+
+    async def list_jobs(
+        self,
+        limit: int = Query(10, ge=1, le=JOBS_PAGE_MAX_LIMIT),
+        token: Optional[str] = None,
+        user: User = Depends(Authenticator.validate),
+    ):
+        """List the user's most recent BatchJobs.
+
+        Args:
+            limit (int): The limit to apply to the length of the list, between 1 and JOBS_PAGE_MAX_LIMIT.
+            token (str): The pagination token from the next link of the previous page.
+            user (User): The User returned from the Authenticator.
+
+        Returns:
+            JobsGetResponse: A list of the user's BatchJobs.
+        """
+        job_list, more = await async_engine._list_page(
+            list_model=Job,
+            filter_with=self._page_filters(user),
+            order_by=JOBS_PAGE_ORDER,
+            limit=limit,
+            after=self._page_after(token),
+            columns=JOBS_LIST_COLUMNS,
+        )
+
+        return self._page_response(job_list, more, limit)
+
+    async def create_job(
+        self, body: JobsRequest, user: User = Depends(Authenticator.validate)
+    ):
+        """Create a new BatchJob.
 
         Args:
             body (JobsRequest): The Job Request that should be used to create the new BatchJob.
             user (User): The User returned from the Authenticator.
 
+        Returns:
+            Response: A general FastApi response to signify the changes where made as expected. Specific response
+            headers need to be set in this response to ensure certain behaviours when being used by OpenEO client modules.
+        """
+        job_id = uuid.uuid4()
+
+        if not body.process.id:
+            auto_name_size = 16
+            body.process.id = uuid.uuid4().hex[:auto_name_size].upper()
+
+        job = Job(
+            job_id=job_id,
+            process=body.process,
+            status=Status.created,
+            title=body.title,
+            description=body.description,
+            user_id=user.user_id,
+            created=datetime.datetime.now(),
+        )
+
+        try:
+            await async_engine.create(create_object=job)
+        except IntegrityError:
+            raise HTTPException(
+                status_code=500,
+                detail=Error(
+                    code="Internal", message=f"The job {job.job_id} already exists."
+                ),
+            )
+
+        return Response(
+            status_code=201,
+            headers={
+                "Location": f"{self.settings.API_DNS}{self.settings.OPENEO_PREFIX}/jobs/{job_id.__str__()}",
+                "OpenEO-Identifier": job_id.__str__(),
+                "access-control-allow-headers": "Accept-Ranges, Content-Encoding, Content-Range, Link, Location, OpenEO-Costs, OpenEO-Identifier",
+                "access-control-expose-headers": "Accept-Ranges, Content-Encoding, Content-Range, Link, Location, OpenEO-Costs, OpenEO-Identifier",
+            },
+        )
+
+    async def update_job(
+        self,
+        job_id: uuid.UUID,
+        body: JobsRequest,
+        user: User = Depends(Authenticator.validate),
+    ):
+        """Update the specified BatchJob with the contents of the provided JobsRequest.
+
+        Args:
+            job_id (JobId): A UUID job id.
+            body (JobsRequest): The Job Request that should be used to update the new BatchJob.
+            user (User): The User returned from the Authenticator.
+
         Raises:
             HTTPException: Raises an exception with relevant status code and descriptive message of failure.
 
+        Returns:
+            Response: A general FastApi response to signify the changes where made as expected.
         """
-        raise HTTPException(
-            status_code=501,
-            detail=Error(code="FeatureUnsupported", message="Feature not supported."),
+        modified = await async_engine.update(
+            update_model=Job, primary_key=job_id, values=self._patch_values(body)
         )
+        if not modified:
+            raise HTTPException(
+                status_code=404,
+                detail=Error(
+                    code="JobNotFound", message=f"No job found with id: {job_id}"
+                ),
+            )
+
+        return Response(
+            status_code=204, content="Changes to the job applied successfully."
+        )
+
+    async def get_job(
+        self, job_id: uuid.UUID, user: User = Depends(Authenticator.validate)
+    ):
+        """Get and return the metadata for the BatchJob.
+
+        Args:
+            job_id (JobId): A UUID job id.
+            user (User): The User returned from the Authenticator.
+
+        Raises:
+            HTTPException: Raises an exception with relevant status code and descriptive message of failure.
+
+        Returns:
+            BatchJob: The metadata for the requested BatchJob.
+        """
+        job = await async_engine.get(get_model=Job, primary_key=job_id)
+        if not job:
+            raise HTTPException(
+                status_code=404,
+                detail=Error(
+                    code="JobNotFound", message=f"No job found with id: {job_id}"
+                ),
+            )
+
+        return BatchJob(id=job.job_id.__str__(), **job.dict())
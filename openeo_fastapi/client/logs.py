@@ -0,0 +1,319 @@
+"""Classes to store the logs of batch jobs and read them page by page.
+
+Log entries are only ever appended. Each entry gets an id that increases with every entry of a job, and clients read
+the logs after the id of the last entry they received, so polling a running job only returns the new entries. Both the
+offset and the level filter are applied by the storage, so a page is read without going through the whole log.
+
+Classes:
+    - JobLogStore: Abstract log store used by the JobsRegister and by the processing of the jobs.
+    - PostgresJobLogStore: Logs stored in an append only table in the database.
+    - FileJobLogStore: Logs stored in a JSON lines file per job on the local disk.
+"""
+import datetime
+import json
+import os
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Union
+
+from sqlalchemy import delete as sa_delete
+from sqlalchemy import insert, select
+
+from openeo_fastapi.api.types import Level, LogEntry
+from openeo_fastapi.client.psql.engine import _read, get_session_factory
+from openeo_fastapi.client.psql.models import JobLogORM
+
+LEVEL_SEVERITY = {Level.error: 0, Level.warning: 1, Level.info: 2, Level.debug: 3}
+"""The severity of each level, from high to low, so a level filter selects the entries up to its severity."""
+SEVERITY_LEVEL = {severity: level for level, severity in LEVEL_SEVERITY.items()}
+
+
+def _entry_values(entry: dict) -> dict:
+    """Validate a new log entry and fill in its level severity and time."""
+    return {
+        "severity": LEVEL_SEVERITY[Level(entry["level"])],
+        "code": entry.get("code"),
+        "message": entry["message"],
+        "time": entry.get("time") or datetime.datetime.utcnow(),
+        "data": entry.get("data"),
+        "path": entry.get("path"),
+    }
+
+
+def _log_entry(entry_id: Any, values: dict) -> LogEntry:
+    """Create the LogEntry from the stored values of an entry."""
+    return LogEntry(
+        id=str(entry_id),
+        code=values.get("code"),
+        level=SEVERITY_LEVEL[values["severity"]],
+        message=values["message"],
+        time=values.get("time"),
+        data=values.get("data"),
+        path=values.get("path"),
+    )
+
+
+class JobLogStore(ABC):
+    """Abstract log store used by the JobsRegister to serve the logs, and by the processing of the jobs to write them."""
+
+    @abstractmethod
+    def append(self, job_id: uuid.UUID, entries: list[dict]) -> list[LogEntry]:
+        """Append entries to the logs of the job.
+
+        Args:
+            job_id (uuid.UUID): The job.
+            entries (list[dict]): The entries, with a level and message, and optionally a code, time, data and path.
+
+        Returns:
+            list[LogEntry]: The appended entries with their ids.
+        """
+
+    @abstractmethod
+    def read(
+        self,
+        job_id: uuid.UUID,
+        offset: Optional[str] = None,
+        level: Level = Level.debug,
+        limit: int = 1000,
+    ) -> tuple[list[LogEntry], bool]:
+        """Read a page of the logs of the job.
+
+        Args:
+            job_id (uuid.UUID): The job.
+            offset (Optional[str]): The id of the last entry already read, None to read from the start.
+            level (Level): The lowest severity level to return, e.g. warning returns the errors and warnings.
+            limit (int): The maximum number of entries to return.
+
+        Raises:
+            ValueError: If the offset is not an id of this store.
+
+        Returns:
+            tuple[list[LogEntry], bool]: The entries in the order they were logged, and whether there are more.
+        """
+
+    @abstractmethod
+    def delete(self, job_id: uuid.UUID):
+        """Delete the logs of the job.
+
+        Args:
+            job_id (uuid.UUID): The job.
+        """
+
+    def log(
+        self, job_id: uuid.UUID, level: Union[Level, str], message: str, **fields
+    ) -> LogEntry:
+        """Append a single entry to the logs of the job.
+
+        Args:
+            job_id (uuid.UUID): The job.
+            level (Union[Level, str]): The level of the entry.
+            message (str): The message of the entry.
+            **fields: The other fields of the entry, code, time, data and path.
+
+        Returns:
+            LogEntry: The appended entry with its id.
+        """
+        entries = self.append(job_id, [{"level": level, "message": message, **fields}])
+        return entries[0]
+
+
+class PostgresJobLogStore(JobLogStore):
+    """Logs stored in an append only table in the database.
+
+    The ids are taken from a sequence, a page is read with an index range scan starting after the offset. The logs of a
+    job should be written by a single process at a time, e.g. the worker running the job, so the ids are committed in
+    order and readers do not skip entries.
+    """
+
+    def append(self, job_id: uuid.UUID, entries: list[dict]) -> list[LogEntry]:
+        """Append entries to the logs of the job, in a single statement.
+
+        Args:
+            job_id (uuid.UUID): The job.
+            entries (list[dict]): The entries, with a level and message, and optionally a code, time, data and path.
+
+        Returns:
+            list[LogEntry]: The appended entries with their ids.
+        """
+        if not entries:
+            return []
+        values = [{"job_id": job_id, **_entry_values(entry)} for entry in entries]
+
+        db = get_session_factory()
+        with db.begin() as session:
+            ids = session.scalars(
+                insert(JobLogORM).returning(JobLogORM.id, sort_by_parameter_order=True),
+                values,
+            ).all()
+        return [_log_entry(entry_id, value) for entry_id, value in zip(ids, values)]
+
+    def read(
+        self,
+        job_id: uuid.UUID,
+        offset: Optional[str] = None,
+        level: Level = Level.debug,
+        limit: int = 1000,
+    ) -> tuple[list[LogEntry], bool]:
+        """Read a page of the logs of the job.
+
+        Args:
+            job_id (uuid.UUID): The job.
+            offset (Optional[str]): The id of the last entry already read, None to read from the start.
+            level (Level): The lowest severity level to return, e.g. warning returns the errors and warnings.
+            limit (int): The maximum number of entries to return.
+
+        Raises:
+            ValueError: If the offset is not an id of this store.
+
+        Returns:
+            tuple[list[LogEntry], bool]: The entries in the order they were logged, and whether there are more.
+        """
+        after = int(offset) if offset else 0
+        statement = (
+            select(JobLogORM)
+            .where(
+                JobLogORM.job_id == job_id,
+                JobLogORM.id > after,
+                JobLogORM.severity <= LEVEL_SEVERITY[Level(level)],
+            )
+            .order_by(JobLogORM.id)
+            .limit(limit + 1)
+        )
+
+        def read(db) -> list[LogEntry]:
+            with db.begin() as session:
+                return [
+                    _log_entry(row.id, row.__dict__)
+                    for row in session.scalars(statement)
+                ]
+
+        entries = _read(read)
+        return entries[:limit], len(entries) > limit
+
+    def delete(self, job_id: uuid.UUID):
+        """Delete the logs of the job.
+
+        Args:
+            job_id (uuid.UUID): The job.
+        """
+        db = get_session_factory()
+        with db.begin() as session:
+            session.execute(sa_delete(JobLogORM).where(JobLogORM.job_id == job_id))
+
+
+class FileJobLogStore(JobLogStore):
+    """Logs stored in a JSON lines file per job on the local disk.
+
+    The id of an entry is the position in the file after its line, so a page is read by seeking to the offset. The logs
+    of a job should be written by a single process at a time, e.g. the worker running the job.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """Initialize the FileJobLogStore.
+
+        Args:
+            directory (str): The directory the log files are written to, created if it does not exist.
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _path(self, job_id: uuid.UUID) -> str:
+        """The path of the log file of the job."""
+        return os.path.join(self.directory, f"{uuid.UUID(str(job_id))}.jsonl")
+
+    def append(self, job_id: uuid.UUID, entries: list[dict]) -> list[LogEntry]:
+        """Append entries to the logs of the job, in a single write.
+
+        Args:
+            job_id (uuid.UUID): The job.
+            entries (list[dict]): The entries, with a level and message, and optionally a code, time, data and path.
+
+        Returns:
+            list[LogEntry]: The appended entries with their ids.
+        """
+        if not entries:
+            return []
+        values = [_entry_values(entry) for entry in entries]
+        lines = [
+            (json.dumps({**value, "time": value["time"].isoformat()}) + "\n").encode()
+            for value in values
+        ]
+
+        with self._lock, open(self._path(job_id), "ab") as log_file:
+            position = log_file.seek(0, os.SEEK_END)
+            log_file.write(b"".join(lines))
+
+        appended = []
+        for value, line in zip(values, lines):
+            position += len(line)
+            appended.append(_log_entry(position, value))
+        return appended
+
+    def read(
+        self,
+        job_id: uuid.UUID,
+        offset: Optional[str] = None,
+        level: Level = Level.debug,
+        limit: int = 1000,
+    ) -> tuple[list[LogEntry], bool]:
+        """Read a page of the logs of the job.
+
+        Args:
+            job_id (uuid.UUID): The job.
+            offset (Optional[str]): The id of the last entry already read, None to read from the start.
+            level (Level): The lowest severity level to return, e.g. warning returns the errors and warnings.
+            limit (int): The maximum number of entries to return.
+
+        Raises:
+            ValueError: If the offset is not an id of this store.
+
+        Returns:
+            tuple[list[LogEntry], bool]: The entries in the order they were logged, and whether there are more.
+        """
+        position = int(offset) if offset else 0
+        if position < 0:
+            raise ValueError(offset)
+        severity = LEVEL_SEVERITY[Level(level)]
+
+        try:
+            log_file = open(self._path(job_id), "rb")
+        except FileNotFoundError:
+            if position:
+                raise ValueError(offset)
+            return [], False
+
+        entries = []
+        with log_file:
+            if position:
+                # The offset needs to be the end of a line.
+                log_file.seek(position - 1)
+                if log_file.read(1) != b"\n":
+                    raise ValueError(offset)
+
+            for line in log_file:
+                if not line.endswith(b"\n"):
+                    # The line is still being written.
+                    break
+                position += len(line)
+
+                values = json.loads(line)
+                if values["severity"] > severity:
+                    continue
+                if len(entries) == limit:
+                    return entries, True
+                values["time"] = datetime.datetime.fromisoformat(values["time"])
+                entries.append(_log_entry(position, values))
+        return entries, False
+
+    def delete(self, job_id: uuid.UUID):
+        """Delete the logs of the job.
+
+        Args:
+            job_id (uuid.UUID): The job.
+        """
+        try:
+            os.remove(self._path(job_id))
+        except FileNotFoundError:
+            pass
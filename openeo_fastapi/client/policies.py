@@ -0,0 +1,185 @@
+"""Class to compile and evaluate the OIDC policies used to authorize users.
+
+A policy is made of one or more conditions structured as "key, value". Conditions in the same policy are combined
+with ";" and all of them need to match. A user is authorized if any of the policies match.
+
+    - The key is the name of the claim in the user info, nested claims are reached with ".", e.g. "realm_access.roles".
+    - The value is checked for presence in the values found at the key location. A value ending with "*" matches any
+      value starting with the text before it, e.g. "urn:mace:egi.eu:group:vo.openeo.cloud:*".
+
+Classes:
+    - PolicyMatcher: The compiled form of a list of OIDC policies.
+"""
+import functools
+from typing import Any, Iterable
+
+CONDITION_SEPARATOR = ";"
+PREFIX_WILDCARD = "*"
+
+
+def parse_policy(policy: str) -> list[tuple[tuple[str, ...], str]]:
+    """Split a policy into its conditions.
+
+    Args:
+        policy (str): The policy.
+
+    Raises:
+        ValueError: If a condition is not structured as "key,value".
+
+    Returns:
+        list[tuple[tuple[str, ...], str]]: The claim path and value of each condition.
+    """
+    conditions = []
+    for condition in policy.replace(" ", "").split(CONDITION_SEPARATOR):
+        try:
+            key, value = condition.split(",")
+        except ValueError:
+            raise ValueError(
+                f"Policy '{policy}' contains too many comma seperated values."
+            )
+        if not key or not value:
+            raise ValueError(f"Policy '{policy}' is missing a key or value.")
+        conditions.append((tuple(key.split(".")), value))
+    return conditions
+
+
+def _has_claim(claims: dict, path: tuple[str, ...]) -> bool:
+    """Check if the claim path exists in the user info.
+
+    Args:
+        claims (dict): The user info.
+        path (tuple[str, ...]): The keys leading to the claim.
+
+    Returns:
+        bool: Whether each key along the path is present.
+    """
+    value: Any = claims
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return False
+        value = value[key]
+    return True
+
+
+def _claim_values(claims: dict, path: tuple[str, ...]) -> Iterable[str]:
+    """Get the values found at the claim path, as strings.
+
+    Args:
+        claims (dict): The user info.
+        path (tuple[str, ...]): The keys leading to the claim.
+
+    Returns:
+        Iterable[str]: The values of the claim, empty if the claim does not exist.
+    """
+    value: Any = claims
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return ()
+        value = value[key]
+
+    if not isinstance(value, (list, tuple, set)):
+        value = [value]
+
+    return [str(v).lower() if isinstance(v, bool) else str(v) for v in value]
+
+
+class PolicyMatcher:
+    """The compiled form of a list of OIDC policies.
+
+    Policies with a single condition are merged per claim path into a set of exact values and a tuple of prefixes,
+    so evaluating them is linear in the number of values the user has, not the number of policies.
+    """
+
+    def __init__(self, policies: Iterable[str]) -> None:
+        """Compile the policies.
+
+        Args:
+            policies (Iterable[str]): The policies.
+        """
+        exact: dict[tuple[str, ...], set] = {}
+        prefixes: dict[tuple[str, ...], list] = {}
+        groups = []
+
+        for policy in policies:
+            conditions = parse_policy(policy)
+            if len(conditions) == 1:
+                path, value = conditions[0]
+                if value.endswith(PREFIX_WILDCARD):
+                    prefixes.setdefault(path, []).append(value[:-1])
+                else:
+                    exact.setdefault(path, set()).add(value)
+            else:
+                groups.append(tuple(conditions))
+
+        self.exact = {path: frozenset(values) for path, values in exact.items()}
+        self.prefixes = {path: tuple(values) for path, values in prefixes.items()}
+        self.groups = tuple(groups)
+
+    @property
+    def paths(self) -> set[tuple[str, ...]]:
+        """The claim paths the policies depend on."""
+        paths = {*self.exact, *self.prefixes}
+        paths.update(path for group in self.groups for path, _ in group)
+        return paths
+
+    @property
+    def claims(self) -> set[str]:
+        """The top level claims the policies depend on."""
+        return {path[0] for path in self.paths}
+
+    def has_claims(self, claims: dict) -> bool:
+        """Check if the user info holds every claim the policies depend on, nested claims included.
+
+        Args:
+            claims (dict): The user info, e.g. the payload of an access token.
+
+        Returns:
+            bool: Whether the policies can be evaluated against the user info.
+        """
+        return all(_has_claim(claims, path) for path in self.paths)
+
+    @staticmethod
+    def _condition_matches(claims: dict, path: tuple[str, ...], value: str) -> bool:
+        """Check a single condition against the user info."""
+        if value.endswith(PREFIX_WILDCARD):
+            return any(v.startswith(value[:-1]) for v in _claim_values(claims, path))
+        return value in _claim_values(claims, path)
+
+    def matches(self, claims: dict) -> bool:
+        """Check if any of the policies match the user info.
+
+        Args:
+            claims (dict): The user info.
+
+        Returns:
+            bool: Whether the user is authorized.
+        """
+        for path, values in self.exact.items():
+            if not values.isdisjoint(_claim_values(claims, path)):
+                return True
+
+        for path, values in self.prefixes.items():
+            for value in _claim_values(claims, path):
+                if value.startswith(values):
+                    return True
+
+        for group in self.groups:
+            if all(
+                self._condition_matches(claims, path, value) for path, value in group
+            ):
+                return True
+
+        return False
+
+
+@functools.lru_cache(maxsize=32)
+def compile_policies(policies: tuple[str, ...]) -> PolicyMatcher:
+    """Get the compiled PolicyMatcher for the policies, compiling them only the first time.
+
+    Args:
+        policies (tuple[str, ...]): The policies.
+
+    Returns:
+        PolicyMatcher: The compiled policies.
+    """
+    return PolicyMatcher(policies)
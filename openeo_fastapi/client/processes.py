@@ -2,6 +2,7 @@
 
 Classes:
     - ProcessRegister: Framework for defining and extending the logic for working with Processes and Process Graphs.
+    - AsyncProcessRegister: ProcessRegister interacting with the database through the async engine.
 """
 
 import datetime
@@ -14,7 +15,6 @@ from fastapi import Depends, HTTPException, Response
 from openeo_pg_parser_networkx import Process as pgProcess
 from openeo_pg_parser_networkx import ProcessRegistry
 from pydantic import BaseModel
-from sqlalchemy.exc import IntegrityError
 
 from openeo_fastapi.api.models import (
     ProcessesGetResponse,
@@ -24,7 +24,8 @@ from openeo_fastapi.api.models import (
 )
 from openeo_fastapi.api.types import Endpoint, Error, Process
 from openeo_fastapi.client.auth import Authenticator, User
-from openeo_fastapi.client.psql.engine import Filter, _list, create, delete, get
+from openeo_fastapi.client.psql import async_engine
+from openeo_fastapi.client.psql.engine import Filter, _list, delete, get, upsert
 from openeo_fastapi.client.psql.models import UdpORM
 from openeo_fastapi.client.register import EndpointRegister
 
@@ -52,6 +53,16 @@ PROCESSES_ENDPOINTS = [
 ]
 
 
+UDP_LIST_COLUMNS = ["id", "summary", "description", "parameters", "returns"]
+UDP_REPLACE_COLUMNS = [
+    "process_graph",
+    "summary",
+    "description",
+    "parameters",
+    "returns",
+]
+
+
 class UserDefinedProcessGraph(BaseModel):
     """Pydantic model representing an OpenEO User Defined Process Graph."""
 
@@ -160,7 +171,11 @@ class ProcessRegister(EndpointRegister):
         """
         _filter = Filter(column_name="user_id", value=user.user_id)
 
-        udp_list = _list(list_model=UserDefinedProcessGraph, filter_with=_filter)
+        udp_list = _list(
+            list_model=UserDefinedProcessGraph,
+            filter_with=_filter,
+            columns=UDP_LIST_COLUMNS,
+        )
 
         udps = [ProcessGraphWithMetadata(**graph.dict()) for graph in udp_list]
 
@@ -228,16 +243,8 @@ class ProcessRegister(EndpointRegister):
             returns=body.returns,
         )
 
-        try:
-            create(create_object=udp)
-        except IntegrityError:
-            raise HTTPException(
-                status_code=500,
-                detail=Error(
-                    code="Internal",
-                    message=f"The user defined process graph {udp.id} already exists.",
-                ),
-            )
+        # Replace the process graph if it already exists, keeping when it was created.
+        upsert(upsert_object=udp, update_columns=UDP_REPLACE_COLUMNS)
 
         return Response(
             status_code=201,
@@ -331,3 +338,144 @@ class ProcessRegister(EndpointRegister):
                 ).json(),
             )
         return ValidationPostResponse(errors=[])
+
+
+class AsyncProcessRegister(ProcessRegister):
+    """The ProcessRegister with the database interactions made through the async engine, so they do not occupy the threadpool.
+
+    Example:
+    ```
+    client = OpenEOCore(..., processes=AsyncProcessRegister(links))
+    ```
+    """
+
+    async def list_user_process_graphs(
+        self, limit: Optional[int] = 10, user: User = Depends(Authenticator.validate)
+    ) -> Union[ProcessGraphsGetResponse, None]:
+        """
+        Lists all of a user's user-defined process graphs from the back-end.
+
+        Args:
+            limit (int): The limit to apply to the length of the list.
+            user (User): The User returned from the Authenticator.
+
+        Returns:
+            ProcessGraphsGetResponse: A list of the user's UserDefinedProcessGraph as a ProcessGraphWithMetadata.
+        """
+        _filter = Filter(column_name="user_id", value=user.user_id)
+
+        udp_list = await async_engine._list(
+            list_model=UserDefinedProcessGraph,
+            filter_with=_filter,
+            columns=UDP_LIST_COLUMNS,
+        )
+
+        udps = [ProcessGraphWithMetadata(**graph.dict()) for graph in udp_list]
+
+        return ProcessGraphsGetResponse(processes=udps, links=self.links)
+
+    async def get_user_process_graph(
+        self, process_graph_id: str, user: User = Depends(Authenticator.validate)
+    ) -> Union[ProcessGraphWithMetadata, None]:
+        """
+        Lists all information about a user-defined process, including its process graph.
+
+        Args:
+            process_graph_id (str): The process graph id.
+            user (User): The User returned from the Authenticator.
+
+        Raises:
+            HTTPException: Raises an exception with relevant status code and descriptive message of failure.
+
+        Returns:
+            ProcessGraphWithMetadata: Retruns the UserDefinedProcessGraph as a ProcessGraphWithMetadata.
+        """
+        graph = await async_engine.get(
+            get_model=UserDefinedProcessGraph,
+            primary_key=[process_graph_id, user.user_id],
+        )
+
+        if not graph:
+            raise HTTPException(
+                status_code=404,
+                detail=Error(
+                    code="ProcessGraphNotFound",
+                    message=f"No user defined process graph found with id: {process_graph_id}",
+                ),
+            )
+
+        return ProcessGraphWithMetadata(**graph.dict())
+
+    async def put_user_process_graph(
+        self,
+        process_graph_id: str,
+        body: ProcessGraphWithMetadata,
+        user: User = Depends(Authenticator.validate),
+    ):
+        """
+        Stores a provided user-defined process with process graph that can be reused in other processes.
+
+        Args:
+            process_graph_id (str): The process graph id.
+            body (ProcessGraphWithMetadata): The ProcessGraphWithMetadata should be used to create the new BatchJob.
+            user (User): The User returned from the Authenticator.
+
+        Raises:
+            HTTPException: Raises an exception with relevant status code and descriptive message of failure.
+
+        Returns:
+            Response: A general FastApi response to signify resource was created as expected.
+        """
+        udp = UserDefinedProcessGraph(
+            id=process_graph_id,
+            user_id=user.user_id,
+            process_graph=body.process_graph,
+            created=datetime.datetime.now(),
+            description=body.description,
+            parameters=body.parameters,
+            returns=body.returns,
+        )
+
+        # Replace the process graph if it already exists, keeping when it was created.
+        await async_engine.upsert(upsert_object=udp, update_columns=UDP_REPLACE_COLUMNS)
+
+        return Response(
+            status_code=201,
+            content="The user-defined process has been stored successfully. ",
+        )
+
+    async def delete_user_process_graph(
+        self, process_graph_id: str, user: User = Depends(Authenticator.validate)
+    ):
+        """
+        Deletes the data related to this user-defined process, including its process graph.
+
+        Args:
+            process_graph_id (str): The process graph id.
+            user (User): The User returned from the Authenticator.
+
+        Raises:
+            HTTPException: Raises an exception with relevant status code and descriptive message of failure.
+
+        Returns:
+            Response: A general FastApi response to signify resource was created as expected.
+        """
+        if await async_engine.get(
+            get_model=UserDefinedProcessGraph,
+            primary_key=[process_graph_id, user.user_id],
+        ):
+            await async_engine.delete(
+                delete_model=UserDefinedProcessGraph,
+                primary_key=[process_graph_id, user.user_id],
+            )
+            return Response(
+                status_code=204,
+                content="The user-defined process has been successfully deleted.",
+            )
+        raise HTTPException(
+            status_code=404,
+            detail=Error(
+                code="NotFound",
+                message=f"The requested resource {process_graph_id} was not found.",
+            ),
+        )
@@ -0,0 +1,582 @@
+"""Async counterpart of the psql engine, to interact with the ORMs and the database without blocking the event loop.
+
+The helpers mirror those in openeo_fastapi.client.psql.engine and use the asyncpg driver.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Optional, Union
+
+from pydantic import BaseModel
+from sqlalchemy import delete as sa_delete
+from sqlalchemy import insert, select
+from sqlalchemy import update as sa_update
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from openeo_fastapi.client.psql.engine import (
+    BULK_CHUNK_SIZE,
+    REPLICA_FAILURES,
+    Filter,
+    _bulk_users,
+    _bulk_values,
+    _chunks,
+    _database_url,
+    _filters_user,
+    _first_statement,
+    _insert_or_nothing_statement,
+    _page_statement,
+    _pool_args,
+    _primary_keys_criteria,
+    _select,
+    _to_models,
+    _update_statement,
+    _upsert_statement,
+    get_replica_router,
+)
+from openeo_fastapi.client.psql.models import configure_compression
+from openeo_fastapi.client.psql.settings import DataBaseSettings
+
+_async_engine: Optional[AsyncEngine] = None
+_async_engine_loop: Optional[asyncio.AbstractEventLoop] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+_async_replica_factories: Optional[list[async_sessionmaker]] = None
+
+
+def _server_settings(db_settings: DataBaseSettings) -> dict:
+    """Get the server settings asyncpg applies to every new connection.
+
+    Args:
+        db_settings (DataBaseSettings): The database settings.
+
+    Returns:
+        dict: The server settings.
+    """
+    server_settings = {"application_name": db_settings.POSTGRES_APPLICATION_NAME}
+    if db_settings.POSTGRES_STATEMENT_TIMEOUT is not None:
+        server_settings["statement_timeout"] = str(
+            db_settings.POSTGRES_STATEMENT_TIMEOUT
+        )
+    return server_settings
+
+
+def _create_async_engine(
+    db_settings: DataBaseSettings, host: Optional[str] = None
+) -> AsyncEngine:
+    """Create an async engine for the primary, or for one of the POSTGRESQL_REPLICA_HOSTS.
+
+    Args:
+        db_settings (DataBaseSettings): The database settings.
+        host (Optional[str]): A replica host, as "host" or "host:port", None for the primary.
+
+    Returns:
+        AsyncEngine: The engine.
+    """
+    return create_async_engine(
+        url=_database_url(db_settings, "postgresql+asyncpg", host),
+        connect_args={"server_settings": _server_settings(db_settings)},
+        **_pool_args(db_settings),
+    )
+
+
+def _async_engines() -> list[AsyncEngine]:
+    """Get the primary and replica async engines currently in use."""
+    if _async_engine is None:
+        return []
+    return [_async_engine] + [
+        factory.kw["bind"] for factory in _async_replica_factories or []
+    ]
+
+
+def _dispose_stale_engines(engines: list[AsyncEngine], loop: asyncio.AbstractEventLoop):
+    """Dispose the engines of an event loop which is no longer used by this module.
+
+    The connections can only be closed on the loop they were opened on. If that loop is still running they are closed
+    there, else the pools are only dereferenced, leaving the connections to be garbage collected.
+
+    Args:
+        engines (list[AsyncEngine]): The engines to dispose.
+        loop (asyncio.AbstractEventLoop): The event loop the engines were used on.
+    """
+    for engine in engines:
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(engine.dispose(), loop)
+        else:
+            engine.sync_engine.dispose(close=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    """Get the async engine using config from pydantic settings.
+
+    asyncpg connections belong to the event loop they were opened on, so the engine is created on first use for the
+    running event loop. The engines of the previous loop are disposed.
+
+    Returns:
+        AsyncEngine: The engine instance that was created.
+    """
+    global _async_engine, _async_engine_loop, _async_replica_factories
+
+    loop = asyncio.get_running_loop()
+    if _async_engine is not None and _async_engine_loop is loop:
+        return _async_engine
+
+    if _async_engine is not None:
+        _dispose_stale_engines(_async_engines(), _async_engine_loop)
+
+    db_settings = DataBaseSettings()
+    configure_compression(
+        db_settings.POSTGRES_COMPRESS_MIN_SIZE, db_settings.POSTGRES_COMPRESSION
+    )
+
+    _async_engine = _create_async_engine(db_settings)
+    _async_engine_loop = loop
+    _async_replica_factories = [
+        async_sessionmaker(
+            _create_async_engine(db_settings, host), expire_on_commit=False
+        )
+        for host in db_settings.POSTGRESQL_REPLICA_HOSTS
+    ]
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """Get the async session factory bound to the async engine, creating it only when the engine changes.
+
+    Returns:
+        async_sessionmaker: The session factory.
+    """
+    global _async_session_factory
+    engine = get_async_engine()
+    if (
+        _async_session_factory is None
+        or _async_session_factory.kw.get("bind") is not engine
+    ):
+        _async_session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    return _async_session_factory
+
+
+async def close_async_engine():
+    """Dispose the async engine. Intended to be called from the application shutdown hook."""
+    global _async_engine, _async_engine_loop, _async_session_factory, _async_replica_factories
+
+    if _async_engine_loop is asyncio.get_running_loop():
+        for engine in _async_engines():
+            await engine.dispose()
+    elif _async_engine is not None:
+        _dispose_stale_engines(_async_engines(), _async_engine_loop)
+    _async_engine = None
+    _async_engine_loop = None
+    _async_session_factory = None
+    _async_replica_factories = None
+
+
+async def _read(
+    read: Callable[[async_sessionmaker], Awaitable[Any]],
+    user_id: Optional[Any] = None,
+    retry_on_miss: bool = False,
+) -> Any:
+    """Run a read only operation on the next healthy replica, falling back to the primary.
+
+    The replicas are read with the async engines of the POSTGRESQL_REPLICA_HOSTS, their health and the read your
+    writes window are shared with the sync engine.
+
+    Args:
+        read (Callable[[async_sessionmaker], Awaitable[Any]]): The read, given the session factory to use.
+        user_id (Optional[Any]): The user the read is for, if known.
+        retry_on_miss (bool): Whether to read from the primary if nothing is found on a replica.
+
+    Returns:
+        Any: The result of the read.
+    """
+    primary = get_async_session_factory()
+    router = get_replica_router()
+
+    for index in router.candidates(user_id):
+        try:
+            found = await read(_async_replica_factories[index])
+        except REPLICA_FAILURES:
+            router.mark_unhealthy(index)
+            continue
+
+        if not found and retry_on_miss:
+            break
+        if isinstance(found, BaseModel) and router.recently_wrote(
+            getattr(found, "user_id", None)
+        ):
+            break
+        return found
+
+    return await read(primary)
+
+
+def _record_write(*user_ids: Any):
+    """Record the users whose entries were written, to serve their next reads from the primary."""
+    router = get_replica_router()
+    for user_id in set(user_ids):
+        router.record_write(user_id)
+
+
+async def create(create_object: BaseModel) -> bool:
+    """Add the values from a pydantic model to the database using its respective object relational mapping."""
+    db = get_async_session_factory()
+
+    orm = create_object.get_orm()(**create_object.dict())
+
+    async with db.begin() as session:
+        session.add(orm)
+    _record_write(getattr(create_object, "user_id", None))
+    return True
+
+
+async def get(get_model: BaseModel, primary_key: Any) -> Union[None, BaseModel]:
+    """Get the relevant entry for a given model using the provided primary key value.
+
+    Args:
+        get_model (BaseModel): The model that to get from the database.
+        primary_key (Any): The primary key of the model instance to get.
+
+    Returns:
+        Union[None, BaseModel]: None, or the found model
+    """
+
+    async def read(db: async_sessionmaker) -> Union[None, BaseModel]:
+        async with db.begin() as session:
+            if isinstance(primary_key, list):
+                found = await session.get(get_model.get_orm(), primary_key)
+            else:
+                found = await session.get(get_model.get_orm(), str(primary_key))
+
+            if not found:
+                return None
+            obj = get_model.from_orm(found)
+        return obj
+
+    return await _read(read, retry_on_miss=True)
+
+
+async def _list(
+    list_model: BaseModel,
+    filter_with: Filter,
+    columns: Optional[list[str]] = None,
+    retry_on_miss: bool = False,
+) -> list[BaseModel]:
+    """List all relevant entries for a given model for a given filter.
+
+    Args:
+        get_model (BaseModel): The model that to list from the database.
+        filter_with (Filter): Filter of a Key/Value pair to apply to the model.
+        columns (Optional[list[str]]): Only load these columns, leaving the other fields of the models unset.
+        retry_on_miss (bool): Whether to list from the primary if nothing is found on a replica.
+
+    Returns:
+        list[BaseModel]: A list of models found matching the filter.
+    """
+    if filter_with == None:
+        query_statement = _select(list_model, columns)
+    else:
+        query_statement = _select(list_model, columns).filter_by(
+            **{filter_with.column_name: filter_with.value}
+        )
+
+    async def read(db: async_sessionmaker) -> list[BaseModel]:
+        async with db.begin() as session:
+            result = await session.execute(query_statement)
+            found = _to_models(list_model, result, columns)
+        return found
+
+    return await _read(read, _filters_user(filter_with), retry_on_miss)
+
+
+async def _list_page(
+    list_model: BaseModel,
+    filter_with: list[Filter],
+    order_by: list[str],
+    limit: Optional[int],
+    after: Optional[list] = None,
+    descending: bool = True,
+    columns: Optional[list[str]] = None,
+) -> tuple[list[BaseModel], bool]:
+    """List a page of entries for a given model, filters and order, using keyset pagination.
+
+    Args:
+        list_model (BaseModel): The model to list from the database.
+        filter_with (list[Filter]): Filters of Key/Value pairs which all need to match.
+        order_by (list[str]): The columns to order by, which together need to be unique.
+        limit (Optional[int]): The number of entries in the page, None for all entries.
+        after (Optional[list]): The order_by values of the last entry of the previous page.
+        descending (bool): Whether the entries are ordered from the highest to the lowest values.
+        columns (Optional[list[str]]): Only load these columns, leaving the other fields of the models unset.
+
+    Returns:
+        tuple[list[BaseModel], bool]: The models in the page, and whether there is a next page.
+    """
+    query_statement = _page_statement(
+        list_model, filter_with, order_by, limit, after, descending, columns
+    )
+
+    async def read(db: async_sessionmaker) -> list[BaseModel]:
+        async with db.begin() as session:
+            result = await session.execute(query_statement)
+            found = _to_models(list_model, result, columns)
+        return found
+
+    found = await _read(read, _filters_user(filter_with))
+
+    if limit is not None and len(found) > limit:
+        return found[:limit], True
+    return found, False
+
+
+async def update(
+    update_model: BaseModel, primary_key: Any, values: dict
+) -> Union[None, BaseModel]:
+    """Update only the given columns of an entry in a single statement.
+
+    Args:
+        update_model (BaseModel): The model to update in the database.
+        primary_key (Any): The primary key of the model instance to update.
+        values (dict): The new values of the columns to update.
+
+    Returns:
+        Union[None, BaseModel]: None if no entry has the primary key, else the updated model.
+    """
+    db = get_async_session_factory()
+
+    async with db.begin() as session:
+        result = await session.scalars(
+            _update_statement(update_model, primary_key, values)
+        )
+        found = result.one_or_none()
+
+        if not found:
+            return None
+        obj = update_model.from_orm(found)
+    _record_write(getattr(obj, "user_id", None))
+    return obj
+
+
+async def upsert(
+    upsert_object: BaseModel, update_columns: Optional[list[str]] = None
+) -> bool:
+    """Insert the values from a pydantic model, or update the existing entry with the same primary key.
+
+    Args:
+        upsert_object (BaseModel): An instance of a pydantic model to store in the database.
+        update_columns (Optional[list[str]]): The columns to update if the entry exists, None for all columns.
+
+    Returns:
+        bool: Whether the change was successful.
+    """
+    db = get_async_session_factory()
+
+    async with db.begin() as session:
+        await session.execute(_upsert_statement(upsert_object, update_columns))
+    _record_write(getattr(upsert_object, "user_id", None))
+    return True
+
+
+async def get_or_create(create_object: BaseModel, unique_column: str) -> BaseModel:
+    """Get the entry with the same value in a unique column as the pydantic model, creating it if there is none.
+
+    Args:
+        create_object (BaseModel): An instance of a pydantic model to store in the database if there is no entry.
+        unique_column (str): The unique column to look the entry up by.
+
+    Returns:
+        BaseModel: The existing or created model.
+    """
+    model = type(create_object)
+    statement = _first_statement(
+        model, unique_column, getattr(create_object, unique_column)
+    )
+
+    async def read(db: async_sessionmaker) -> Union[None, BaseModel]:
+        async with db.begin() as session:
+            found = (await session.scalars(statement)).first()
+            return model.from_orm(found) if found else None
+
+    found = await _read(read, retry_on_miss=True)
+    if found:
+        return found
+
+    db = get_async_session_factory()
+
+    async with db.begin() as session:
+        created = (
+            await session.scalars(_insert_or_nothing_statement(create_object))
+        ).first()
+        if created is None:
+            # Another call stored the entry since it was looked up.
+            created = (await session.scalars(statement)).one()
+        obj = model.from_orm(created)
+    _record_write(getattr(obj, "user_id", None))
+    return obj
+
+
+async def modify(modify_object: BaseModel) -> bool:
+    """Modify the relevant entries for a given model instance
+
+    Args:
+        modify_object (BaseModel): An instance of a pydantic model that reflects a change to make in the database.
+
+    Returns:
+        bool: Whether the change was successful.
+    """
+    db = get_async_session_factory()
+
+    async with db.begin() as session:
+        await session.merge(modify_object.get_orm()(**modify_object.dict()))
+    _record_write(getattr(modify_object, "user_id", None))
+    return True
+
+
+async def delete(delete_model: BaseModel, primary_key: Any) -> bool:
+    """Delete the values from a pydantic model in the database using its respective object relational mapping.
+
+    Args:
+        delete_model (BaseModel): The model that to delete from the database.
+        primary_key (Any): The primary key of the model instance to delete.
+
+    Returns:
+        bool: Whether the change was successful.
+    """
+    db = get_async_session_factory()
+
+    async with db.begin() as session:
+        if isinstance(primary_key, list):
+            delete_obj = await session.get(delete_model.get_orm(), primary_key)
+        else:
+            delete_obj = await session.get(delete_model.get_orm(), str(primary_key))
+
+        await session.delete(delete_obj)
+    _record_write(getattr(delete_obj, "user_id", None))
+    return True
+
+
+async def get_first_or_default(get_model: BaseModel, filter_with: Filter) -> BaseModel:
+    """Perform a list operation and return the first found instance.
+
+    Args:
+        get_model (BaseModel): The model that to get from the database.
+        filter_with (Filter): Filter of a Key/Value pair to apply to the model.
+
+    Returns:
+        Union[None, BaseModel]: Return the model if found, else return None.
+    """
+    user_exists = await _list(
+        filter_with=filter_with, list_model=get_model, retry_on_miss=True
+    )
+    if user_exists:
+        return user_exists[0]
+    return None
+
+
+async def bulk_create(
+    create_objects: list[BaseModel], chunk_size: int = BULK_CHUNK_SIZE
+) -> bool:
+    """Add the values from many instances of a pydantic model to the database in a single transaction.
+
+    Args:
+        create_objects (list[BaseModel]): Instances of the same pydantic model to add to the database.
+        chunk_size (int): The maximum number of rows per statement.
+
+    Returns:
+        bool: Whether the change was successful.
+    """
+    if not create_objects:
+        return True
+
+    orm = create_objects[0].get_orm()
+    db = get_async_session_factory()
+
+    async with db.begin() as session:
+        for chunk in _chunks(_bulk_values(create_objects), chunk_size):
+            await session.execute(insert(orm), chunk)
+    _record_write(*_bulk_users(create_objects))
+    return True
+
+
+async def bulk_get(
+    get_model: BaseModel, primary_keys: list, chunk_size: int = BULK_CHUNK_SIZE
+) -> list[BaseModel]:
+    """Get the entries of a given model for many primary key values.
+
+    Args:
+        get_model (BaseModel): The model to get from the database.
+        primary_keys (list): The primary keys of the model instances to get, lists of values for composite keys.
+        chunk_size (int): The maximum number of primary keys per IN list.
+
+    Returns:
+        list[BaseModel]: The models found, primary keys without an entry are skipped.
+    """
+    orm = get_model.get_orm()
+
+    async def read(db: async_sessionmaker) -> list[BaseModel]:
+        found = []
+        async with db.begin() as session:
+            for chunk in _chunks(primary_keys, chunk_size):
+                result = await session.scalars(
+                    select(orm).where(_primary_keys_criteria(orm, chunk))
+                )
+                found.extend(get_model.from_orm(entry) for entry in result)
+        return found
+
+    return await _read(read)
+
+
+async def bulk_modify(
+    modify_objects: list[BaseModel],
+    columns: Optional[list[str]] = None,
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> bool:
+    """Modify the existing entries for many instances of a pydantic model in a single transaction.
+
+    Args:
+        modify_objects (list[BaseModel]): Instances of the same pydantic model that reflect the changes to make.
+        columns (Optional[list[str]]): Only update these columns, None for all columns.
+        chunk_size (int): The maximum number of rows per statement.
+
+    Returns:
+        bool: Whether the change was successful.
+    """
+    if not modify_objects:
+        return True
+
+    orm = modify_objects[0].get_orm()
+    db = get_async_session_factory()
+
+    async with db.begin() as session:
+        for chunk in _chunks(_bulk_values(modify_objects, columns), chunk_size):
+            await session.execute(sa_update(orm), chunk)
+    _record_write(*_bulk_users(modify_objects))
+    return True
+
+
+async def bulk_delete(
+    delete_model: BaseModel, primary_keys: list, chunk_size: int = BULK_CHUNK_SIZE
+) -> bool:
+    """Delete the entries of a given model for many primary key values in a single transaction.
+
+    Args:
+        delete_model (BaseModel): The model to delete from the database.
+        primary_keys (list): The primary keys of the model instances to delete, lists of values for composite keys.
+        chunk_size (int): The maximum number of primary keys per IN list.
+
+    Returns:
+        bool: Whether the change was successful.
+    """
+    orm = delete_model.get_orm()
+    db = get_async_session_factory()
+
+    deleted = sa_delete(orm)
+    if hasattr(orm, "user_id"):
+        deleted = deleted.returning(orm.user_id)
+
+    user_ids = []
+    async with db.begin() as session:
+        for chunk in _chunks(primary_keys, chunk_size):
+            result = await session.execute(
+                deleted.where(_primary_keys_criteria(orm, chunk)),
+                execution_options={"synchronize_session": False},
+            )
+            if hasattr(orm, "user_id"):
+                user_ids.extend(result.scalars())
+    _record_write(*user_ids)
+    return True
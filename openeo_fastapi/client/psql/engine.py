@@ -1,14 +1,99 @@
 """Standardisation of common functionality to interact with the ORMs and the database.
 """
-from typing import Any, Union
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
 
 from pydantic import BaseModel
-from sqlalchemy import create_engine, select
+from sqlalchemy import Result, Select, create_engine
+from sqlalchemy import delete as sa_delete
+from sqlalchemy import event, insert, inspect, select, tuple_
+from sqlalchemy import update as sa_update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import InterfaceError, OperationalError
 from sqlalchemy.orm import sessionmaker
 
+from openeo_fastapi.client.psql.models import configure_compression
+from openeo_fastapi.client.psql.replicas import ReplicaRouter
 from openeo_fastapi.client.psql.settings import DataBaseSettings
 
+BULK_CHUNK_SIZE = 1000
+REPLICA_FAILURES = (OperationalError, InterfaceError, OSError)
+
 _engine = None
+_session_factory = None
+_replicas = None
+_replica_router = None
+_pool_events = {"connects": 0, "checkouts": 0, "checkins": 0, "invalidations": 0}
+
+
+def _database_url(
+    db_settings: DataBaseSettings, dialect: str, host: Optional[str] = None
+) -> str:
+    """Get the database url for the dialect and driver.
+
+    Args:
+        db_settings (DataBaseSettings): The database settings.
+        dialect (str): The SQLAlchemy dialect and driver, e.g. "postgresql" or "postgresql+asyncpg".
+        host (Optional[str]): A replica host, as "host" or "host:port", None for the primary.
+
+    Returns:
+        str: The database url.
+    """
+    if host is None:
+        host = db_settings.POSTGRESQL_HOST._secret_value
+    if ":" not in host:
+        host = f"{host}:{db_settings.POSTGRESQL_PORT._secret_value}"
+
+    return "{}://{}:{}@{}/{}".format(
+        dialect,
+        db_settings.POSTGRES_USER._secret_value,
+        db_settings.POSTGRES_PASSWORD._secret_value,
+        host,
+        db_settings.POSTGRES_DB._secret_value,
+    )
+
+
+def _pool_args(db_settings: DataBaseSettings) -> dict:
+    """Get the connection pool arguments for the engine.
+
+    Args:
+        db_settings (DataBaseSettings): The database settings.
+
+    Returns:
+        dict: The connection pool arguments.
+    """
+    return {
+        "pool_size": db_settings.POSTGRES_POOL_SIZE,
+        "max_overflow": db_settings.POSTGRES_MAX_OVERFLOW,
+        "pool_timeout": db_settings.POSTGRES_POOL_TIMEOUT,
+        "pool_pre_ping": db_settings.POSTGRES_POOL_PRE_PING,
+        "pool_recycle": db_settings.POSTGRES_POOL_RECYCLE,
+    }
+
+
+def _connect_args(db_settings: DataBaseSettings) -> dict:
+    """Get the arguments passed to the driver for every new connection.
+
+    Args:
+        db_settings (DataBaseSettings): The database settings.
+
+    Returns:
+        dict: The connection arguments.
+    """
+    connect_args = {"application_name": db_settings.POSTGRES_APPLICATION_NAME}
+    if db_settings.POSTGRES_STATEMENT_TIMEOUT is not None:
+        connect_args[
+            "options"
+        ] = f"-c statement_timeout={db_settings.POSTGRES_STATEMENT_TIMEOUT}"
+    return connect_args
+
+
+def _count_pool_event(name: str):
+    """Get a pool event listener incrementing the counter for the event."""
+
+    def listener(*args):
+        _pool_events[name] += 1
+
+    return listener
 
 
 # TODO Refactor this module to be a class that can work with different SQL Backends.
@@ -18,24 +103,109 @@ def get_engine():
     Returns:
         Engine: The engine instance that was created.
     """
-    global _engine
+    global _engine, _replicas, _replica_router
     if _engine is not None:
         return _engine
 
     db_settings = DataBaseSettings()
+    configure_compression(
+        db_settings.POSTGRES_COMPRESS_MIN_SIZE, db_settings.POSTGRES_COMPRESSION
+    )
 
     _engine = create_engine(
-        url="postgresql://{}:{}@{}:{}/{}".format(
-            db_settings.POSTGRES_USER._secret_value,
-            db_settings.POSTGRES_PASSWORD._secret_value,
-            db_settings.POSTGRESQL_HOST._secret_value,
-            db_settings.POSTGRESQL_PORT._secret_value,
-            db_settings.POSTGRES_DB._secret_value,
-        )
+        url=_database_url(db_settings, "postgresql"),
+        connect_args=_connect_args(db_settings),
+        **_pool_args(db_settings),
     )
+    _replicas = None
+    _replica_router = None
+
+    for name in _pool_events:
+        _pool_events[name] = 0
+    event.listen(_engine, "connect", _count_pool_event("connects"))
+    event.listen(_engine, "checkout", _count_pool_event("checkouts"))
+    event.listen(_engine, "checkin", _count_pool_event("checkins"))
+    event.listen(_engine, "invalidate", _count_pool_event("invalidations"))
     return _engine
 
 
+def get_session_factory() -> sessionmaker:
+    """Get the session factory bound to the engine, creating it only when the engine changes.
+
+    Returns:
+        sessionmaker: The session factory.
+    """
+    global _session_factory
+    engine = get_engine()
+    if _session_factory is None or _session_factory.kw.get("bind") is not engine:
+        _session_factory = sessionmaker(engine)
+    return _session_factory
+
+
+def get_pool_status() -> dict:
+    """Get the current state of the connection pool and the counts of its events since the engine was created.
+
+    Returns:
+        dict: The pool size, the connections checked in, checked out and in overflow, and the event counters.
+    """
+    pool = get_engine().pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        **_pool_events,
+    }
+
+
+def get_replica_router() -> ReplicaRouter:
+    """Get the replica router, shared by the sync and async engines, creating it on first use.
+
+    Returns:
+        ReplicaRouter: The router for the POSTGRESQL_REPLICA_HOSTS.
+    """
+    global _replica_router
+    if _replica_router is not None:
+        return _replica_router
+
+    db_settings = DataBaseSettings()
+    _replica_router = ReplicaRouter(
+        replica_count=len(db_settings.POSTGRESQL_REPLICA_HOSTS),
+        retry_after=db_settings.POSTGRES_REPLICA_RETRY_AFTER,
+        read_your_writes=db_settings.POSTGRES_READ_YOUR_WRITES,
+    )
+    return _replica_router
+
+
+def get_replicas() -> tuple[ReplicaRouter, list[sessionmaker]]:
+    """Get the replica router and a session factory for each replica, creating them with the engine.
+
+    Returns:
+        tuple[ReplicaRouter, list[sessionmaker]]: The router, and the session factories in the order of the hosts.
+    """
+    global _replicas
+    get_engine()
+    if _replicas is not None:
+        return _replicas
+
+    db_settings = DataBaseSettings()
+    hosts = db_settings.POSTGRESQL_REPLICA_HOSTS
+
+    router = get_replica_router()
+    factories = [
+        sessionmaker(
+            create_engine(
+                url=_database_url(db_settings, "postgresql", host),
+                connect_args=_connect_args(db_settings),
+                **_pool_args(db_settings),
+            )
+        )
+        for host in hosts
+    ]
+    _replicas = (router, factories)
+    return _replicas
+
+
 class Filter(BaseModel):
     """Filter class to assist with providing a filter by funciton with values across different cases."""
 
@@ -43,14 +213,71 @@ class Filter(BaseModel):
     value: Any
 
 
+def _filters_user(filter_with: Union[None, Filter, list[Filter]]) -> Optional[Any]:
+    """Get the user the filters are restricted to, if any."""
+    if isinstance(filter_with, Filter):
+        filter_with = [filter_with]
+    for _filter in filter_with or []:
+        if _filter.column_name == "user_id":
+            return _filter.value
+    return None
+
+
+def _read(
+    read: Callable[[sessionmaker], Any],
+    user_id: Optional[Any] = None,
+    retry_on_miss: bool = False,
+) -> Any:
+    """Run a read only operation on the next healthy replica, falling back to the primary.
+
+    Replicas that fail are skipped until the POSTGRES_REPLICA_RETRY_AFTER seconds have passed. The read goes to the
+    primary if the user wrote within the read your writes window, or if the found model belongs to such a user.
+
+    Args:
+        read (Callable[[sessionmaker], Any]): The read, given the session factory to use.
+        user_id (Optional[Any]): The user the read is for, if known.
+        retry_on_miss (bool): Whether to read from the primary if nothing is found on a replica, as the entry might
+            not have been replicated yet.
+
+    Returns:
+        Any: The result of the read.
+    """
+    router, factories = get_replicas()
+
+    for index in router.candidates(user_id):
+        try:
+            found = read(factories[index])
+        except REPLICA_FAILURES:
+            router.mark_unhealthy(index)
+            continue
+
+        if not found and retry_on_miss:
+            break
+        if isinstance(found, BaseModel) and router.recently_wrote(
+            getattr(found, "user_id", None)
+        ):
+            break
+        return found
+
+    return read(get_session_factory())
+
+
+def _record_write(*user_ids: Any):
+    """Record the users whose entries were written, to serve their next reads from the primary."""
+    router = get_replica_router()
+    for user_id in set(user_ids):
+        router.record_write(user_id)
+
+
 def create(create_object: BaseModel) -> bool:
     """Add the values from a pydantic model to the database using its respective object relational mapping."""
-    db = sessionmaker(get_engine())
+    db = get_session_factory()
 
     orm = create_object.get_orm()(**create_object.dict())
 
     with db.begin() as session:
         session.add(orm)
+    _record_write(getattr(create_object, "user_id", None))
     return True
 
 
@@ -64,43 +291,371 @@ def get(get_model: BaseModel, primary_key: Any) -> Union[None, BaseModel]:
     Returns:
         Union[None, BaseModel]: None, or the found model
     """
-    db = sessionmaker(get_engine())
 
-    with db.begin() as session:
-        if isinstance(primary_key, list):
-            found = session.get(get_model.get_orm(), primary_key)
-        else:
-            found = session.get(get_model.get_orm(), str(primary_key))
+    def read(db: sessionmaker) -> Union[None, BaseModel]:
+        with db.begin() as session:
+            if isinstance(primary_key, list):
+                found = session.get(get_model.get_orm(), primary_key)
+            else:
+                found = session.get(get_model.get_orm(), str(primary_key))
 
-        if not found:
-            return None
-        obj = get_model.from_orm(found)
-    return obj
+            if not found:
+                return None
+            obj = get_model.from_orm(found)
+        return obj
 
+    return _read(read, retry_on_miss=True)
+
+
+def _select(list_model: BaseModel, columns: Optional[list[str]] = None) -> Select:
+    """Prepare the select statement for a model, or only some of its columns.
+
+    Args:
+        list_model (BaseModel): The model to select from the database.
+        columns (Optional[list[str]]): The columns to select, None for the full entity.
+
+    Returns:
+        Select: The select statement.
+    """
+    orm = list_model.get_orm()
+    if columns is None:
+        return select(orm)
+    return select(*[getattr(orm, column) for column in columns])
+
+
+def _to_models(
+    list_model: BaseModel, result: Result, columns: Optional[list[str]] = None
+) -> list[BaseModel]:
+    """Create the models from the result of a statement prepared with _select.
+
+    Models of projected columns are constructed without validation, and only have the selected fields set.
+
+    Args:
+        list_model (BaseModel): The model to create.
+        result (Result): The result of the statement.
+        columns (Optional[list[str]]): The columns that were selected, None for the full entity.
+
+    Returns:
+        list[BaseModel]: The models.
+    """
+    if columns is None:
+        return [list_model.from_orm(obj) for obj in result.scalars()]
+    return [list_model.construct(**row._mapping) for row in result]
 
-def _list(list_model: BaseModel, filter_with: Filter) -> list[BaseModel]:
+
+def _list(
+    list_model: BaseModel,
+    filter_with: Filter,
+    columns: Optional[list[str]] = None,
+    retry_on_miss: bool = False,
+) -> list[BaseModel]:
     """List all relevant entries for a given model for a given filter.
 
     Args:
         get_model (BaseModel): The model that to list from the database.
         filter_with (Filter): Filter of a Key/Value pair to apply to the model.
+        columns (Optional[list[str]]): Only load these columns, leaving the other fields of the models unset.
+        retry_on_miss (bool): Whether to list from the primary if nothing is found on a replica.
 
     Returns:
         list[BaseModel]: A list of models found matching the filter.
     """
-    db = sessionmaker(get_engine())
+    # Sessions API has no list function, so prepare the statement with select and apply to scalar.
+    if filter_with == None:
+        query_statement = _select(list_model, columns)
+    else:
+        query_statement = _select(list_model, columns).filter_by(
+            **{filter_with.column_name: filter_with.value}
+        )
+
+    def read(db: sessionmaker) -> list[BaseModel]:
+        with db.begin() as session:
+            found = _to_models(list_model, session.execute(query_statement), columns)
+        return found
+
+    return _read(read, _filters_user(filter_with), retry_on_miss)
+
+
+def _page_statement(
+    list_model: BaseModel,
+    filter_with: list[Filter],
+    order_by: list[str],
+    limit: Optional[int],
+    after: Optional[list] = None,
+    descending: bool = True,
+    columns: Optional[list[str]] = None,
+) -> Select:
+    """Prepare the statement for a page of entries, using keyset pagination.
+
+    Args:
+        list_model (BaseModel): The model to list from the database.
+        filter_with (list[Filter]): Filters of Key/Value pairs which all need to match.
+        order_by (list[str]): The columns to order by, which together need to be unique.
+        limit (Optional[int]): The number of entries in the page, None for all entries.
+        after (Optional[list]): The order_by values of the last entry of the previous page.
+        descending (bool): Whether the entries are ordered from the highest to the lowest values.
+        columns (Optional[list[str]]): The columns to select, None for the full entity.
+
+    Returns:
+        Select: The statement selecting one more entry than the limit, to tell if there is a next page.
+    """
+    orm = list_model.get_orm()
+    order_columns = [getattr(orm, column) for column in order_by]
+
+    query_statement = _select(list_model, columns).filter_by(
+        **{_filter.column_name: _filter.value for _filter in filter_with}
+    )
+    if after is not None:
+        keyset = tuple_(*order_columns)
+        query_statement = query_statement.where(
+            keyset < tuple_(*after) if descending else keyset > tuple_(*after)
+        )
+    query_statement = query_statement.order_by(
+        *[column.desc() if descending else column.asc() for column in order_columns]
+    )
+    if limit is not None:
+        query_statement = query_statement.limit(limit + 1)
+    return query_statement
+
+
+def _list_page(
+    list_model: BaseModel,
+    filter_with: list[Filter],
+    order_by: list[str],
+    limit: Optional[int],
+    after: Optional[list] = None,
+    descending: bool = True,
+    columns: Optional[list[str]] = None,
+) -> tuple[list[BaseModel], bool]:
+    """List a page of entries for a given model, filters and order, using keyset pagination.
+
+    Args:
+        list_model (BaseModel): The model to list from the database.
+        filter_with (list[Filter]): Filters of Key/Value pairs which all need to match.
+        order_by (list[str]): The columns to order by, which together need to be unique.
+        limit (Optional[int]): The number of entries in the page, None for all entries.
+        after (Optional[list]): The order_by values of the last entry of the previous page.
+        descending (bool): Whether the entries are ordered from the highest to the lowest values.
+        columns (Optional[list[str]]): Only load these columns, leaving the other fields of the models unset.
+
+    Returns:
+        tuple[list[BaseModel], bool]: The models in the page, and whether there is a next page.
+    """
+    query_statement = _page_statement(
+        list_model, filter_with, order_by, limit, after, descending, columns
+    )
+
+    def read(db: sessionmaker) -> list[BaseModel]:
+        with db.begin() as session:
+            found = _to_models(list_model, session.execute(query_statement), columns)
+        return found
+
+    found = _read(read, _filters_user(filter_with))
+
+    if limit is not None and len(found) > limit:
+        return found[:limit], True
+    return found, False
+
+
+def _primary_key_criteria(orm: Any, primary_key: Any) -> list:
+    """The criteria matching the primary key value, or list of values for composite primary keys."""
+    values = primary_key if isinstance(primary_key, list) else [primary_key]
+    return [
+        column == value
+        for column, value in zip(inspect(orm).primary_key, values, strict=True)
+    ]
+
+
+def _chunks(items: Iterable, chunk_size: int) -> Iterator[list]:
+    """Split the items into lists of at most chunk_size items."""
+    items = list(items)
+    for start in range(0, len(items), chunk_size):
+        yield items[start : start + chunk_size]
+
+
+def _primary_keys_criteria(orm: Any, primary_keys: list) -> Any:
+    """The criteria matching any of the primary key values, or lists of values for composite primary keys."""
+    columns = inspect(orm).primary_key
+    if len(columns) == 1:
+        return columns[0].in_(primary_keys)
+    return tuple_(*columns).in_([tuple(values) for values in primary_keys])
+
+
+def _bulk_values(
+    bulk_objects: list[BaseModel], columns: Optional[list[str]] = None
+) -> list[dict]:
+    """The values of the pydantic models, restricted to the primary key and the given columns.
+
+    Args:
+        bulk_objects (list[BaseModel]): Instances of the same pydantic model.
+        columns (Optional[list[str]]): The columns to include besides the primary key, None for all columns.
+
+    Returns:
+        list[dict]: The values of each model.
+    """
+    if columns is None:
+        return [bulk_object.dict() for bulk_object in bulk_objects]
+
+    primary_key = [
+        column.name for column in inspect(bulk_objects[0].get_orm()).primary_key
+    ]
+    include = {*primary_key, *columns}
+    return [bulk_object.dict(include=include) for bulk_object in bulk_objects]
+
+
+def _bulk_users(bulk_objects: list[BaseModel]) -> list:
+    """The users of the pydantic models, for those that have one."""
+    return [getattr(bulk_object, "user_id", None) for bulk_object in bulk_objects]
+
+
+def _update_statement(update_model: BaseModel, primary_key: Any, values: dict):
+    """Prepare the statement updating only the given columns of an entry, returning the updated entry.
+
+    Args:
+        update_model (BaseModel): The model to update in the database.
+        primary_key (Any): The primary key of the model instance to update.
+        values (dict): The new values of the columns to update.
+
+    Returns:
+        Update: The update statement, or a select statement if there are no values to update.
+    """
+    orm = update_model.get_orm()
+    criteria = _primary_key_criteria(orm, primary_key)
+    if not values:
+        return select(orm).where(*criteria)
+    return sa_update(orm).where(*criteria).values(**values).returning(orm)
+
+
+def _upsert_statement(upsert_object: BaseModel, update_columns: Optional[list[str]]):
+    """Prepare the statement inserting an entry, or updating it if an entry with the primary key exists.
+
+    Args:
+        upsert_object (BaseModel): An instance of a pydantic model to store in the database.
+        update_columns (Optional[list[str]]): The columns to update on conflict, None for all columns.
+
+    Returns:
+        Insert: The insert on conflict do update statement.
+    """
+    orm = upsert_object.get_orm()
+    values = upsert_object.dict()
+    primary_key = [column.name for column in inspect(orm).primary_key]
+    if update_columns is None:
+        update_columns = [column for column in values if column not in primary_key]
+
+    insert_statement = pg_insert(orm).values(**values)
+    return insert_statement.on_conflict_do_update(
+        index_elements=primary_key,
+        set_={column: insert_statement.excluded[column] for column in update_columns},
+    )
+
+
+def update(
+    update_model: BaseModel, primary_key: Any, values: dict
+) -> Union[None, BaseModel]:
+    """Update only the given columns of an entry in a single statement.
+
+    Args:
+        update_model (BaseModel): The model to update in the database.
+        primary_key (Any): The primary key of the model instance to update.
+        values (dict): The new values of the columns to update.
+
+    Returns:
+        Union[None, BaseModel]: None if no entry has the primary key, else the updated model.
+    """
+    db = get_session_factory()
 
     with db.begin() as session:
-        # Sessions API has no list function, so prepare the statement with select and apply to scalar.
-        if filter_with == None:
-            query_statement = select(list_model.get_orm())
-        else:
-            query_statement = select(list_model.get_orm()).filter_by(
-                **{filter_with.column_name: filter_with.value}
-            )
-        objs = session.scalars(query_statement)
-        found = [list_model.from_orm(obj) for obj in objs]
-    return found
+        found = session.scalars(
+            _update_statement(update_model, primary_key, values)
+        ).one_or_none()
+
+        if not found:
+            return None
+        obj = update_model.from_orm(found)
+    _record_write(getattr(obj, "user_id", None))
+    return obj
+
+
+def upsert(
+    upsert_object: BaseModel, update_columns: Optional[list[str]] = None
+) -> bool:
+    """Insert the values from a pydantic model, or update the existing entry with the same primary key.
+
+    Args:
+        upsert_object (BaseModel): An instance of a pydantic model to store in the database.
+        update_columns (Optional[list[str]]): The columns to update if the entry exists, None for all columns.
+
+    Returns:
+        bool: Whether the change was successful.
+    """
+    db = get_session_factory()
+
+    with db.begin() as session:
+        session.execute(_upsert_statement(upsert_object, update_columns))
+    _record_write(getattr(upsert_object, "user_id", None))
+    return True
+
+
+def _first_statement(model: BaseModel, column: str, value: Any) -> Select:
+    """Prepare the statement selecting the first entry with the value in the column."""
+    return select(model.get_orm()).filter_by(**{column: value}).limit(1)
+
+
+def _insert_or_nothing_statement(create_object: BaseModel):
+    """Prepare the statement inserting an entry, doing nothing if it conflicts with an existing one.
+
+    Args:
+        create_object (BaseModel): An instance of a pydantic model to store in the database.
+
+    Returns:
+        Insert: The insert on conflict do nothing statement, returning the entry if it was inserted.
+    """
+    orm = create_object.get_orm()
+    return (
+        pg_insert(orm)
+        .values(**create_object.dict())
+        .on_conflict_do_nothing()
+        .returning(orm)
+    )
+
+
+def get_or_create(create_object: BaseModel, unique_column: str) -> BaseModel:
+    """Get the entry with the same value in a unique column as the pydantic model, creating it if there is none.
+
+    The entry is looked up with a single row select, and created with an insert that does nothing on conflict, so
+    concurrent calls for the same value do not fail and all return the one entry that was stored.
+
+    Args:
+        create_object (BaseModel): An instance of a pydantic model to store in the database if there is no entry.
+        unique_column (str): The unique column to look the entry up by.
+
+    Returns:
+        BaseModel: The existing or created model.
+    """
+    model = type(create_object)
+    statement = _first_statement(
+        model, unique_column, getattr(create_object, unique_column)
+    )
+
+    def read(db: sessionmaker) -> Union[None, BaseModel]:
+        with db.begin() as session:
+            found = session.scalars(statement).first()
+            return model.from_orm(found) if found else None
+
+    found = _read(read, retry_on_miss=True)
+    if found:
+        return found
+
+    db = get_session_factory()
+
+    with db.begin() as session:
+        created = session.scalars(_insert_or_nothing_statement(create_object)).first()
+        if created is None:
+            # Another call stored the entry since it was looked up.
+            created = session.scalars(statement).one()
+        obj = model.from_orm(created)
+    _record_write(getattr(obj, "user_id", None))
+    return obj
 
 
 def modify(modify_object: BaseModel) -> bool:
@@ -112,10 +667,11 @@ def modify(modify_object: BaseModel) -> bool:
     Returns:
         bool: Whether the change was successful.
     """
-    db = sessionmaker(get_engine())
+    db = get_session_factory()
 
     with db.begin() as session:
         session.merge(modify_object.get_orm()(**modify_object.dict()))
+    _record_write(getattr(modify_object, "user_id", None))
     return True
 
 
@@ -129,7 +685,7 @@ def delete(delete_model: BaseModel, primary_key: Any) -> bool:
     Returns:
         bool: Whether the change was successful.
     """
-    db = sessionmaker(get_engine())
+    db = get_session_factory()
 
     with db.begin() as session:
         if isinstance(primary_key, list):
@@ -138,6 +694,7 @@ def delete(delete_model: BaseModel, primary_key: Any) -> bool:
             delete_obj = session.get(delete_model.get_orm(), str(primary_key))
 
         session.delete(delete_obj)
+    _record_write(getattr(delete_obj, "user_id", None))
     return True
 
 
@@ -151,7 +708,127 @@ def get_first_or_default(get_model: BaseModel, filter_with: Filter) -> BaseModel
     Returns:
         Union[None, BaseModel]: Return the model if found, else return None.
     """
-    user_exists = _list(filter_with=filter_with, list_model=get_model)
+    user_exists = _list(
+        filter_with=filter_with, list_model=get_model, retry_on_miss=True
+    )
     if user_exists:
         return user_exists[0]
     return None
+
+
+def bulk_create(
+    create_objects: list[BaseModel], chunk_size: int = BULK_CHUNK_SIZE
+) -> bool:
+    """Add the values from many instances of a pydantic model to the database in a single transaction.
+
+    The rows are inserted with one multi row INSERT per chunk of chunk_size instances.
+
+    Args:
+        create_objects (list[BaseModel]): Instances of the same pydantic model to add to the database.
+        chunk_size (int): The maximum number of rows per statement.
+
+    Returns:
+        bool: Whether the change was successful.
+    """
+    if not create_objects:
+        return True
+
+    orm = create_objects[0].get_orm()
+    db = get_session_factory()
+
+    with db.begin() as session:
+        for chunk in _chunks(_bulk_values(create_objects), chunk_size):
+            session.execute(insert(orm), chunk)
+    _record_write(*_bulk_users(create_objects))
+    return True
+
+
+def bulk_get(
+    get_model: BaseModel, primary_keys: list, chunk_size: int = BULK_CHUNK_SIZE
+) -> list[BaseModel]:
+    """Get the entries of a given model for many primary key values.
+
+    Args:
+        get_model (BaseModel): The model to get from the database.
+        primary_keys (list): The primary keys of the model instances to get, lists of values for composite keys.
+        chunk_size (int): The maximum number of primary keys per IN list.
+
+    Returns:
+        list[BaseModel]: The models found, primary keys without an entry are skipped.
+    """
+    orm = get_model.get_orm()
+
+    def read(db: sessionmaker) -> list[BaseModel]:
+        found = []
+        with db.begin() as session:
+            for chunk in _chunks(primary_keys, chunk_size):
+                result = session.scalars(
+                    select(orm).where(_primary_keys_criteria(orm, chunk))
+                )
+                found.extend(get_model.from_orm(entry) for entry in result)
+        return found
+
+    return _read(read)
+
+
+def bulk_modify(
+    modify_objects: list[BaseModel],
+    columns: Optional[list[str]] = None,
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> bool:
+    """Modify the existing entries for many instances of a pydantic model in a single transaction.
+
+    The rows are updated by primary key with one executemany UPDATE per chunk of chunk_size instances.
+
+    Args:
+        modify_objects (list[BaseModel]): Instances of the same pydantic model that reflect the changes to make.
+        columns (Optional[list[str]]): Only update these columns, None for all columns.
+        chunk_size (int): The maximum number of rows per statement.
+
+    Returns:
+        bool: Whether the change was successful.
+    """
+    if not modify_objects:
+        return True
+
+    orm = modify_objects[0].get_orm()
+    db = get_session_factory()
+
+    with db.begin() as session:
+        for chunk in _chunks(_bulk_values(modify_objects, columns), chunk_size):
+            session.execute(sa_update(orm), chunk)
+    _record_write(*_bulk_users(modify_objects))
+    return True
+
+
+def bulk_delete(
+    delete_model: BaseModel, primary_keys: list, chunk_size: int = BULK_CHUNK_SIZE
+) -> bool:
+    """Delete the entries of a given model for many primary key values in a single transaction.
+
+    Args:
+        delete_model (BaseModel): The model to delete from the database.
+        primary_keys (list): The primary keys of the model instances to delete, lists of values for composite keys.
+        chunk_size (int): The maximum number of primary keys per IN list.
+
+    Returns:
+        bool: Whether the change was successful.
+    """
+    orm = delete_model.get_orm()
+    db = get_session_factory()
+
+    deleted = sa_delete(orm)
+    if hasattr(orm, "user_id"):
+        deleted = deleted.returning(orm.user_id)
+
+    user_ids = []
+    with db.begin() as session:
+        for chunk in _chunks(primary_keys, chunk_size):
+            result = session.execute(
+                deleted.where(_primary_keys_criteria(orm, chunk)),
+                execution_options={"synchronize_session": False},
+            )
+            if hasattr(orm, "user_id"):
+                user_ids.extend(result.scalars())
+    _record_write(*user_ids)
+    return True
@@ -1,13 +1,114 @@
 """ORM definitions for defining and storing the associated data in the databse.
 """
+import base64
 import datetime
+import hashlib
+import json
+import zlib
+from typing import Optional
 
-from sqlalchemy import BOOLEAN, VARCHAR, Column, DateTime
-from sqlalchemy.dialects.postgresql import ENUM, JSON, UUID
+from sqlalchemy import (
+    BOOLEAN,
+    INTEGER,
+    SMALLINT,
+    TEXT,
+    VARCHAR,
+    BigInteger,
+    Column,
+    DateTime,
+    Identity,
+    Index,
+    false,
+)
+from sqlalchemy.dialects.postgresql import ENUM, JSONB, UUID
+from sqlalchemy.types import TypeDecorator
 
 from openeo_fastapi.api.types import Status
 from openeo_fastapi.client.psql.settings import BASE
 
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+COMPRESSED_KEY = "__compressed__"
+
+_compression = {"min_size": None, "algorithm": "zlib"}
+
+
+def configure_compression(min_size: Optional[int], algorithm: str = "zlib"):
+    """Set how CompressibleJSONB columns store large values.
+
+    Args:
+        min_size (Optional[int]): The serialized size in bytes from which values are stored compressed, None to store
+            all values as plain JSONB.
+        algorithm (str): The compression algorithm, "zlib" or "zstd". "zstd" needs the zstandard package.
+
+    Raises:
+        ValueError: If the algorithm is not available.
+    """
+    if algorithm not in ("zlib", "zstd"):
+        raise ValueError(f"Unknown compression algorithm {algorithm}.")
+    if algorithm == "zstd" and zstandard is None:
+        raise ValueError("The zstandard package is needed for zstd compression.")
+
+    _compression["min_size"] = min_size
+    _compression["algorithm"] = algorithm
+
+
+def _compress(data: bytes, algorithm: str) -> bytes:
+    """Compress the data with the algorithm."""
+    if algorithm == "zstd":
+        return zstandard.ZstdCompressor().compress(data)
+    return zlib.compress(data)
+
+
+def _decompress(data: bytes, algorithm: str) -> bytes:
+    """Decompress the data with the algorithm."""
+    if algorithm == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+class CompressibleJSONB(TypeDecorator):
+    """JSONB column which stores large values compressed, when compression has been configured.
+
+    Compressed values are stored as a JSONB object holding the algorithm, the sha256 of the uncompressed value and the
+    base64 encoded compressed value. Values are decompressed when read, whatever the current configuration, so the
+    ORM and pydantic models only ever see the original value. Compressed values can not be indexed or queried into.
+    """
+
+    impl = JSONB
+    cache_ok = True
+
+    def __repr__(self) -> str:
+        """Render without the arguments of the JSONB impl, as used by alembic in autogenerated revisions."""
+        return f"{self.__class__.__name__}()"
+
+    def process_bind_param(self, value, dialect):
+        """Compress the value if it is at least the configured minimum size."""
+        min_size = _compression["min_size"]
+        if value is None or min_size is None:
+            return value
+
+        serialized = json.dumps(value, separators=(",", ":")).encode()
+        if len(serialized) < min_size:
+            return value
+
+        algorithm = _compression["algorithm"]
+        return {
+            COMPRESSED_KEY: algorithm,
+            "sha256": hashlib.sha256(serialized).hexdigest(),
+            "data": base64.b64encode(_compress(serialized, algorithm)).decode(),
+        }
+
+    def process_result_value(self, value, dialect):
+        """Decompress the value if it was stored compressed."""
+        if isinstance(value, dict) and COMPRESSED_KEY in value:
+            data = base64.b64decode(value["data"])
+            return json.loads(_decompress(data, value[COMPRESSED_KEY]))
+        return value
+
 
 class UserORM(BASE):
     """ORM for the user table."""
@@ -31,7 +132,7 @@ class JobORM(BASE):
 
     job_id = Column(UUID(as_uuid=True), primary_key=True)
     """UUID of the job."""
-    process = Column(JSON, nullable=False)
+    process = Column(CompressibleJSONB, nullable=False)
     """The process graph for this job."""
     status = Column(ENUM(Status), nullable=False)
     """The status of the Job."""
@@ -47,6 +148,20 @@ class JobORM(BASE):
     """If the Job is synchronous."""
 
 
+Index("ix_jobs_user_id_created", JobORM.user_id, JobORM.created.desc())
+"""Index for listing the jobs of a user, most recent first."""
+Index("ix_jobs_user_id_status", JobORM.user_id, JobORM.status)
+"""Index for finding the jobs of a user with a given status."""
+Index(
+    "ix_jobs_user_id_created_batch",
+    JobORM.user_id,
+    JobORM.created.desc(),
+    JobORM.job_id.desc(),
+    postgresql_where=JobORM.synchronous == false(),
+)
+"""Partial index matching the keyset pagination of the batch jobs of a user."""
+
+
 class UdpORM(BASE):
     """ORM for the UDPS table."""
 
@@ -57,15 +172,75 @@ class UdpORM(BASE):
     """The string name of the UDP. CPK with user_id. Different users can use the same string for id."""
     user_id = Column(UUID(as_uuid=True), primary_key=True, nullable=False)
     """The UUID of the user that owns this UDP."""
-    process_graph = Column(JSON, nullable=False)
+    process_graph = Column(CompressibleJSONB, nullable=False)
     """The process graph of the UDP."""
     created = Column(DateTime, default=datetime.datetime.utcnow(), nullable=False)
     """The datetime the UDP was created."""
-    parameters = Column("parameters", JSON)
+    parameters = Column("parameters", JSONB)
     """The parameters of the UDP."""
-    returns = Column("returns", JSON)
+    returns = Column("returns", JSONB)
     """The return types of the UDP."""
     summary = Column("summary", VARCHAR)
     """A summary of the UPD."""
     description = Column("description", VARCHAR)
     """A description of what the UDP is intended to do."""
+
+
+Index("ix_udps_user_id", UdpORM.user_id)
+"""Index for listing the UDPs of a user, which the (id, user_id) primary key can not serve."""
+
+
+class JobQueueORM(BASE):
+    """ORM for the job queue table."""
+
+    __tablename__ = "job_queue"
+    __table_args__ = {"extend_existing": True}
+
+    job_id = Column(UUID(as_uuid=True), primary_key=True)
+    """UUID of the queued job."""
+    user_id = Column(UUID(as_uuid=True), nullable=False)
+    """The UUID of the user that owns the job."""
+    enqueued_at = Column(DateTime, nullable=False)
+    """The datetime the job was queued."""
+    claimed_by = Column(VARCHAR)
+    """The id of the worker running the job, None while the job waits to be claimed."""
+    heartbeat_at = Column(DateTime)
+    """The datetime the worker running the job last reported it is alive."""
+    attempts = Column(INTEGER, default=0, nullable=False)
+    """The number of times the job was claimed."""
+
+
+Index(
+    "ix_job_queue_unclaimed",
+    JobQueueORM.enqueued_at,
+    postgresql_where=JobQueueORM.claimed_by.is_(None),
+)
+"""Partial index serving the claim of the oldest jobs waiting in the queue."""
+
+
+class JobLogORM(BASE):
+    """ORM for the job logs table, append only."""
+
+    __tablename__ = "job_logs"
+    __table_args__ = {"extend_existing": True}
+
+    id = Column(BigInteger, Identity(), primary_key=True)
+    """Increasing id of the log entry, the cursor clients continue reading the logs after."""
+    job_id = Column(UUID(as_uuid=True), nullable=False)
+    """UUID of the job the entry belongs to."""
+    severity = Column(SMALLINT, nullable=False)
+    """The severity of the level of the entry, 0 for error up to 3 for debug, so levels can be filtered by range."""
+    code = Column(VARCHAR)
+    """The code of the entry."""
+    message = Column(TEXT, nullable=False)
+    """The message of the entry."""
+    time = Column(DateTime, nullable=False)
+    """The datetime the entry was logged."""
+    data = Column(JSONB)
+    """Data of any type attached to the entry."""
+    path = Column(JSONB)
+    """The processes the entry originates from."""
+
+
+Index("ix_job_logs_job_id_id", JobLogORM.job_id, JobLogORM.id)
+"""Index serving the pages of the logs of a job, read in the order of the entry ids."""
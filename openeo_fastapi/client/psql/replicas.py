@@ -0,0 +1,96 @@
+"""Class to route read only operations across the read replicas of the database.
+
+Reads are spread round-robin across the replicas. A replica that fails to serve a read is skipped for a while and the
+read falls back to the next replica, or the primary. After a write, reads for the same user are served by the primary
+for a short window, so users always see their own changes even if the replicas lag behind.
+
+Classes:
+    - ReplicaRouter: Tracks the replica order, their health and the recent writes per user.
+"""
+import itertools
+import threading
+import time
+from typing import Any, Optional
+
+
+class ReplicaRouter:
+    """Tracks the replica order, their health and the recent writes per user."""
+
+    def __init__(
+        self, replica_count: int, retry_after: float, read_your_writes: float
+    ) -> None:
+        """Create the router.
+
+        Args:
+            replica_count (int): The number of replicas.
+            retry_after (float): The seconds a failed replica is skipped for.
+            read_your_writes (float): The seconds after a write during which the user's reads go to the primary.
+        """
+        self.replica_count = replica_count
+        self.retry_after = retry_after
+        self.read_your_writes = read_your_writes
+
+        self._turn = itertools.count()
+        self._unhealthy_until: dict[int, float] = {}
+        self._writes: dict[Any, float] = {}
+        self._lock = threading.Lock()
+
+    def candidates(self, user_id: Optional[Any] = None) -> list[int]:
+        """Get the replicas to try for a read, in order.
+
+        Args:
+            user_id (Optional[Any]): The user the read is for, if known.
+
+        Returns:
+            list[int]: The indexes of the healthy replicas, starting with the next one in turn. Empty if the read needs
+            to be served by the primary.
+        """
+        if not self.replica_count or self.recently_wrote(user_id):
+            return []
+
+        now = time.monotonic()
+        start = next(self._turn) % self.replica_count
+        order = [
+            (start + offset) % self.replica_count
+            for offset in range(self.replica_count)
+        ]
+        return [index for index in order if self._unhealthy_until.get(index, 0) <= now]
+
+    def mark_unhealthy(self, index: int):
+        """Skip the replica until the retry_after seconds have passed.
+
+        Args:
+            index (int): The index of the replica.
+        """
+        self._unhealthy_until[index] = time.monotonic() + self.retry_after
+
+    def record_write(self, user_id: Optional[Any]):
+        """Record that the user wrote to the primary.
+
+        Args:
+            user_id (Optional[Any]): The user that made the change, ignored if not known.
+        """
+        if user_id is None or not self.replica_count or not self.read_your_writes:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            self._writes[str(user_id)] = now + self.read_your_writes
+            # Drop the expired windows once in a while so the dict does not grow with the number of users.
+            if len(self._writes) > 1024:
+                self._writes = {
+                    user: until for user, until in self._writes.items() if until > now
+                }
+
+    def recently_wrote(self, user_id: Optional[Any]) -> bool:
+        """Check if the user wrote within the read your writes window.
+
+        Args:
+            user_id (Optional[Any]): The user the read is for, if known.
+
+        Returns:
+            bool: Whether the reads for the user need to be served by the primary.
+        """
+        if user_id is None:
+            return False
+        return self._writes.get(str(user_id), 0) > time.monotonic()
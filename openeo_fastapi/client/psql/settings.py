@@ -1,5 +1,6 @@
 """Defining the settings to be used at the application layer of the API for database interaction."""
 from pathlib import Path
+from typing import Optional
 
 from pydantic import BaseSettings, SecretStr
 from sqlalchemy.orm import declarative_base
@@ -20,6 +21,30 @@ class DataBaseSettings(BaseSettings):
     """The post on the host the database is available on."""
     POSTGRES_DB: SecretStr
     """The name of the databse being used on the host."""
+    POSTGRES_POOL_SIZE: int = 5
+    """The number of connections kept open in the connection pool of each worker."""
+    POSTGRES_MAX_OVERFLOW: int = 10
+    """The number of connections that can be opened beyond the POSTGRES_POOL_SIZE when the pool is exhausted."""
+    POSTGRES_POOL_TIMEOUT: float = 30.0
+    """The seconds to wait for a connection from an exhausted pool before giving up."""
+    POSTGRES_POOL_PRE_PING: bool = True
+    """Whether connections are tested before being taken from the pool, replacing those the server has closed."""
+    POSTGRES_POOL_RECYCLE: int = 3600
+    """The seconds after which a pooled connection is replaced. -1 keeps connections open indefinitely."""
+    POSTGRES_STATEMENT_TIMEOUT: Optional[int]
+    """The milliseconds a statement may run before the server cancels it. If not set, the server default is used."""
+    POSTGRES_APPLICATION_NAME: str = "openeo-fastapi"
+    """The application name the connections report to the server, visible in pg_stat_activity."""
+    POSTGRES_COMPRESS_MIN_SIZE: Optional[int]
+    """The size in bytes from which process graphs are stored compressed. If not set, process graphs are stored as plain JSONB."""
+    POSTGRES_COMPRESSION: str = "zlib"
+    """The algorithm used to compress process graphs, "zlib" or "zstd". "zstd" needs the zstandard package."""
+    POSTGRESQL_REPLICA_HOSTS: list[str] = []
+    """The hosts of read replicas, as "host" or "host:port". Read only operations are spread across them."""
+    POSTGRES_REPLICA_RETRY_AFTER: float = 30.0
+    """The seconds a replica that failed to serve a read is skipped for before it is tried again."""
+    POSTGRES_READ_YOUR_WRITES: float = 5.0
+    """The seconds after a write during which reads for the same user are served by the primary."""
 
     ALEMBIC_DIR: Path
     """The path leading to the alembic directory to be used."""
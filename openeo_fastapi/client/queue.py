@@ -0,0 +1,734 @@
+"""Classes to queue batch jobs and run them with workers, without a separate message broker.
+
+Starting a job moves its status to queued and adds it to the queue. Workers claim the queued jobs, the oldest first
+or in the order a FairShareScheduler selects them, which moves their status to running. They report they are alive
+with heartbeats while running the jobs, and complete them as finished or error. Jobs whose worker stopped sending
+heartbeats are queued again.
+
+Classes:
+    - QueuedJob: The pydantic model of a job in the queue.
+    - JobQueue: Abstract queue backend used by the JobsRegister and the JobWorkers.
+    - PostgresJobQueue: Queue stored in the database, claimed with SELECT ... FOR UPDATE SKIP LOCKED.
+    - InMemoryJobQueue: Queue held in the memory of a single process, intended for tests and development.
+    - JobWorker: Claims and runs the jobs of a queue.
+"""
+import datetime
+import logging
+import socket
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import delete as sa_delete
+from sqlalchemy import func, select
+from sqlalchemy import update as sa_update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from openeo_fastapi.api.types import Status
+from openeo_fastapi.client.jobs import Job
+from openeo_fastapi.client.psql.engine import _record_write, get_session_factory
+from openeo_fastapi.client.psql.models import JobORM, JobQueueORM
+from openeo_fastapi.client.scheduler import FairShareScheduler
+
+logger = logging.getLogger(__name__)
+
+STARTABLE_STATUSES = [Status.created, Status.canceled, Status.finished, Status.error]
+"""The statuses a job can be started from. Starting a queued or running job has no effect."""
+CANCELABLE_STATUSES = [Status.queued, Status.running]
+"""The statuses a job can be canceled from."""
+
+SCHEDULED_CLAIM_LOCK = 0x6A6F6271
+"""The advisory lock serializing the claims of a PostgresJobQueue with a scheduler, so per user caps hold."""
+
+_UNSYNCHRONIZED = {"synchronize_session": False}
+
+
+class QueuedJob(BaseModel):
+    """Pydantic model representing a job in the queue."""
+
+    job_id: uuid.UUID
+    user_id: uuid.UUID
+    enqueued_at: datetime.datetime
+    claimed_by: Optional[str] = None
+    heartbeat_at: Optional[datetime.datetime] = None
+    attempts: int = 0
+
+    class Config:
+        """Pydantic model class config."""
+
+        orm_mode = True
+
+    @classmethod
+    def get_orm(cls):
+        """Get the ORM model for this pydantic model."""
+        return JobQueueORM
+
+
+def _transition(
+    session: Session, job_ids: list, from_statuses: list[Status], to_status: Status
+) -> list[Job]:
+    """Move the jobs that have one of the from statuses to the new status, in a single statement.
+
+    Args:
+        session (Session): The session of the transaction to make the change in.
+        job_ids (list): The ids of the jobs.
+        from_statuses (list[Status]): The statuses the jobs need to have to be moved.
+        to_status (Status): The new status.
+
+    Returns:
+        list[Job]: The jobs that were moved, in the order of the job ids.
+    """
+    if not job_ids:
+        return []
+    positions = {job_id: position for position, job_id in enumerate(job_ids)}
+
+    moved = session.scalars(
+        sa_update(JobORM)
+        .where(JobORM.job_id.in_(job_ids), JobORM.status.in_(from_statuses))
+        .values(status=to_status)
+        .returning(JobORM),
+        execution_options=_UNSYNCHRONIZED,
+    ).all()
+    jobs = sorted(
+        (Job.from_orm(job) for job in moved), key=lambda job: positions[job.job_id]
+    )
+    _record_write(*[job.user_id for job in jobs])
+    return jobs
+
+
+class JobQueue(ABC):
+    """Abstract queue backend used by the JobsRegister to start and cancel jobs, and by the JobWorkers to run them.
+
+    The job statuses are kept in the jobs table by all backends, so the API reports the same status a worker sees.
+    """
+
+    @abstractmethod
+    def enqueue(self, job: Job) -> bool:
+        """Move the job to queued and add it to the queue, if it can be started.
+
+        Args:
+            job (Job): The job to start.
+
+        Returns:
+            bool: Whether the job was queued, False if its status does not allow it to be started.
+        """
+
+    @abstractmethod
+    def claim(self, worker_id: str, limit: int = 1) -> list[Job]:
+        """Claim the next jobs waiting in the queue and move them to running.
+
+        The oldest jobs are claimed first, unless the queue has a scheduler selecting them.
+
+        Args:
+            worker_id (str): The id of the worker claiming the jobs.
+            limit (int): The maximum number of jobs to claim.
+
+        Returns:
+            list[Job]: The claimed jobs in the order they should be run, empty if no job is waiting.
+        """
+
+    @abstractmethod
+    def heartbeat(self, job_id: uuid.UUID, worker_id: str) -> bool:
+        """Report the worker is still running the job.
+
+        Args:
+            job_id (uuid.UUID): The id of the job.
+            worker_id (str): The id of the worker running the job.
+
+        Returns:
+            bool: Whether the job is still claimed by the worker, False if it was canceled or queued again.
+        """
+
+    @abstractmethod
+    def complete(self, job_id: uuid.UUID, worker_id: str, status: Status) -> bool:
+        """Remove the job from the queue and move it to its final status.
+
+        Args:
+            job_id (uuid.UUID): The id of the job.
+            worker_id (str): The id of the worker that ran the job.
+            status (Status): The final status, finished or error.
+
+        Returns:
+            bool: Whether the job was still claimed by the worker, the status is left unchanged if not.
+        """
+
+    @abstractmethod
+    def cancel(self, job_id: uuid.UUID) -> bool:
+        """Remove the job from the queue and move it to canceled, if it is queued or running.
+
+        Args:
+            job_id (uuid.UUID): The id of the job.
+
+        Returns:
+            bool: Whether the job was canceled.
+        """
+
+    @abstractmethod
+    def requeue_stale(self, stale_after: float) -> int:
+        """Queue the claimed jobs again whose worker has not sent a heartbeat within stale_after seconds.
+
+        Args:
+            stale_after (float): The seconds without a heartbeat after which a worker is assumed to have stopped.
+
+        Returns:
+            int: The number of jobs queued again.
+        """
+
+
+class PostgresJobQueue(JobQueue):
+    """Queue stored in the job_queue table of the database.
+
+    Any number of worker processes can claim from the queue concurrently. Claims lock the rows with
+    SELECT ... FOR UPDATE SKIP LOCKED, so workers never wait for each other nor claim the same job. With a scheduler,
+    claims are serialized by an advisory lock instead, so the scheduler sees the jobs claimed by the other workers.
+    """
+
+    def __init__(self, scheduler: Optional[FairShareScheduler] = None) -> None:
+        """Initialize the PostgresJobQueue.
+
+        Args:
+            scheduler (Optional[FairShareScheduler]): Selects the jobs to claim, None to claim the oldest jobs first.
+        """
+        self.scheduler = scheduler
+
+    def _scheduled(self, session: Session, limit: int) -> list[uuid.UUID]:
+        """Select the jobs to claim with the scheduler.
+
+        Only the oldest limit jobs of each user are candidates, as no more can be claimed from a single user.
+
+        Args:
+            session (Session): The session of the claim transaction.
+            limit (int): The maximum number of jobs to claim.
+
+        Returns:
+            list[uuid.UUID]: The ids of the jobs to claim.
+        """
+        session.execute(select(func.pg_advisory_xact_lock(SCHEDULED_CLAIM_LOCK)))
+
+        ranked = (
+            select(
+                JobQueueORM.job_id,
+                func.row_number()
+                .over(
+                    partition_by=JobQueueORM.user_id,
+                    order_by=JobQueueORM.enqueued_at,
+                )
+                .label("rank"),
+            )
+            .where(JobQueueORM.claimed_by.is_(None))
+            .subquery()
+        )
+        candidates = session.scalars(
+            select(JobQueueORM).where(
+                JobQueueORM.job_id.in_(
+                    select(ranked.c.job_id).where(ranked.c.rank <= limit)
+                )
+            )
+        ).all()
+        running = session.execute(
+            select(JobQueueORM.user_id, func.count())
+            .where(JobQueueORM.claimed_by.is_not(None))
+            .group_by(JobQueueORM.user_id)
+        ).all()
+
+        selected = self.scheduler.select(
+            [QueuedJob.from_orm(candidate) for candidate in candidates],
+            running=dict(running),
+            limit=limit,
+            now=session.scalar(select(func.localtimestamp())),
+        )
+        return [queued.job_id for queued in selected]
+
+    def enqueue(self, job: Job) -> bool:
+        """Move the job to queued and add it to the queue, if it can be started.
+
+        Args:
+            job (Job): The job to start.
+
+        Returns:
+            bool: Whether the job was queued, False if its status does not allow it to be started.
+        """
+        db = get_session_factory()
+
+        with db.begin() as session:
+            if not _transition(
+                session, [job.job_id], STARTABLE_STATUSES, Status.queued
+            ):
+                return False
+
+            insert_statement = pg_insert(JobQueueORM).values(
+                job_id=job.job_id,
+                user_id=job.user_id,
+                enqueued_at=func.now(),
+                attempts=0,
+            )
+            session.execute(
+                insert_statement.on_conflict_do_update(
+                    index_elements=[JobQueueORM.job_id],
+                    set_={
+                        "enqueued_at": insert_statement.excluded.enqueued_at,
+                        "claimed_by": None,
+                        "heartbeat_at": None,
+                        "attempts": 0,
+                    },
+                )
+            )
+        return True
+
+    def claim(self, worker_id: str, limit: int = 1) -> list[Job]:
+        """Claim the next jobs waiting in the queue and move them to running.
+
+        Args:
+            worker_id (str): The id of the worker claiming the jobs.
+            limit (int): The maximum number of jobs to claim.
+
+        Returns:
+            list[Job]: The claimed jobs in the order they should be run, empty if no job is waiting.
+        """
+        db = get_session_factory()
+
+        with db.begin() as session:
+            if self.scheduler is None:
+                claimable = (
+                    select(JobQueueORM.job_id)
+                    .where(JobQueueORM.claimed_by.is_(None))
+                    .order_by(JobQueueORM.enqueued_at)
+                    .limit(limit)
+                    .with_for_update(skip_locked=True)
+                )
+            else:
+                claimable = self._scheduled(session, limit)
+
+            claimed = session.execute(
+                sa_update(JobQueueORM)
+                .where(JobQueueORM.job_id.in_(claimable))
+                .values(
+                    claimed_by=worker_id,
+                    heartbeat_at=func.now(),
+                    attempts=JobQueueORM.attempts + 1,
+                )
+                .returning(JobQueueORM.job_id, JobQueueORM.enqueued_at),
+                execution_options=_UNSYNCHRONIZED,
+            ).all()
+
+            if self.scheduler is None:
+                order = [
+                    row.job_id
+                    for row in sorted(claimed, key=lambda row: row.enqueued_at)
+                ]
+            else:
+                order = claimable
+            jobs = _transition(session, order, [Status.queued], Status.running)
+        return jobs
+
+    def heartbeat(self, job_id: uuid.UUID, worker_id: str) -> bool:
+        """Report the worker is still running the job.
+
+        Args:
+            job_id (uuid.UUID): The id of the job.
+            worker_id (str): The id of the worker running the job.
+
+        Returns:
+            bool: Whether the job is still claimed by the worker, False if it was canceled or queued again.
+        """
+        db = get_session_factory()
+
+        with db.begin() as session:
+            found = session.scalars(
+                sa_update(JobQueueORM)
+                .where(
+                    JobQueueORM.job_id == job_id, JobQueueORM.claimed_by == worker_id
+                )
+                .values(heartbeat_at=func.now())
+                .returning(JobQueueORM.job_id),
+                execution_options=_UNSYNCHRONIZED,
+            ).first()
+        return found is not None
+
+    def complete(self, job_id: uuid.UUID, worker_id: str, status: Status) -> bool:
+        """Remove the job from the queue and move it to its final status.
+
+        Args:
+            job_id (uuid.UUID): The id of the job.
+            worker_id (str): The id of the worker that ran the job.
+            status (Status): The final status, finished or error.
+
+        Returns:
+            bool: Whether the job was still claimed by the worker, the status is left unchanged if not.
+        """
+        db = get_session_factory()
+
+        with db.begin() as session:
+            found = session.scalars(
+                sa_delete(JobQueueORM)
+                .where(
+                    JobQueueORM.job_id == job_id, JobQueueORM.claimed_by == worker_id
+                )
+                .returning(JobQueueORM.job_id),
+                execution_options=_UNSYNCHRONIZED,
+            ).first()
+            if found is None:
+                return False
+            _transition(session, [job_id], [Status.running], status)
+        return True
+
+    def cancel(self, job_id: uuid.UUID) -> bool:
+        """Remove the job from the queue and move it to canceled, if it is queued or running.
+
+        Args:
+            job_id (uuid.UUID): The id of the job.
+
+        Returns:
+            bool: Whether the job was canceled.
+        """
+        db = get_session_factory()
+
+        with db.begin() as session:
+            session.execute(
+                sa_delete(JobQueueORM).where(JobQueueORM.job_id == job_id),
+                execution_options=_UNSYNCHRONIZED,
+            )
+            canceled = _transition(
+                session, [job_id], CANCELABLE_STATUSES, Status.canceled
+            )
+        return bool(canceled)
+
+    def requeue_stale(self, stale_after: float) -> int:
+        """Queue the claimed jobs again whose worker has not sent a heartbeat within stale_after seconds.
+
+        Args:
+            stale_after (float): The seconds without a heartbeat after which a worker is assumed to have stopped.
+
+        Returns:
+            int: The number of jobs queued again.
+        """
+        db = get_session_factory()
+
+        with db.begin() as session:
+            stale = session.scalars(
+                sa_update(JobQueueORM)
+                .where(
+                    JobQueueORM.claimed_by.is_not(None),
+                    JobQueueORM.heartbeat_at
+                    < func.now() - datetime.timedelta(seconds=stale_after),
+                )
+                .values(claimed_by=None, heartbeat_at=None)
+                .returning(JobQueueORM.job_id),
+                execution_options=_UNSYNCHRONIZED,
+            ).all()
+            _transition(session, stale, [Status.running], Status.queued)
+        return len(stale)
+
+
+class InMemoryJobQueue(JobQueue):
+    """Queue held in the memory of a single process, intended for tests and development.
+
+    The job statuses are still kept in the database, only the queue itself is in memory, so queued jobs are lost when
+    the process stops.
+    """
+
+    def __init__(self, scheduler: Optional[FairShareScheduler] = None) -> None:
+        """Initialize the InMemoryJobQueue.
+
+        Args:
+            scheduler (Optional[FairShareScheduler]): Selects the jobs to claim, None to claim the oldest jobs first.
+        """
+        self.scheduler = scheduler
+        self._waiting: OrderedDict[uuid.UUID, QueuedJob] = OrderedDict()
+        self._claimed: dict[uuid.UUID, QueuedJob] = {}
+        self._lock = threading.Lock()
+
+    def enqueue(self, job: Job) -> bool:
+        """Move the job to queued and add it to the queue, if it can be started.
+
+        Args:
+            job (Job): The job to start.
+
+        Returns:
+            bool: Whether the job was queued, False if its status does not allow it to be started.
+        """
+        db = get_session_factory()
+
+        with db.begin() as session, self._lock:
+            if not _transition(
+                session, [job.job_id], STARTABLE_STATUSES, Status.queued
+            ):
+                return False
+            self._claimed.pop(job.job_id, None)
+            self._waiting[job.job_id] = QueuedJob(
+                job_id=job.job_id,
+                user_id=job.user_id,
+                enqueued_at=datetime.datetime.now(),
+            )
+        return True
+
+    def claim(self, worker_id: str, limit: int = 1) -> list[Job]:
+        """Claim the next jobs waiting in the queue and move them to running.
+
+        Args:
+            worker_id (str): The id of the worker claiming the jobs.
+            limit (int): The maximum number of jobs to claim.
+
+        Returns:
+            list[Job]: The claimed jobs in the order they should be run, empty if no job is waiting.
+        """
+        db = get_session_factory()
+
+        with db.begin() as session, self._lock:
+            if self.scheduler is None:
+                selected = list(self._waiting.values())[:limit]
+            else:
+                running = Counter(queued.user_id for queued in self._claimed.values())
+                selected = self.scheduler.select(
+                    list(self._waiting.values()), running, limit
+                )
+
+            claimed = []
+            for queued in selected:
+                del self._waiting[queued.job_id]
+                queued.claimed_by = worker_id
+                queued.heartbeat_at = datetime.datetime.now()
+                queued.attempts += 1
+                self._claimed[queued.job_id] = queued
+                claimed.append(queued.job_id)
+            jobs = _transition(session, claimed, [Status.queued], Status.running)
+        return jobs
+
+    def heartbeat(self, job_id: uuid.UUID, worker_id: str) -> bool:
+        """Report the worker is still running the job.
+
+        Args:
+            job_id (uuid.UUID): The id of the job.
+            worker_id (str): The id of the worker running the job.
+
+        Returns:
+            bool: Whether the job is still claimed by the worker, False if it was canceled or queued again.
+        """
+        with self._lock:
+            queued = self._claimed.get(job_id)
+            if queued is None or queued.claimed_by != worker_id:
+                return False
+            queued.heartbeat_at = datetime.datetime.now()
+        return True
+
+    def complete(self, job_id: uuid.UUID, worker_id: str, status: Status) -> bool:
+        """Remove the job from the queue and move it to its final status.
+
+        Args:
+            job_id (uuid.UUID): The id of the job.
+            worker_id (str): The id of the worker that ran the job.
+            status (Status): The final status, finished or error.
+
+        Returns:
+            bool: Whether the job was still claimed by the worker, the status is left unchanged if not.
+        """
+        db = get_session_factory()
+
+        with db.begin() as session, self._lock:
+            queued = self._claimed.get(job_id)
+            if queued is None or queued.claimed_by != worker_id:
+                return False
+            del self._claimed[job_id]
+            _transition(session, [job_id], [Status.running], status)
+        return True
+
+    def cancel(self, job_id: uuid.UUID) -> bool:
+        """Remove the job from the queue and move it to canceled, if it is queued or running.
+
+        Args:
+            job_id (uuid.UUID): The id of the job.
+
+        Returns:
+            bool: Whether the job was canceled.
+        """
+        db = get_session_factory()
+
+        with db.begin() as session, self._lock:
+            self._waiting.pop(job_id, None)
+            self._claimed.pop(job_id, None)
+            canceled = _transition(
+                session, [job_id], CANCELABLE_STATUSES, Status.canceled
+            )
+        return bool(canceled)
+
+    def requeue_stale(self, stale_after: float) -> int:
+        """Queue the claimed jobs again whose worker has not sent a heartbeat within stale_after seconds.
+
+        Args:
+            stale_after (float): The seconds without a heartbeat after which a worker is assumed to have stopped.
+
+        Returns:
+            int: The number of jobs queued again.
+        """
+        stale_before = datetime.datetime.now() - datetime.timedelta(seconds=stale_after)
+        db = get_session_factory()
+
+        with db.begin() as session, self._lock:
+            stale = [
+                queued
+                for queued in self._claimed.values()
+                if queued.heartbeat_at < stale_before
+            ]
+            for queued in stale:
+                del self._claimed[queued.job_id]
+                queued.claimed_by = None
+                queued.heartbeat_at = None
+                self._waiting[queued.job_id] = queued
+            self._waiting = OrderedDict(
+                sorted(self._waiting.items(), key=lambda item: item[1].enqueued_at)
+            )
+            _transition(
+                session,
+                [queued.job_id for queued in stale],
+                [Status.running],
+                Status.queued,
+            )
+        return len(stale)
+
+
+class JobWorker:
+    """Claims and runs the jobs of a queue.
+
+    Run one worker per process, or per thread, as many as the backend can process jobs in parallel.
+
+    Example:
+    ```
+    worker = JobWorker(PostgresJobQueue(), execute=run_process_graph)
+    worker.run()
+    ```
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        execute: Callable[[Job], Any],
+        worker_id: Optional[str] = None,
+        batch_size: int = 1,
+        poll_interval: float = 1.0,
+        heartbeat_interval: float = 30.0,
+        stale_after: Optional[float] = None,
+    ) -> None:
+        """Initialize the JobWorker.
+
+        Args:
+            queue (JobQueue): The queue to claim jobs from.
+            execute (Callable[[Job], Any]): Runs a job. Raising an exception moves the job to error, returning
+                moves it to finished.
+            worker_id (Optional[str]): The id of the worker, defaults to the host name and a random suffix.
+            batch_size (int): The number of jobs claimed at once, and run one after the other while all of them get
+                heartbeats.
+            poll_interval (float): The seconds to wait before polling again when the queue is empty.
+            heartbeat_interval (float): The seconds between heartbeats while a job runs.
+            stale_after (Optional[float]): The seconds without a heartbeat after which the jobs of other workers are
+                queued again. Defaults to three heartbeat intervals.
+        """
+        self.queue = queue
+        self.execute = execute
+        self.worker_id = worker_id or f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}"
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after or 3 * heartbeat_interval
+
+    def _heartbeat(
+        self, pending: set, lost: set, lock: threading.Lock, done: threading.Event
+    ):
+        """Send heartbeats for the pending jobs until they are done, moving the jobs no longer claimed to lost."""
+        while not done.wait(self.heartbeat_interval):
+            with lock:
+                job_ids = list(pending)
+            for job_id in job_ids:
+                if not self.queue.heartbeat(job_id, self.worker_id):
+                    logger.warning(
+                        f"Job {job_id} is no longer claimed by worker {self.worker_id}."
+                    )
+                    with lock:
+                        pending.discard(job_id)
+                        lost.add(job_id)
+
+    def run_jobs(self, jobs: list[Job]) -> dict[uuid.UUID, Status]:
+        """Run claimed jobs one after the other and complete them.
+
+        Heartbeats are sent for all the jobs until each one completes, not only for the running one, so the jobs
+        waiting for their turn are not queued again as stale. The claim of each job is renewed right before it runs,
+        and jobs no longer claimed by the worker are skipped.
+
+        Args:
+            jobs (list[Job]): The claimed jobs.
+
+        Returns:
+            dict[uuid.UUID, Status]: The final status of each job that was run.
+        """
+        pending = {job.job_id for job in jobs}
+        lost: set = set()
+        lock = threading.Lock()
+        done = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(pending, lost, lock, done), daemon=True
+        )
+        heartbeat.start()
+
+        statuses = {}
+        try:
+            for job in jobs:
+                with lock:
+                    skip = job.job_id in lost
+                if skip or not self.queue.heartbeat(job.job_id, self.worker_id):
+                    logger.warning(
+                        f"Skipping job {job.job_id}, it is no longer claimed by worker {self.worker_id}."
+                    )
+                    continue
+
+                status = Status.finished
+                try:
+                    self.execute(job)
+                except Exception:
+                    logger.exception(f"Job {job.job_id} failed.")
+                    status = Status.error
+
+                with lock:
+                    pending.discard(job.job_id)
+                self.queue.complete(job.job_id, self.worker_id, status)
+                statuses[job.job_id] = status
+        finally:
+            done.set()
+            heartbeat.join()
+
+        return statuses
+
+    def run_job(self, job: Job) -> Optional[Status]:
+        """Run a claimed job, sending heartbeats while it runs, and complete it.
+
+        Args:
+            job (Job): The claimed job.
+
+        Returns:
+            Optional[Status]: The final status of the job, None if it was no longer claimed by the worker.
+        """
+        return self.run_jobs([job]).get(job.job_id)
+
+    def run_once(self) -> int:
+        """Claim a batch of jobs and run them.
+
+        Returns:
+            int: The number of jobs that were run.
+        """
+        jobs = self.queue.claim(self.worker_id, limit=self.batch_size)
+        return len(self.run_jobs(jobs))
+
+    def run(self, stop: Optional[threading.Event] = None):
+        """Run jobs until stopped, queueing the jobs of stopped workers again while the queue is empty.
+
+        Args:
+            stop (Optional[threading.Event]): Stops the worker once set, after the current batch.
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            if self.run_once():
+                continue
+            self.queue.requeue_stale(self.stale_after)
+            stop.wait(self.poll_interval)
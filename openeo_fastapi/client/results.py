@@ -0,0 +1,475 @@
+"""Classes to store the results of batch jobs and serve them for download.
+
+The results are written to any filesystem fsspec supports, e.g. a local directory or an object store. The size and
+checksum of each result file are computed while it is written, and kept in a manifest next to the files, so listing
+the results of a job does not read them again.
+
+Downloads are streamed in chunks, so large results are never held in the memory of the API. HTTP Range requests are
+supported, and local files are handed to the server for zero-copy sending when it supports the ASGI zerocopysend
+extension.
+
+Classes:
+    - ResultAsset: The metadata of a result file of a job.
+    - ResultStore: Writes, lists and opens the result files of jobs on an fsspec filesystem.
+    - AssetResponse: Streams a result file, or a byte range of it, to the client.
+"""
+import hashlib
+import json
+import mimetypes
+import posixpath
+import re
+import uuid
+from functools import partial
+from typing import IO, Awaitable, Callable, Optional, Union
+from urllib.parse import quote
+
+import anyio
+import fsspec
+from fsspec.implementations.local import LocalFileSystem
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+MANIFEST_NAME = "_manifest.json"
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+# The multihash prefix of sha2-256 digests, as used by the file:checksum of the STAC file extension.
+SHA256_MULTIHASH_PREFIX = "1220"
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class ResultAsset(BaseModel):
+    """The metadata of a result file of a job."""
+
+    name: str
+    """The path of the file relative to the results of the job."""
+    size: int
+    """The size of the file in bytes."""
+    checksum: Optional[str] = None
+    """The sha2-256 multihash of the file, if it was written through the store."""
+    media_type: Optional[str] = None
+    """The media type of the file."""
+    roles: list[str] = ["data"]
+    """The STAC roles of the file."""
+
+
+class ResultStore:
+    """Writes, lists and opens the result files of jobs on an fsspec filesystem.
+
+    The files of a job are stored under {url}/{job_id}/.
+
+    Example:
+    ```
+    store = ResultStore("s3://bucket/results", key="...", secret="...")
+
+    with open("/tmp/out.tif", "rb") as result:
+        store.write(job.job_id, "out.tif", result, media_type="image/tiff; application=geotiff")
+    ```
+    """
+
+    def __init__(
+        self, url: str, chunk_size: int = DEFAULT_CHUNK_SIZE, **storage_options
+    ) -> None:
+        """Initialize the ResultStore.
+
+        Args:
+            url (str): The fsspec URL the results are stored under.
+            chunk_size (int): The size in bytes of the chunks files are copied and streamed in.
+            **storage_options: The options of the fsspec filesystem, e.g. credentials.
+        """
+        self.url = url
+        self.chunk_size = chunk_size
+        self.fs, self.root = fsspec.core.url_to_fs(url, **storage_options)
+
+    def _job_path(self, job_id: uuid.UUID) -> str:
+        """The path the files of the job are stored under."""
+        return posixpath.join(self.root, str(job_id))
+
+    def path(self, job_id: uuid.UUID, name: str) -> str:
+        """Get the path of a result file on the filesystem.
+
+        Args:
+            job_id (uuid.UUID): The job.
+            name (str): The path of the file relative to the results of the job.
+
+        Raises:
+            FileNotFoundError: If the name points outside the results of the job, or to the manifest.
+
+        Returns:
+            str: The path.
+        """
+        normalized = posixpath.normpath(name)
+        if (
+            normalized.startswith(("/", "..", "."))
+            or normalized == MANIFEST_NAME
+            or not name
+        ):
+            raise FileNotFoundError(name)
+        return posixpath.join(self._job_path(job_id), normalized)
+
+    def local_path(self, job_id: uuid.UUID, name: str) -> Optional[str]:
+        """Get the path of a result file on the local disk, if the results are stored locally.
+
+        Args:
+            job_id (uuid.UUID): The job.
+            name (str): The path of the file relative to the results of the job.
+
+        Returns:
+            Optional[str]: The path, None if the results are not on a local filesystem.
+        """
+        if not isinstance(self.fs, LocalFileSystem):
+            return None
+        return self.path(job_id, name)
+
+    def _read_manifest(self, job_id: uuid.UUID) -> dict:
+        """Read the manifest of the job, empty if it does not exist."""
+        try:
+            with self.fs.open(
+                posixpath.join(self._job_path(job_id), MANIFEST_NAME), "rb"
+            ) as manifest:
+                return json.load(manifest)
+        except FileNotFoundError:
+            return {}
+
+    def _write_manifest(self, job_id: uuid.UUID, manifest: dict):
+        """Write the manifest of the job."""
+        with self.fs.open(
+            posixpath.join(self._job_path(job_id), MANIFEST_NAME), "wb"
+        ) as target:
+            target.write(json.dumps(manifest).encode())
+
+    def write(
+        self,
+        job_id: uuid.UUID,
+        name: str,
+        source: Union[bytes, IO[bytes]],
+        media_type: Optional[str] = None,
+        roles: Optional[list[str]] = None,
+    ) -> ResultAsset:
+        """Write a result file of the job, computing its size and checksum on the way.
+
+        The manifest of a job is rewritten for every file, files of the same job should be written one at a time.
+
+        Args:
+            job_id (uuid.UUID): The job.
+            name (str): The path of the file relative to the results of the job.
+            source (Union[bytes, IO[bytes]]): The content, or a binary file object it is copied from in chunks.
+            media_type (Optional[str]): The media type of the file, guessed from the name if not given.
+            roles (Optional[list[str]]): The STAC roles of the file, defaults to data.
+
+        Returns:
+            ResultAsset: The metadata of the written file.
+        """
+        path = self.path(job_id, name)
+        self.fs.makedirs(posixpath.dirname(path), exist_ok=True)
+
+        digest = hashlib.sha256()
+        size = 0
+        with self.fs.open(path, "wb") as target:
+            if isinstance(source, bytes):
+                chunks = [source]
+            else:
+                chunks = iter(lambda: source.read(self.chunk_size), b"")
+            for chunk in chunks:
+                digest.update(chunk)
+                size += len(chunk)
+                target.write(chunk)
+
+        asset = ResultAsset(
+            name=posixpath.normpath(name),
+            size=size,
+            checksum=SHA256_MULTIHASH_PREFIX + digest.hexdigest(),
+            media_type=media_type or mimetypes.guess_type(name)[0],
+            roles=roles or ["data"],
+        )
+        manifest = self._read_manifest(job_id)
+        manifest[asset.name] = asset.dict(exclude={"name"})
+        self._write_manifest(job_id, manifest)
+        return asset
+
+    def put_file(
+        self,
+        job_id: uuid.UUID,
+        local_path: str,
+        name: Optional[str] = None,
+        media_type: Optional[str] = None,
+    ) -> ResultAsset:
+        """Write a local file as a result file of the job.
+
+        Args:
+            job_id (uuid.UUID): The job.
+            local_path (str): The path of the local file.
+            name (Optional[str]): The path of the file relative to the results of the job, defaults to the file name.
+            media_type (Optional[str]): The media type of the file, guessed from the name if not given.
+
+        Returns:
+            ResultAsset: The metadata of the written file.
+        """
+        with open(local_path, "rb") as source:
+            return self.write(
+                job_id, name or posixpath.basename(local_path), source, media_type
+            )
+
+    def assets(self, job_id: uuid.UUID) -> list[ResultAsset]:
+        """List the result files of the job.
+
+        Files that were not written through the store are listed with the size from the filesystem, without checksum.
+
+        Args:
+            job_id (uuid.UUID): The job.
+
+        Returns:
+            list[ResultAsset]: The result files, sorted by name.
+        """
+        job_path = self._job_path(job_id)
+        try:
+            found = self.fs.find(job_path, detail=True)
+        except FileNotFoundError:
+            return []
+        manifest = self._read_manifest(job_id)
+
+        assets = []
+        for path, info in found.items():
+            name = posixpath.relpath(
+                self.fs._strip_protocol(path), self.fs._strip_protocol(job_path)
+            )
+            if name == MANIFEST_NAME:
+                continue
+            if name in manifest:
+                assets.append(ResultAsset(name=name, **manifest[name]))
+            else:
+                assets.append(
+                    ResultAsset(
+                        name=name,
+                        size=info["size"],
+                        media_type=mimetypes.guess_type(name)[0],
+                    )
+                )
+        return sorted(assets, key=lambda asset: asset.name)
+
+    def asset(self, job_id: uuid.UUID, name: str) -> ResultAsset:
+        """Get the metadata of a result file of the job.
+
+        Args:
+            job_id (uuid.UUID): The job.
+            name (str): The path of the file relative to the results of the job.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+
+        Returns:
+            ResultAsset: The metadata of the file.
+        """
+        path = self.path(job_id, name)
+        info = self.fs.info(path)
+        if info["type"] != "file":
+            raise FileNotFoundError(name)
+
+        name = posixpath.normpath(name)
+        manifest = self._read_manifest(job_id)
+        if name in manifest:
+            return ResultAsset(name=name, **manifest[name])
+        return ResultAsset(
+            name=name, size=info["size"], media_type=mimetypes.guess_type(name)[0]
+        )
+
+    def open(self, job_id: uuid.UUID, name: str) -> IO[bytes]:
+        """Open a result file of the job for reading.
+
+        Args:
+            job_id (uuid.UUID): The job.
+            name (str): The path of the file relative to the results of the job.
+
+        Returns:
+            IO[bytes]: The binary file object.
+        """
+        return self.fs.open(self.path(job_id, name), "rb")
+
+    def delete(self, job_id: uuid.UUID):
+        """Delete all result files of the job.
+
+        Args:
+            job_id (uuid.UUID): The job.
+        """
+        try:
+            self.fs.rm(self._job_path(job_id), recursive=True)
+        except FileNotFoundError:
+            pass
+
+
+def content_disposition(name: str) -> str:
+    """Build the Content-Disposition header to download a file under its name.
+
+    Args:
+        name (str): The name of the file, any characters are allowed.
+
+    Returns:
+        str: The header value, with an ASCII filename for old clients and the exact UTF-8 filename* for the others.
+    """
+    # Characters other than printable ASCII are replaced, the quoted string escapes the backslashes and quotes.
+    ascii_name = "".join(c if " " <= c <= "~" else "_" for c in name)
+    ascii_name = ascii_name.replace("\\", "\\\\").replace('"', '\\"')
+    return f"attachment; filename=\"{ascii_name}\"; filename*=UTF-8''{quote(name, safe='')}"
+
+
+def parse_range(range_header: Optional[str], size: int) -> Optional[tuple[int, int]]:
+    """Parse a single byte range of a Range header.
+
+    Args:
+        range_header (Optional[str]): The value of the Range header.
+        size (int): The size of the file in bytes.
+
+    Raises:
+        ValueError: If the range can not be satisfied.
+
+    Returns:
+        Optional[tuple[int, int]]: The first and last byte of the range, None to send the whole file, e.g. for a
+        missing header or for several ranges.
+    """
+    if not range_header:
+        return None
+    match = RANGE_PATTERN.match(range_header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    else:
+        # A suffix range, the last bytes of the file.
+        start = max(size - int(last), 0)
+        end = size - 1
+
+    if start > end or start >= size:
+        raise ValueError(range_header)
+    return start, end
+
+
+class AssetResponse(Response):
+    """Streams a result file, or a byte range of it, to the client.
+
+    The file is read in chunks of the store's chunk size. When the file is stored locally and the server supports the
+    ASGI zerocopysend extension, the file is handed to the server to send it without copying it through Python.
+    """
+
+    def __init__(
+        self,
+        store: ResultStore,
+        job_id: uuid.UUID,
+        asset: ResultAsset,
+        range_header: Optional[str] = None,
+        if_range: Optional[str] = None,
+    ) -> None:
+        """Initialize the AssetResponse.
+
+        Args:
+            store (ResultStore): The store the file is in.
+            job_id (uuid.UUID): The job.
+            asset (ResultAsset): The metadata of the file.
+            range_header (Optional[str]): The Range header of the request.
+            if_range (Optional[str]): The If-Range header of the request, the range is only sent if it matches the ETag.
+        """
+        self.store = store
+        self.job_id = job_id
+        self.asset = asset
+        self.background = None
+        self.media_type = asset.media_type or "application/octet-stream"
+
+        etag = f'"{asset.checksum}"' if asset.checksum else None
+        headers = {
+            "Accept-Ranges": "bytes",
+            "Content-Disposition": content_disposition(posixpath.basename(asset.name)),
+        }
+        if etag:
+            headers["ETag"] = etag
+
+        if if_range is not None and if_range != etag:
+            range_header = None
+
+        self.start, self.end = 0, asset.size - 1
+        self.status_code = 200
+        try:
+            requested = parse_range(range_header, asset.size)
+        except ValueError:
+            self.status_code = 416
+            self.start, self.end = 0, -1
+            headers["Content-Range"] = f"bytes */{asset.size}"
+            requested = None
+
+        if requested:
+            self.start, self.end = requested
+            self.status_code = 206
+            headers["Content-Range"] = f"bytes {self.start}-{self.end}/{asset.size}"
+
+        headers["Content-Length"] = str(self.end - self.start + 1)
+        self.init_headers(headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Send the file, or the range of it, until it is sent or the client disconnects."""
+        async with anyio.create_task_group() as task_group:
+
+            async def wrap(func: Callable[[], Awaitable[None]]) -> None:
+                await func()
+                task_group.cancel_scope.cancel()
+
+            task_group.start_soon(wrap, partial(self._send_file, scope, send))
+            await wrap(partial(self._listen_for_disconnect, receive))
+
+    async def _listen_for_disconnect(self, receive: Receive) -> None:
+        """Wait for the client to disconnect."""
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+
+    async def _send_file(self, scope: Scope, send: Send) -> None:
+        """Send the file, or the range of it, in chunks."""
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+
+        count = self.end - self.start + 1
+        if scope.get("method") == "HEAD" or count <= 0:
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        local_path = self.store.local_path(self.job_id, self.asset.name)
+        if local_path and "http.response.zerocopysend" in scope.get("extensions", {}):
+            with open(local_path, "rb") as source:
+                await send(
+                    {
+                        "type": "http.response.zerocopysend",
+                        "file": source,
+                        "offset": self.start,
+                        "count": count,
+                    }
+                )
+            return
+
+        source = await run_in_threadpool(self.store.open, self.job_id, self.asset.name)
+        try:
+            await run_in_threadpool(source.seek, self.start)
+            while count > 0:
+                chunk = await run_in_threadpool(
+                    source.read, min(self.store.chunk_size, count)
+                )
+                if not chunk:
+                    break
+                count -= len(chunk)
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": count > 0,
+                    }
+                )
+            if count > 0:
+                # The file shrank since its size was read, end the response anyway.
+                await send({"type": "http.response.body", "body": b""})
+        finally:
+            await run_in_threadpool(source.close)
@@ -0,0 +1,162 @@
+"""Class to decide which queued batch jobs are dispatched next, sharing the workers fairly between users.
+
+Without a scheduler the queue dispatches the oldest jobs first, so a user queueing many jobs at once delays everyone
+else's. The FairShareScheduler instead dispatches the job of the user with the smallest weighted share of the running
+jobs, where the weight comes from the user's billing plan. Per user caps bound how many jobs of a user run at once,
+and priority aging makes sure jobs that waited long are dispatched eventually, whatever their user's share.
+
+Classes:
+    - FairShareScheduler: Selects the queued jobs to dispatch by weighted fair share across users.
+"""
+import datetime
+import uuid
+from collections import OrderedDict, deque
+from typing import Callable, Optional
+
+from pydantic import BaseModel
+
+from openeo_fastapi.api.types import Billing
+
+
+class FairShareScheduler:
+    """Selects the queued jobs to dispatch by weighted fair share across users.
+
+    Each time a job is dispatched, the user with the lowest score with waiting jobs and below their cap is picked:
+
+        score = (running jobs of the user + 1) / weight of the user's plan - aging * seconds their oldest job waited
+
+    and their oldest job is dispatched. Ties go to the user whose oldest job waited the longest.
+    """
+
+    def __init__(
+        self,
+        plan_weights: Optional[dict[str, float]] = None,
+        default_plan: Optional[str] = None,
+        plan_of: Optional[Callable[[uuid.UUID], Optional[str]]] = None,
+        max_running: Optional[int] = None,
+        plan_max_running: Optional[dict[str, int]] = None,
+        aging: float = 0.0,
+    ) -> None:
+        """Initialize the FairShareScheduler.
+
+        Args:
+            plan_weights (Optional[dict[str, float]]): The weight of each plan, plans without a weight have weight 1.
+            default_plan (Optional[str]): The plan of users plan_of returns no plan for.
+            plan_of (Optional[Callable[[uuid.UUID], Optional[str]]]): Gets the plan of a user from their user_id.
+            max_running (Optional[int]): The maximum number of jobs of a user running at once, None for no cap.
+            plan_max_running (Optional[dict[str, int]]): The cap of the users of a plan, overriding max_running.
+            aging (float): The score a job gains per second it waits, 0 to disable aging.
+        """
+        self.plan_weights = {
+            plan.lower(): weight for plan, weight in (plan_weights or {}).items()
+        }
+        self.default_plan = default_plan
+        self.plan_of = plan_of
+        self.max_running = max_running
+        self.plan_max_running = {
+            plan.lower(): cap for plan, cap in (plan_max_running or {}).items()
+        }
+        self.aging = aging
+
+    @classmethod
+    def from_billing(cls, billing: Billing, **kwargs) -> "FairShareScheduler":
+        """Create the scheduler for the plans of the backend's billing.
+
+        Args:
+            billing (Billing): The billing of the backend, its default plan is used for users without a plan.
+            **kwargs: The other arguments of the FairShareScheduler.
+
+        Raises:
+            ValueError: If a weight or cap is given for a plan the billing does not offer.
+
+        Returns:
+            FairShareScheduler: The scheduler.
+        """
+        plans = {plan.name.lower() for plan in billing.plans or []}
+        for argument in ["plan_weights", "plan_max_running"]:
+            unknown = {plan.lower() for plan in kwargs.get(argument) or {}} - plans
+            if unknown:
+                raise ValueError(f"The {argument} contain unknown plans: {unknown}")
+
+        return cls(default_plan=billing.default_plan, **kwargs)
+
+    def _plan(self, user_id: uuid.UUID) -> Optional[str]:
+        """Get the lower case plan of the user."""
+        plan = self.plan_of(user_id) if self.plan_of else None
+        plan = plan or self.default_plan
+        return plan.lower() if plan else None
+
+    def weight(self, user_id: uuid.UUID) -> float:
+        """Get the weight of the user's plan.
+
+        Args:
+            user_id (uuid.UUID): The user.
+
+        Returns:
+            float: The weight.
+        """
+        return self.plan_weights.get(self._plan(user_id), 1.0)
+
+    def cap(self, user_id: uuid.UUID) -> Optional[int]:
+        """Get the maximum number of jobs of the user running at once.
+
+        Args:
+            user_id (uuid.UUID): The user.
+
+        Returns:
+            Optional[int]: The cap, None for no cap.
+        """
+        return self.plan_max_running.get(self._plan(user_id), self.max_running)
+
+    def select(
+        self,
+        waiting: list[BaseModel],
+        running: dict[uuid.UUID, int],
+        limit: int,
+        now: Optional[datetime.datetime] = None,
+    ) -> list[BaseModel]:
+        """Select the waiting jobs to dispatch.
+
+        Args:
+            waiting (list[BaseModel]): The waiting jobs, with a user_id and an enqueued_at, e.g. QueuedJobs.
+            running (dict[uuid.UUID, int]): The number of running jobs per user.
+            limit (int): The maximum number of jobs to select.
+            now (Optional[datetime.datetime]): The current time the waits are measured to, defaults to now.
+
+        Returns:
+            list[BaseModel]: The selected jobs, in the order they should be dispatched.
+        """
+        now = now or datetime.datetime.now()
+        running = dict(running)
+
+        per_user: OrderedDict[uuid.UUID, deque] = OrderedDict()
+        for job in sorted(waiting, key=lambda job: job.enqueued_at):
+            per_user.setdefault(job.user_id, deque()).append(job)
+
+        weights = {user_id: self.weight(user_id) for user_id in per_user}
+        caps = {user_id: self.cap(user_id) for user_id in per_user}
+
+        selected = []
+        while len(selected) < limit:
+            best = None
+            for user_id, jobs in per_user.items():
+                cap = caps[user_id]
+                if not jobs or (cap is not None and running.get(user_id, 0) >= cap):
+                    continue
+
+                oldest = jobs[0]
+                waited = (now - oldest.enqueued_at).total_seconds()
+                score = (running.get(user_id, 0) + 1) / weights[
+                    user_id
+                ] - self.aging * waited
+                key = (score, oldest.enqueued_at)
+                if best is None or key < best[0]:
+                    best = (key, user_id)
+
+            if best is None:
+                break
+
+            user_id = best[1]
+            selected.append(per_user[user_id].popleft())
+            running[user_id] = running.get(user_id, 0) + 1
+        return selected
@@ -4,6 +4,8 @@ from typing import Any, Optional
 
 from pydantic import BaseSettings, HttpUrl, validator
 
+from openeo_fastapi.client.policies import compile_policies, parse_policy
+
 
 class AppSettings(BaseSettings):
     """The application settings that need to be defined when the app is initialised."""
@@ -46,14 +48,89 @@ class AppSettings(BaseSettings):
     A valid policy to allow members from the group staff would be, "groups, /staff". This would be the value provided to OIDC_POLICIES.
 
     If you wanted to include users from another group called "/trial", the updated value to OIDC_POLICIES would be, "groups, /staff && groups, /trial"
+
+    Conditions which all need to match are combined with ";" in a single policy, e.g. "groups, /staff; email_verified, true".
+    Nested claims are reached with ".", e.g. "realm_access.roles, admin", and a value ending with "*" matches any value
+    starting with the text before it, e.g. "eduperson_entitlement, urn:mace:egi.eu:group:vo.openeo.cloud:*".
     ```
+
+    The policies are compiled once when the settings are loaded.
     """
+    OIDC_USERINFO_FROM_TOKEN: bool = False
+    """Whether the sub and policy claims are read from the verified access token instead of the userinfo endpoint.
+
+    The userinfo endpoint is still used for tokens which are missing the sub claim or a claim used by the OIDC_POLICIES.
+    """
+    OIDC_AUDIENCE: Optional[str]
+    """The audience access tokens need to be issued for. If not set, the audience of tokens is not checked."""
+    OIDC_CACHE_TTL: float = 300.0
+    """The seconds the issuer configuration and JWKS are cached for, when the issuer does not send a Cache-Control max-age."""
+    OIDC_JWKS_REFRESH_INTERVAL: float = 30.0
+    """The minimum seconds between refetching the issuer configuration or JWKS, e.g. when a token is signed with an unknown key or the issuer does not allow caching."""
+    OIDC_TOKEN_CACHE_TTL: float = 60.0
+    """The seconds a validated token is remembered for, never beyond the token's own expiry. 0 disables the cache."""
+    OIDC_TOKEN_CACHE_MAX_ENTRIES: int = 10000
+    """The maximum number of validated tokens remembered before the least recently used is forgotten."""
+    OIDC_USER_CACHE_MAX_ENTRIES: int = 10000
+    """The maximum number of users remembered by their OIDC subject before the least recently used is forgotten. 0 disables the cache."""
+    OIDC_HTTP_TIMEOUT: float = 10.0
+    """The seconds a request to the OIDC issuer may take when validating tokens asynchronously."""
+    OIDC_HTTP_MAX_CONNECTIONS: int = 100
+    """The maximum number of connections to the OIDC issuer when validating tokens asynchronously."""
+    OIDC_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    """The maximum number of idle connections kept open to the OIDC issuer when validating tokens asynchronously."""
+    LOGS_PAGE_SIZE: int = 1000
+    """The default and maximum number of log entries returned by GET /jobs/{job_id}/logs at once."""
+    LOGS_POLL_INTERVAL: float = 1.0
+    """The seconds between checks for new log entries when the logs are streamed as server-sent events."""
+    RESULTS_STORE: Optional[str]
+    """The fsspec URL the results of batch jobs are stored under, e.g. file:///data/results or s3://bucket/results.
+
+    If not set, GET /jobs/{job_id}/results is not supported. Credentials for object stores are read from the environment
+    the way the fsspec implementation of the store does, e.g. AWS_ACCESS_KEY_ID for s3.
+    """
+    RESULTS_CHUNK_SIZE: int = 1048576
+    """The size in bytes of the chunks result files are streamed to clients in."""
     STAC_VERSION: str = "1.0.0"
     """The STAC Version that is being supported by this deployments data discovery endpoints."""
     STAC_API_URL: HttpUrl
     """The STAC URL of the catalogue that the application deployment will proxy to."""
+    STAC_API_URLS: Optional[list[HttpUrl]]
+    """The STAC URLs of additional catalogues to federate with the STAC_API_URL catalogue.
+
+    Collections are discovered from all catalogues concurrently. If a collection id exists in several catalogues,
+    the first catalogue listing it is used, starting with STAC_API_URL.
+    """
+    STAC_UPSTREAM_TIMEOUT: float = 10.0
+    """The seconds each catalogue is given to list its collections before it is skipped."""
     STAC_COLLECTIONS_WHITELIST: Optional[list[str]]
     """The collection ids to filter by when proxying to the Stac catalogue."""
+    STAC_CONNECTION_LIMIT: int = 100
+    """The total number of simultaneous connections the STAC proxy session may hold open."""
+    STAC_CONNECTION_LIMIT_PER_HOST: int = 20
+    """The number of simultaneous connections the STAC proxy session may hold open to a single host."""
+    STAC_KEEPALIVE_TIMEOUT: float = 30.0
+    """The seconds an idle connection to the STAC catalogue is kept alive for reuse."""
+    STAC_DNS_CACHE_TTL: int = 300
+    """The seconds resolved STAC catalogue hostnames are cached for."""
+    STAC_REQUEST_TIMEOUT: float = 30.0
+    """The total seconds a single proxied request to the STAC catalogue may take."""
+    STAC_CONNECT_TIMEOUT: float = 10.0
+    """The seconds allowed to acquire a connection to the STAC catalogue."""
+    STAC_READ_TIMEOUT: float = 30.0
+    """The seconds a streamed response from the STAC catalogue may go without sending data, streamed responses have no total timeout."""
+    STAC_CACHE_TTL: float = 300.0
+    """The seconds proxied collection metadata is served from the cache before being refreshed. 0 disables the cache."""
+    STAC_CACHE_STALE_TTL: float = 3600.0
+    """The seconds after STAC_CACHE_TTL that stale metadata is still served while it is refreshed in the background."""
+    STAC_CACHE_MAX_ENTRIES: int = 1024
+    """The maximum number of proxied responses kept in the in-memory collection cache."""
+    STAC_COLLECTIONS_PRESERIALIZE: bool = False
+    """Whether GET /collections is served from JSON bytes serialized once per cache entry, with ETag support."""
+    STAC_ITEMS_STREAMING: bool = False
+    """Whether GET /collections/{collection_id}/items streams the upstream body through instead of parsing it."""
+    STAC_ITEMS_CHUNK_SIZE: int = 65536
+    """The size in bytes of the chunks streamed from the STAC catalogue."""
 
     @validator("STAC_API_URL")
     def ensure_endswith_slash(cls, v: str) -> str:
@@ -62,6 +139,13 @@ class AppSettings(BaseSettings):
             return v
         return v.__add__("/")
 
+    @validator("STAC_API_URLS", each_item=True)
+    def ensure_each_endswith_slash(cls, v: str) -> str:
+        """Ensure each of the STAC_API_URLS ends with a trailing slash."""
+        if v.endswith("/"):
+            return v
+        return v.__add__("/")
+
     @validator("OIDC_POLICIES", pre=True)
     def split_oidc_policies_str_to_list(cls, v: list) -> str:
         """Ensure the OIDC_POLICIES are split and formatted correctly."""
@@ -76,16 +160,12 @@ class AppSettings(BaseSettings):
 
         cleaned_policies = []
         for policy in v:
-            try:
-                # TODO Could add a class to handle each oidc policy and return that list instead of just checking value unpacking.
-                no_spaces = policy.replace(" ", "")
-                key, value = no_spaces.split(",")
-            except ValueError:
-                raise ValueError(
-                    f"Policy '{policy}' contains too many comma seperated values."
-                )
-
+            no_spaces = policy.replace(" ", "")
+            parse_policy(no_spaces)
             cleaned_policies.append(no_spaces)
+
+        # Compile the policies now, so the first request does not pay for it.
+        compile_policies(tuple(cleaned_policies))
         return cleaned_policies
 
     class Config:
@@ -94,7 +174,7 @@ class AppSettings(BaseSettings):
         @classmethod
         def parse_env_var(cls, field_name: str, raw_val: str) -> Any:
             """Parse any variables and handle and csv lists into python list type."""
-            if field_name == "STAC_COLLECTIONS_WHITELIST":
+            if field_name in ["STAC_COLLECTIONS_WHITELIST", "STAC_API_URLS"]:
                 return [str(x) for x in raw_val.split(",")]
             elif field_name == "OIDC_POLICIES":
                 return [str(x) for x in raw_val.split("&&") if x != ""]
@@ -41,6 +41,10 @@ metadata = BASE.metadata
 """
 
 
+REVISION_SCRIPT_IMPORTS = "import openeo_fastapi.client.psql.models\n"
+"""Imports to add to the alembic script.py.mako, so revisions can use the column types of the openeo_fastapi models."""
+
+
 def get_revision_template():
     """
     Generate the default revision file for the openeo api app.
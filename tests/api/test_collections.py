@@ -1,10 +1,19 @@
+import asyncio
+import json
 import os
 from unittest.mock import patch
 
+import aiohttp
 import pytest
 from aioresponses import aioresponses
+from fastapi.testclient import TestClient
+from yarl import URL
 
-from openeo_fastapi.client.collections import Collection
+from openeo_fastapi.client.collections import (
+    Collection,
+    CollectionRegister,
+    rewrite_stream,
+)
 
 
 @pytest.mark.asyncio
@@ -92,3 +101,335 @@ async def test_get_collection_item(collections_core, s1_collection_item):
 
         assert data == s1_collection_item
         m.assert_called_once_with(get_item_url)
+
+
+@pytest.mark.asyncio
+async def test_proxy_session_reused(collections_core, s2a_collection):
+    with aioresponses() as m:
+        get_collection_url = (
+            f"http://test-stac-api.mock.com/api/collections/Sentinel-2A"
+        )
+        m.get(get_collection_url, payload=s2a_collection, repeat=True)
+
+        await collections_core.get_collection("Sentinel-2A")
+        session = collections_core._session
+
+        await collections_core.get_collection("Sentinel-2A")
+
+        assert collections_core._session is session
+        assert not session.closed
+
+    await collections_core.close_session()
+
+    assert session.closed
+    assert collections_core._session is None
+
+
+def test_proxy_session_lifespan(core_api):
+    collections = core_api.client.collections
+
+    with TestClient(core_api.app):
+        session = collections._session
+
+        assert session is not None
+        assert not session.closed
+
+    assert session.closed
+    assert collections._session is None
+
+
+@pytest.mark.asyncio
+async def test_get_collection_cached(collections_core, s2a_collection):
+    with aioresponses() as m:
+        get_collection_url = (
+            f"http://test-stac-api.mock.com/api/collections/Sentinel-2A"
+        )
+        m.get(get_collection_url, payload=s2a_collection, repeat=True)
+
+        first = await collections_core.get_collection("Sentinel-2A")
+        second = await collections_core.get_collection("Sentinel-2A")
+
+        assert first == second == Collection(**s2a_collection)
+        m.assert_called_once_with(get_collection_url)
+        assert collections_core.cache.stats.misses == 1
+        assert collections_core.cache.stats.hits == 1
+
+        await collections_core.cache.invalidate()
+        await collections_core.get_collection("Sentinel-2A")
+
+        assert collections_core.cache.stats.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_get_collection_cache_coalesces_requests(
+    collections_core, s2a_collection
+):
+    with aioresponses() as m:
+        get_collection_url = (
+            f"http://test-stac-api.mock.com/api/collections/Sentinel-2A"
+        )
+        m.get(get_collection_url, payload=s2a_collection, repeat=True)
+
+        results = await asyncio.gather(
+            *[collections_core.get_collection("Sentinel-2A") for _ in range(5)]
+        )
+
+        assert all(r == Collection(**s2a_collection) for r in results)
+        m.assert_called_once_with(get_collection_url)
+        assert collections_core.cache.stats.refreshes == 1
+
+
+@pytest.mark.asyncio
+async def test_get_collection_cache_stale_while_revalidate(
+    collections_core, s2a_collection
+):
+    collections_core.cache.ttl = 0.0
+    collections_core.cache.stale_ttl = 60.0
+
+    with aioresponses() as m:
+        get_collection_url = (
+            f"http://test-stac-api.mock.com/api/collections/Sentinel-2A"
+        )
+        m.get(get_collection_url, payload=s2a_collection, repeat=True)
+
+        await collections_core.get_collection("Sentinel-2A")
+        stale = await collections_core.get_collection("Sentinel-2A")
+
+        assert stale == Collection(**s2a_collection)
+        assert collections_core.cache.stats.stale_hits == 1
+
+        # Let the background refresh finish.
+        await asyncio.sleep(0.1)
+
+        assert collections_core.cache.stats.refreshes == 2
+        assert len(m.requests[("GET", URL(get_collection_url))]) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_collection_cache_disabled(collections_core, s2a_collection):
+    collections_core.settings.STAC_CACHE_TTL = 0
+
+    with aioresponses() as m:
+        get_collection_url = (
+            f"http://test-stac-api.mock.com/api/collections/Sentinel-2A"
+        )
+        m.get(get_collection_url, payload=s2a_collection, repeat=True)
+
+        await collections_core.get_collection("Sentinel-2A")
+        await collections_core.get_collection("Sentinel-2A")
+
+        assert len(m.requests[("GET", URL(get_collection_url))]) == 2
+        assert collections_core.cache.stats.misses == 0
+
+
+def test_get_collections_preserialized(core_api, app_settings, collections):
+    core_api.client.collections.settings.STAC_COLLECTIONS_PRESERIALIZE = True
+
+    test_app = TestClient(core_api.app)
+
+    with aioresponses() as m:
+        get_collections_url = f"http://test-stac-api.mock.com/api/collections"
+        m.get(get_collections_url, payload=collections, repeat=True)
+
+        response = test_app.get(
+            f"{app_settings.OPENEO_PREFIX}/collections",
+            headers={"Accept-Encoding": "identity"},
+        )
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert len(response.json()["collections"]) == len(collections["collections"])
+
+        etag = response.headers["etag"]
+
+        response = test_app.get(
+            f"{app_settings.OPENEO_PREFIX}/collections",
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"] != etag
+        assert len(response.json()["collections"]) == len(collections["collections"])
+
+        response = test_app.get(
+            f"{app_settings.OPENEO_PREFIX}/collections",
+            headers={"Accept-Encoding": "identity", "If-None-Match": etag},
+        )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        m.assert_called_once_with(get_collections_url)
+
+
+@pytest.mark.asyncio
+async def test_get_collection_items_forwards_pagination(
+    collections_core, s1_collection_items
+):
+    with aioresponses() as m:
+        get_items_url = (
+            f"http://test-stac-api.mock.com/api/collections/SENTINEL1_GRD/items"
+        )
+        m.get(
+            get_items_url + "?limit=5&token=next:abc",
+            payload=s1_collection_items,
+        )
+
+        data = await collections_core.get_collection_items(
+            "SENTINEL1_GRD", limit=5, token="next:abc"
+        )
+
+        assert data == s1_collection_items
+        m.assert_called_once_with(
+            get_items_url, params={"limit": "5", "token": "next:abc"}
+        )
+
+
+@pytest.mark.asyncio
+async def test_rewrite_stream_split_chunks():
+    async def chunks():
+        for chunk in [b'{"href":"http://up', b"stream/a/", b'1","http://upstream/a/2"']:
+            yield chunk
+
+    out = b"".join(
+        [c async for c in rewrite_stream(chunks(), b"http://upstream/a/", b"/x/")]
+    )
+
+    assert out == b'{"href":"/x/1","/x/2"'
+
+
+def test_get_collection_items_streaming(core_api, app_settings, s1_collection_items):
+    core_api.client.collections.settings.STAC_ITEMS_STREAMING = True
+    core_api.client.collections.settings.STAC_ITEMS_CHUNK_SIZE = 7
+
+    upstream_items = "http://test-stac-api.mock.com/api/collections/SENTINEL1_GRD/items"
+    s1_collection_items["links"] = [
+        {"rel": "next", "href": f"{upstream_items}?token=next:abc"},
+    ]
+
+    test_app = TestClient(core_api.app)
+
+    with aioresponses() as m:
+        m.get(
+            upstream_items + "?limit=10",
+            body=json.dumps(s1_collection_items),
+            content_type="application/geo+json",
+        )
+
+        response = test_app.get(
+            f"{app_settings.OPENEO_PREFIX}/collections/SENTINEL1_GRD/items?limit=10"
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/geo+json"
+        assert response.json()["features"] == s1_collection_items["features"]
+        assert response.json()["links"][0]["href"] == (
+            f"http://{app_settings.API_DNS}{app_settings.OPENEO_PREFIX}"
+            "/collections/SENTINEL1_GRD/items?token=next:abc"
+        )
+
+        # Streamed bodies are only limited by the time between reads, not in total.
+        (request,) = m.requests[("GET", URL(upstream_items + "?limit=10"))]
+        timeout = request.kwargs["timeout"]
+        assert timeout.total is None
+        assert timeout.sock_read == app_settings.STAC_READ_TIMEOUT
+        assert timeout.connect == app_settings.STAC_CONNECT_TIMEOUT
+
+
+@pytest.mark.asyncio
+async def test_get_collections_federated(collections_core, collections):
+    collections_core.settings.STAC_API_URLS = [
+        "http://second-stac-api.mock.com/api/",
+        "http://broken-stac-api.mock.com/api/",
+    ]
+
+    first, second = collections["collections"][0], collections["collections"][1]
+
+    with aioresponses() as m:
+        m.get(
+            "http://test-stac-api.mock.com/api/collections",
+            payload={"collections": [first], "links": collections["links"]},
+            repeat=True,
+        )
+        m.get(
+            "http://second-stac-api.mock.com/api/collections",
+            payload={"collections": [first, second], "links": []},
+            repeat=True,
+        )
+        m.get(
+            "http://broken-stac-api.mock.com/api/collections",
+            exception=aiohttp.ClientConnectionError(),
+            repeat=True,
+        )
+        second_url = f"http://second-stac-api.mock.com/api/collections/{second['id']}"
+        m.get(second_url, payload=second)
+
+        data = await collections_core.get_collections()
+
+        assert [c.id for c in data["collections"]] == [first["id"], second["id"]]
+        assert data["links"] == collections["links"]
+
+        await collections_core.cache.invalidate()
+        collection = await collections_core.get_collection(second["id"])
+
+        assert collection == Collection(**second)
+        assert len(m.requests[("GET", URL(second_url))]) == 1
+
+
+@pytest.mark.asyncio
+async def test_federated_routing_with_shared_cache(collections_core, collections):
+    """Test a register routes to the owning catalogue when another one filled the shared cache."""
+    collections_core.settings.STAC_API_URLS = ["http://second-stac-api.mock.com/api/"]
+    first, second = collections["collections"][0], collections["collections"][1]
+
+    other_core = CollectionRegister(collections_core.settings)
+    other_core.cache = collections_core.cache
+
+    with aioresponses() as m:
+        m.get(
+            "http://test-stac-api.mock.com/api/collections",
+            payload={"collections": [first], "links": collections["links"]},
+        )
+        m.get(
+            "http://second-stac-api.mock.com/api/collections",
+            payload={"collections": [second], "links": []},
+        )
+        second_url = f"http://second-stac-api.mock.com/api/collections/{second['id']}"
+        m.get(second_url, payload=second)
+
+        await other_core.get_collections()
+        collection = await collections_core.get_collection(second["id"])
+
+        assert collection == Collection(**second)
+        assert len(m.requests[("GET", URL(second_url))]) == 1
+
+
+@pytest.mark.asyncio
+async def test_federated_routing_without_cache(collections_core, collections):
+    """Test the index is rebuilt without a cache when a collection was added to a catalogue since."""
+    collections_core.settings.STAC_API_URLS = ["http://second-stac-api.mock.com/api/"]
+    collections_core.settings.STAC_CACHE_TTL = 0
+    first, second = collections["collections"][0], collections["collections"][1]
+
+    with aioresponses() as m:
+        m.get(
+            "http://test-stac-api.mock.com/api/collections",
+            payload={"collections": [first], "links": collections["links"]},
+            repeat=True,
+        )
+        m.get(
+            "http://second-stac-api.mock.com/api/collections",
+            payload={"collections": [], "links": []},
+        )
+        m.get(
+            "http://second-stac-api.mock.com/api/collections",
+            payload={"collections": [second], "links": []},
+        )
+        second_url = f"http://second-stac-api.mock.com/api/collections/{second['id']}"
+        m.get(second_url, payload=second)
+
+        await collections_core.get_collections()
+        collection = await collections_core.get_collection(second["id"])
+
+        assert collection == Collection(**second)
+        assert len(m.requests[("GET", URL(second_url))]) == 1
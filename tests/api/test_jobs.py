@@ -1,8 +1,16 @@
 import json
 import uuid
 
+import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from openeo_fastapi.api.app import OpenEOApi
+from openeo_fastapi.client.executor import SyncJobExecutor
+from openeo_fastapi.client.jobs import AsyncJobsRegister, Job, JobsRegister
+from openeo_fastapi.client.psql.engine import update
+from openeo_fastapi.client.results import ResultStore
+from tests.client.test_executor import execute
 from tests.utils import patch_request, post_request
 
 
@@ -93,6 +101,12 @@ def test_update_job(
 
     assert response.json()["process"]["id"] == new_pg_id
 
+    response = patch_request(
+        test_app, f"{app_settings.OPENEO_PREFIX}/jobs/{uuid.uuid4()}", updated_pg
+    )
+
+    assert response.status_code == 404
+
 
 def test_get_job(
     mocked_oidc_config,
@@ -135,10 +149,6 @@ def test_not_implemented(
 
     /jobs/{job_id} DELETE
     /jobs/{job_id}/estimate GET
-    /jobs/{job_id}/logs GET
-    /jobs/{job_id}/results GET
-    /jobs/{job_id}/results POST
-    /jobs/{job_id}/results DELETE
     /result POST
     """
 
@@ -152,8 +162,6 @@ def test_not_implemented(
 
     gets = [
         f"{app_settings.OPENEO_PREFIX}/jobs/{job_id}/estimate",
-        f"{app_settings.OPENEO_PREFIX}/jobs/{job_id}/logs",
-        f"{app_settings.OPENEO_PREFIX}/jobs/{job_id}/results",
     ]
 
     for get in gets:
@@ -165,7 +173,6 @@ def test_not_implemented(
         )
 
     posts = [
-        f"{app_settings.OPENEO_PREFIX}/jobs/{job_id}/results",
         f"{app_settings.OPENEO_PREFIX}/result",
     ]
 
@@ -179,7 +186,6 @@ def test_not_implemented(
 
     deletes = [
         f"{app_settings.OPENEO_PREFIX}/jobs/{job_id}",
-        f"{app_settings.OPENEO_PREFIX}/jobs/{job_id}/results",
     ]
 
     for delete in deletes:
@@ -189,3 +195,399 @@ def test_not_implemented(
                 headers={"Authorization": "Bearer oidc/egi/not-real"},
             )
         )
+
+
+def test_start_and_cancel_job(
+    mocked_oidc_config,
+    mocked_oidc_userinfo,
+    mocked_get_oidc_jwks,
+    mocked_validate_token,
+    job_post,
+    core_api,
+    app_settings,
+):
+    """
+    Test the /jobs/{job_id}/results endpoints queue and cancel the job.
+    """
+
+    test_app = TestClient(core_api.app)
+
+    response = post_request(test_app, f"{app_settings.OPENEO_PREFIX}/jobs", job_post)
+    job_id = response.headers["openeo-identifier"]
+    results = f"{app_settings.OPENEO_PREFIX}/jobs/{job_id}/results"
+    headers = {"Authorization": "Bearer oidc/egi/not-real"}
+
+    def status():
+        return test_app.get(
+            f"{app_settings.OPENEO_PREFIX}/jobs/{job_id}", headers=headers
+        ).json()["status"]
+
+    response = test_app.get(results, headers=headers)
+    assert response.status_code == 400
+    assert response.json()["code"] == "JobNotFinished"
+
+    assert test_app.post(results, headers=headers).status_code == 202
+    assert status() == "queued"
+
+    # Starting a queued job has no effect.
+    assert test_app.post(results, headers=headers).status_code == 202
+    assert status() == "queued"
+
+    assert test_app.delete(results, headers=headers).status_code == 204
+    assert status() == "canceled"
+
+    response = test_app.post(
+        f"{app_settings.OPENEO_PREFIX}/jobs/{uuid.uuid4()}/results", headers=headers
+    )
+    assert response.status_code == 404
+
+
+def test_get_logs(
+    mocked_oidc_config,
+    mocked_oidc_userinfo,
+    mocked_get_oidc_jwks,
+    mocked_validate_token,
+    job_post,
+    core_api,
+    app_settings,
+):
+    """
+    Test the /jobs/{job_id}/logs endpoint pages and streams the logs.
+    """
+    core_api.client.settings.LOGS_POLL_INTERVAL = 0.01
+    log_store = core_api.client.jobs.log_store
+
+    test_app = TestClient(core_api.app)
+    headers = {"Authorization": "Bearer oidc/egi/not-real"}
+
+    response = post_request(test_app, f"{app_settings.OPENEO_PREFIX}/jobs", job_post)
+    job_id = uuid.UUID(response.headers["openeo-identifier"])
+    logs = f"{app_settings.OPENEO_PREFIX}/jobs/{job_id}/logs"
+
+    log_store.append(
+        job_id,
+        [{"level": "info", "message": f"Step {i}."} for i in range(3)]
+        + [{"level": "error", "message": "Failed.", "code": "ProcessFailed"}],
+    )
+
+    response = test_app.get(logs, params={"limit": 2}, headers=headers)
+    assert response.status_code == 200
+    page = response.json()
+    assert page["level"] == "debug"
+    assert [entry["message"] for entry in page["logs"]] == ["Step 0.", "Step 1."]
+    next_link = page["links"][0]
+    assert next_link["rel"] == "next"
+    assert f"offset={page['logs'][-1]['id']}" in next_link["href"]
+
+    response = test_app.get(
+        logs, params={"limit": 2, "offset": page["logs"][-1]["id"]}, headers=headers
+    )
+    page = response.json()
+    assert [entry["message"] for entry in page["logs"]] == ["Step 2.", "Failed."]
+    assert page["logs"][-1]["code"] == "ProcessFailed"
+    assert page["links"] == []
+
+    response = test_app.get(logs, params={"level": "error"}, headers=headers)
+    assert [entry["message"] for entry in response.json()["logs"]] == ["Failed."]
+
+    response = test_app.get(logs, params={"offset": "invalid"}, headers=headers)
+    assert response.status_code == 400
+    assert response.json()["code"] == "OffsetInvalid"
+
+    response = test_app.get(
+        f"{app_settings.OPENEO_PREFIX}/jobs/{uuid.uuid4()}/logs", headers=headers
+    )
+    assert response.status_code == 404
+
+    # The stream of a job which was never started ends once the logs are sent.
+    last = log_store.read(job_id)[0][-1]
+    response = test_app.get(
+        logs,
+        headers={**headers, "Accept": "text/event-stream", "Last-Event-ID": last.id},
+    )
+    assert response.text == "event: end\ndata: created\n\n"
+
+    # The stream continues after the Last-Event-ID and ends once the job ended.
+    first = log_store.read(job_id, limit=1)[0][0]
+    update(Job, job_id, {"status": "error"})
+    response = test_app.get(
+        logs,
+        params={"limit": 1},
+        headers={
+            **headers,
+            "Accept": "text/event-stream",
+            "Last-Event-ID": first.id,
+        },
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = [event for event in response.text.split("\n\n") if event]
+    assert [event.splitlines()[1] for event in events] == ["event: log"] * 3 + [
+        "data: error"
+    ]
+    assert events[0].startswith("id: ")
+    assert [
+        json.loads(event.splitlines()[2][6:])["message"] for event in events[:3]
+    ] == [
+        "Step 1.",
+        "Step 2.",
+        "Failed.",
+    ]
+    assert events[-1] == "event: end\ndata: error"
+
+
+def test_get_results(
+    mocked_oidc_config,
+    mocked_oidc_userinfo,
+    mocked_get_oidc_jwks,
+    mocked_validate_token,
+    job_post,
+    core_api,
+    app_settings,
+    tmp_path,
+):
+    """
+    Test the /jobs/{job_id}/results endpoints list and stream the result files.
+    """
+    store = ResultStore(f"file://{tmp_path}", chunk_size=3)
+    core_api.client.jobs.results = store
+
+    test_app = TestClient(core_api.app)
+    headers = {"Authorization": "Bearer oidc/egi/not-real"}
+
+    response = post_request(test_app, f"{app_settings.OPENEO_PREFIX}/jobs", job_post)
+    job_id = uuid.UUID(response.headers["openeo-identifier"])
+    results = f"{app_settings.OPENEO_PREFIX}/jobs/{job_id}/results"
+
+    content = bytes(range(256)) * 4
+    asset = store.write(job_id, "out/result.tif", content)
+
+    response = test_app.get(f"{results}/out/result.tif", headers=headers)
+    assert response.status_code == 400
+    assert response.json()["code"] == "JobNotFinished"
+
+    update(Job, job_id, {"status": "finished"})
+
+    response = test_app.get(results, headers=headers)
+    assert response.status_code == 200
+    document = response.json()
+    assert document["type"] == "Feature"
+    assert document["id"] == str(job_id)
+    assert "geometry" in document and document["geometry"] is None
+    assert "bbox" not in document
+    assert document["properties"]["datetime"].endswith("Z")
+    assert document["properties"]["title"] == job_post["title"]
+    assert "description" not in document["properties"]
+    assert document["links"][0]["rel"] == "self"
+    result = document["assets"]["out/result.tif"]
+    assert result["href"].endswith(f"/jobs/{job_id}/results/out/result.tif")
+    assert result["type"] == "image/tiff"
+    assert result["file:size"] == 1024
+    assert result["file:checksum"] == asset.checksum
+
+    response = test_app.get(f"{results}/out/result.tif", headers=headers)
+    assert response.status_code == 200
+    assert response.content == content
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["content-length"] == "1024"
+    assert response.headers["etag"] == f'"{asset.checksum}"'
+
+    response = test_app.get(
+        f"{results}/out/result.tif", headers={**headers, "Range": "bytes=10-19"}
+    )
+    assert response.status_code == 206
+    assert response.content == content[10:20]
+    assert response.headers["content-range"] == "bytes 10-19/1024"
+
+    response = test_app.get(
+        f"{results}/out/result.tif",
+        headers={**headers, "Range": "bytes=-5", "If-Range": f'"{asset.checksum}"'},
+    )
+    assert response.status_code == 206
+    assert response.content == content[-5:]
+
+    # A range for another version of the file sends the whole file.
+    response = test_app.get(
+        f"{results}/out/result.tif",
+        headers={**headers, "Range": "bytes=0-1", "If-Range": '"other"'},
+    )
+    assert response.status_code == 200
+    assert response.content == content
+
+    response = test_app.get(
+        f"{results}/out/result.tif", headers={**headers, "Range": "bytes=2000-"}
+    )
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */1024"
+
+    for missing in ["missing.tif", "_manifest.json"]:
+        response = test_app.get(f"{results}/{missing}", headers=headers)
+        assert response.status_code == 404
+
+
+def test_process_sync_job(
+    mocked_oidc_config,
+    mocked_oidc_userinfo,
+    mocked_get_oidc_jwks,
+    mocked_validate_token,
+    job_post,
+    core_api,
+    app_settings,
+):
+    """
+    Test the /result endpoint returns the result of the executor.
+    """
+    executor = SyncJobExecutor(execute, max_workers=1, poll_interval=0.01)
+    core_api.client.jobs.executor = executor
+
+    test_app = TestClient(core_api.app)
+
+    try:
+        response = post_request(
+            test_app, f"{app_settings.OPENEO_PREFIX}/result", job_post
+        )
+        assert response.status_code == 200
+        assert response.headers["openeo-costs"] == "1.5"
+        assert response.json() == job_post["process"]["process_graph"]
+
+        response = post_request(
+            test_app, f"{app_settings.OPENEO_PREFIX}/result", {"title": "empty"}
+        )
+        assert response.status_code == 400
+        assert response.json()["code"] == "ProcessGraphMissing"
+    finally:
+        executor.close()
+
+
+def test_async_jobs_register(
+    mocked_oidc_config,
+    mocked_oidc_userinfo,
+    mocked_get_oidc_jwks,
+    mocked_validate_token,
+    job_post,
+    core_api,
+    app_settings,
+):
+    """
+    Test the /jobs endpoints using the AsyncJobsRegister.
+    """
+    client = core_api.client
+    client.jobs = AsyncJobsRegister(client.settings, client.links)
+
+    test_app = TestClient(OpenEOApi(client=client, app=FastAPI()).app)
+    job_post["process"]["id"] = uuid.uuid4().hex[:16].upper()
+
+    response = post_request(test_app, f"{app_settings.OPENEO_PREFIX}/jobs", job_post)
+
+    assert response.status_code == 201
+    job_id = response.headers["openeo-identifier"]
+
+    new_pg_id = uuid.uuid4().hex[:16].upper()
+    updated_pg = {"process": {"id": new_pg_id, "process_graph": {"func": "new-arg"}}}
+
+    response = patch_request(
+        test_app, f"{app_settings.OPENEO_PREFIX}/jobs/{job_id}", updated_pg
+    )
+
+    assert response.status_code == 204
+
+    response = test_app.get(
+        f"{app_settings.OPENEO_PREFIX}/jobs/{job_id}",
+        headers={"Authorization": "Bearer oidc/egi/not-real"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["process"]["id"] == new_pg_id
+
+    response = test_app.get(
+        f"{app_settings.OPENEO_PREFIX}/jobs",
+        headers={"Authorization": "Bearer oidc/egi/not-real"},
+    )
+
+    assert response.status_code == 200
+    assert len(response.json()["jobs"]) == 1
+
+    response = test_app.get(
+        f"{app_settings.OPENEO_PREFIX}/jobs/{uuid.uuid4()}",
+        headers={"Authorization": "Bearer oidc/egi/not-real"},
+    )
+
+    assert response.status_code == 404
+
+
+def test_list_jobs_pagination(
+    mocked_oidc_config,
+    mocked_oidc_userinfo,
+    mocked_get_oidc_jwks,
+    mocked_validate_token,
+    job_post,
+    core_api,
+    app_settings,
+):
+    """
+    Test the /jobs GET endpoint pages through the jobs with the next link.
+    """
+
+    test_app = TestClient(core_api.app)
+
+    created = []
+    for x in range(0, 5):
+        job_post["process"]["id"] = uuid.uuid4().hex[:16].upper()
+        response = post_request(
+            test_app, f"{app_settings.OPENEO_PREFIX}/jobs", job_post
+        )
+        created.append(response.headers["openeo-identifier"])
+
+    listed = []
+    url = f"{app_settings.OPENEO_PREFIX}/jobs?limit=2"
+    while url:
+        response = test_app.get(
+            url, headers={"Authorization": "Bearer oidc/egi/not-real"}
+        )
+
+        assert response.status_code == 200
+        assert len(response.json()["jobs"]) <= 2
+        # The process graphs are not loaded for the list.
+        assert all("process" not in job for job in response.json()["jobs"])
+
+        listed.extend(job["id"] for job in response.json()["jobs"])
+        next_links = [l for l in response.json()["links"] if l["rel"] == "next"]
+        url = next_links[0]["href"] if next_links else None
+
+    # Most recent jobs first, each job listed once.
+    assert listed == list(reversed(created))
+
+    response = test_app.get(
+        f"{app_settings.OPENEO_PREFIX}/jobs?token=not-a-token",
+        headers={"Authorization": "Bearer oidc/egi/not-real"},
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("register", [JobsRegister, AsyncJobsRegister])
+@pytest.mark.parametrize("limit", [0, -2, 1001])
+def test_list_jobs_invalid_limit(
+    mocked_oidc_config,
+    mocked_oidc_userinfo,
+    mocked_get_oidc_jwks,
+    mocked_validate_token,
+    core_api,
+    app_settings,
+    register,
+    limit,
+):
+    """
+    Test the /jobs GET endpoint refuses limits outside of 1 to JOBS_PAGE_MAX_LIMIT.
+    """
+    client = core_api.client
+    client.jobs = register(client.settings, client.links)
+    test_app = TestClient(OpenEOApi(client=client, app=FastAPI()).app)
+
+    response = test_app.get(
+        f"{app_settings.OPENEO_PREFIX}/jobs?limit={limit}",
+        headers={"Authorization": "Bearer oidc/egi/not-real"},
+    )
+
+    assert response.status_code == 422
@@ -1,7 +1,10 @@
 import json
 
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from openeo_fastapi.api.app import OpenEOApi
+from openeo_fastapi.client.processes import AsyncProcessRegister
 from tests.utils import patch_request, post_request, put_request
 
 
@@ -96,14 +99,23 @@ def test_put_user_process_graph(
 
     assert response.status_code == 201
 
-    # Try to create twice
+    # Putting it again replaces the stored process graph.
+    replaced = {**process_graph, "description": "A replaced process graph."}
     response = put_request(
         test_app,
         f"{app_settings.OPENEO_PREFIX}/process_graphs/{process_graph['id']}",
-        process_graph,
+        replaced,
     )
 
-    assert response.status_code == 500
+    assert response.status_code == 201
+
+    response = test_app.get(
+        f"{app_settings.OPENEO_PREFIX}/process_graphs/{process_graph['id']}",
+        headers={"Authorization": "Bearer oidc/egi/not-real"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["description"] == "A replaced process graph."
 
 
 def test_delete_user_process_graph(
@@ -164,3 +176,47 @@ def test_validate_user_process_graph(
     )
 
     assert response.status_code == 201
+
+
+def test_async_process_register(
+    mocked_oidc_config,
+    mocked_oidc_userinfo,
+    mocked_get_oidc_jwks,
+    mocked_validate_token,
+    core_api,
+    app_settings,
+    process_graph,
+):
+    """Test the /process_graphs endpoints using the AsyncProcessRegister."""
+    client = core_api.client
+    client.processes = AsyncProcessRegister(client.links)
+
+    test_app = TestClient(OpenEOApi(client=client, app=FastAPI()).app)
+    path = f"{app_settings.OPENEO_PREFIX}/process_graphs/{process_graph['id']}"
+
+    response = put_request(test_app, path, process_graph)
+
+    assert response.status_code == 201
+
+    response = test_app.get(
+        f"{app_settings.OPENEO_PREFIX}/process_graphs",
+        headers={"Authorization": "Bearer oidc/egi/not-real"},
+    )
+
+    assert response.status_code == 200
+    assert len(response.json()["processes"]) == 1
+
+    response = test_app.get(path, headers={"Authorization": "Bearer oidc/egi/not-real"})
+
+    assert response.status_code == 200
+    assert response.json()["id"] == process_graph["id"]
+
+    response = test_app.delete(
+        path, headers={"Authorization": "Bearer oidc/egi/not-real"}
+    )
+
+    assert response.status_code == 204
+
+    response = test_app.get(path, headers={"Authorization": "Bearer oidc/egi/not-real"})
+
+    assert response.status_code == 404
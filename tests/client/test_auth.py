@@ -1,8 +1,13 @@
-from unittest.mock import patch
+import json
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from fastapi.exceptions import HTTPException
+from fastapi.testclient import TestClient
 from pydantic import ValidationError
+from requests import Response
 
 from openeo_fastapi.client import auth
 
@@ -72,6 +77,20 @@ def test_issuer_handler_init():
     assert not test_issuer.issuer_uri.endswith("/")
     assert len(test_issuer.policies) == 2
 
+    # The policies are compiled when the handler is built, and again when they are replaced.
+    matcher = test_issuer.policy_matcher
+    assert matcher.matches({"groups": ["/admin-staff"]})
+    with patch.object(auth, "compile_policies", side_effect=AssertionError):
+        assert test_issuer._apply_policies({"groups": ["/dev-staff"]})
+    assert test_issuer.policy_matcher is matcher
+
+    test_issuer.policies = ["groups,/trial"]
+    assert test_issuer.policy_matcher.matches({"groups": ["/trial"]})
+    assert not test_issuer.policy_matcher.matches({"groups": ["/dev-staff"]})
+
+    test_issuer.policies = None
+    assert test_issuer.policy_matcher is None
+
 
 def test_issuer_handler__validate_oidc_token(
     mocked_oidc_config,
@@ -161,3 +180,300 @@ def test_validate_token(mocked_oidc_token, mocked_oidc_jwks):
             assert payload["sub"] == "1234567890"
             assert payload["name"] == "John Doe"
             assert payload["email"] == "john.doe@example.com"
+
+
+def test_issuer_handler_caches_config_and_jwks(
+    mocked_oidc_config,
+    mocked_oidc_userinfo,
+    mocked_get_oidc_jwks,
+    mocked_validate_token,
+    mocked_issuer,
+):
+    mocked_issuer._authenticate_oidc_user(token=OIDC_TOKEN_EXAMPLE)
+    mocked_issuer._authenticate_oidc_user(token=OIDC_TOKEN_EXAMPLE)
+
+    assert mocked_oidc_config.call_count == 1
+    assert mocked_get_oidc_jwks.call_count == 1
+
+
+def test_issuer_handler_honours_no_store(
+    mocked_oidc_config,
+    mocked_oidc_userinfo,
+    mocked_get_oidc_jwks,
+    mocked_validate_token,
+    mocked_issuer,
+):
+    mocked_oidc_config.return_value.headers["Cache-Control"] = "no-store"
+    mocked_issuer.jwks_refresh_interval = 0
+
+    mocked_issuer._authenticate_oidc_user(token=OIDC_TOKEN_EXAMPLE)
+    mocked_issuer._authenticate_oidc_user(token=OIDC_TOKEN_EXAMPLE)
+
+    assert mocked_oidc_config.call_count == 2
+    assert mocked_get_oidc_jwks.call_count == 1
+
+    # Uncacheable responses are still refetched at most once per refresh interval.
+    mocked_issuer.jwks_refresh_interval = 60
+
+    mocked_issuer._authenticate_oidc_user(token=OIDC_TOKEN_EXAMPLE)
+    mocked_issuer._authenticate_oidc_user(token=OIDC_TOKEN_EXAMPLE)
+
+    assert mocked_oidc_config.call_count == 2
+
+
+def test_cache_ttl_from_response():
+    response = Response()
+    assert auth.cache_ttl_from_response(response, 300) == 300
+
+    response.headers["Cache-Control"] = "public, max-age=60"
+    assert auth.cache_ttl_from_response(response, 300) == 60
+
+    response.headers["Cache-Control"] = "no-cache"
+    assert auth.cache_ttl_from_response(response, 300) == 0
+
+
+def test_issuer_handler_refetches_jwks_on_unknown_kid(
+    mocked_oidc_config,
+    mocked_oidc_userinfo,
+    mocked_get_oidc_jwks,
+    mocked_issuer,
+):
+    mocked_issuer.jwks_refresh_interval = 0
+
+    with patch("openeo_fastapi.client.auth.IssuerHandler._validate_token") as mock:
+        # The first key set doesn't hold the signing key, the refetched one does.
+        mock.side_effect = [None, {"sub": "someuser@testing.test"}]
+
+        assert mocked_issuer._authenticate_oidc_user(token=OIDC_TOKEN_EXAMPLE)
+        assert mocked_get_oidc_jwks.call_count == 2
+
+        # Refetches are rate limited, so an unknown key does not refetch again straight away.
+        mocked_issuer.jwks_refresh_interval = 60
+        mock.side_effect = [None]
+
+        with pytest.raises(HTTPException):
+            mocked_issuer._authenticate_oidc_user(token=OIDC_TOKEN_EXAMPLE)
+        assert mocked_get_oidc_jwks.call_count == 2
+
+
+def test_authenticator_validate_caches_token(
+    mocked_oidc_config,
+    mocked_oidc_userinfo,
+    mocked_get_oidc_jwks,
+    mocked_validate_token,
+    unexpired_oidc_token,
+):
+    user = auth.Authenticator.validate(unexpired_oidc_token)
+
+    assert auth.Authenticator.validate(unexpired_oidc_token) == user
+    assert mocked_validate_token.call_count == 1
+    assert mocked_oidc_userinfo.call_count == 1
+
+    auth.TOKEN_CACHE.invalidate_user(user.user_id)
+    assert auth.Authenticator.validate(unexpired_oidc_token) == user
+    assert mocked_validate_token.call_count == 2
+
+    auth.TOKEN_CACHE.invalidate(unexpired_oidc_token)
+    assert auth.TOKEN_CACHE.get(unexpired_oidc_token) is None
+
+
+def test_get_or_create_user(mock_engine):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from openeo_fastapi.client.psql.engine import get_or_create
+
+    user = auth._get_or_create_user({"sub": "new@testing.test"})
+
+    assert auth.USER_CACHE.get("new@testing.test") == user
+
+    # The stored user is found again once it is no longer cached.
+    auth.USER_CACHE.clear()
+    assert auth._get_or_create_user({"sub": "new@testing.test"}) == user
+
+    # Concurrent first requests of a user all resolve to the one stored user.
+    def first_request(_):
+        return get_or_create(
+            create_object=auth.User(user_id=uuid.uuid4(), oidc_sub="race@testing.test"),
+            unique_column="oidc_sub",
+        ).user_id
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        user_ids = set(executor.map(first_request, range(8)))
+
+    assert len(user_ids) == 1
+
+
+def test_user_cache():
+    cache = auth.UserCache()
+    first = auth.User(user_id=uuid.uuid4(), oidc_sub="first@testing.test")
+    second = auth.User(user_id=uuid.uuid4(), oidc_sub="second@testing.test")
+
+    cache.set(first.oidc_sub, first, max_entries=1)
+    assert cache.get(first.oidc_sub) == first
+
+    cache.set(second.oidc_sub, second, max_entries=1)
+    assert cache.get(first.oidc_sub) is None
+    assert cache.get(second.oidc_sub) == second
+
+    cache.invalidate(second.oidc_sub)
+    assert cache.get(second.oidc_sub) is None
+
+    cache.set(first.oidc_sub, first, max_entries=0)
+    assert cache.get(first.oidc_sub) is None
+
+
+def test_token_cache_respects_expiry(mocked_oidc_token, unexpired_oidc_token):
+    cache = auth.TokenCache(max_entries=1)
+    user = auth.User(user_id=uuid.uuid4(), oidc_sub="someuser@testing.test")
+
+    # The token has already expired, so it is never cached.
+    cache.set(f"Bearer oidc/egi/{mocked_oidc_token}", user, ttl=60)
+    assert not cache.get(f"Bearer oidc/egi/{mocked_oidc_token}")
+
+    cache.set(unexpired_oidc_token, user, ttl=0)
+    assert not cache.get(unexpired_oidc_token)
+
+    cache.set(unexpired_oidc_token, user, ttl=60)
+    assert cache.get(unexpired_oidc_token) == user
+
+
+@pytest.fixture()
+def mocked_async_issuer():
+    config = httpx.Response(
+        200,
+        json={
+            "userinfo_endpoint": "https://userinfo_endpoint.url",
+            "jwks_uri": "https://jwks_uri.url",
+        },
+    )
+    jwks = httpx.Response(200, json={"keys": [{"kid": "1b94c"}]})
+    userinfo = httpx.Response(
+        200, json={"groups": ["/dev-staff"], "sub": "someuser@testing.test"}
+    )
+
+    with patch.multiple(
+        auth.AsyncIssuerHandler,
+        _get_issuer_config=AsyncMock(return_value=config),
+        _get_oidc_jwks=AsyncMock(return_value=jwks),
+        _get_user_info=AsyncMock(return_value=userinfo),
+        _validate_token=MagicMock(return_value={"sub": "someuser@testing.test"}),
+    ):
+        yield auth.AsyncIssuerHandler(
+            issuer_uri="http://issuer.mycloud/", policies=["groups,/dev-staff"]
+        )
+
+
+@pytest.mark.asyncio
+async def test_async_issuer_handler_validate_token(mocked_async_issuer):
+    info = await mocked_async_issuer.validate_token(token=OIDC_TOKEN_EXAMPLE)
+
+    assert info["sub"] == "someuser@testing.test"
+
+    await mocked_async_issuer.validate_token(token=OIDC_TOKEN_EXAMPLE)
+    assert mocked_async_issuer._get_issuer_config.call_count == 1
+
+    with pytest.raises(HTTPException) as exc_info:
+        await mocked_async_issuer.validate_token(token=BASIC_TOKEN_EXAMPLE)
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_async_issuer_handler_policy_denied(mocked_async_issuer):
+    mocked_async_issuer.policies = ["groups,/admin-staff"]
+
+    with pytest.raises(HTTPException) as exc_info:
+        await mocked_async_issuer.validate_token(token=OIDC_TOKEN_EXAMPLE)
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_async_client_shared():
+    client = auth.get_async_client()
+
+    assert auth.get_async_client() is client
+
+    await auth.close_async_client()
+
+    assert client.is_closed
+    assert auth.get_async_client() is not client
+    await auth.close_async_client()
+
+
+def test_async_authenticator_override(mocked_async_issuer, core_api, app_settings):
+    core_api.override_authentication(auth.AsyncAuthenticator.validate)
+
+    test_app = TestClient(core_api.app)
+
+    response = test_app.get(
+        f"{app_settings.OPENEO_PREFIX}/me",
+        headers={"Authorization": "Bearer oidc/egi/not-real"},
+    )
+
+    assert response.status_code == 200
+    assert "user_id" in response.json()
+
+
+def test_issuer_handler_userinfo_from_token(
+    mocked_oidc_config,
+    mocked_oidc_userinfo,
+    mocked_get_oidc_jwks,
+    mocked_issuer,
+):
+    mocked_issuer.userinfo_from_token = True
+
+    with patch("openeo_fastapi.client.auth.IssuerHandler._validate_token") as mock:
+        mock.return_value = {"sub": "someuser@testing.test", "groups": ["/dev-staff"]}
+
+        info = mocked_issuer._authenticate_oidc_user(token=OIDC_TOKEN_EXAMPLE)
+
+        assert info["sub"] == "someuser@testing.test"
+        assert mocked_oidc_userinfo.call_count == 0
+
+        # The policy claim is missing from the token, so the userinfo endpoint is used.
+        mock.return_value = {"sub": "someuser@testing.test"}
+
+        info = mocked_issuer._authenticate_oidc_user(token=OIDC_TOKEN_EXAMPLE)
+
+        assert info["groups"] == ["/dev-staff"]
+        assert mocked_oidc_userinfo.call_count == 1
+
+        # Nested policy claims are looked up along their path.
+        mocked_issuer.policies = ["realm_access.roles,admin"]
+        mock.return_value = {
+            "sub": "someuser@testing.test",
+            "realm_access": {"roles": ["admin"]},
+        }
+
+        info = mocked_issuer._authenticate_oidc_user(token=OIDC_TOKEN_EXAMPLE)
+
+        assert info["realm_access"] == {"roles": ["admin"]}
+        assert mocked_oidc_userinfo.call_count == 1
+
+        # The nested claim is missing from the token, so the userinfo endpoint is used.
+        mock.return_value = {"sub": "someuser@testing.test", "realm_access": {}}
+        mocked_oidc_userinfo.return_value._content = json.dumps(
+            {"sub": "someuser@testing.test", "realm_access": {"roles": ["admin"]}}
+        ).encode("utf-8")
+
+        info = mocked_issuer._authenticate_oidc_user(token=OIDC_TOKEN_EXAMPLE)
+
+        assert info["realm_access"] == {"roles": ["admin"]}
+        assert mocked_oidc_userinfo.call_count == 2
+
+
+def test_validate_token_audience(mocked_oidc_token, mocked_oidc_jwks):
+    test_issuer = auth.IssuerHandler(
+        issuer_uri="http://issuer.mycloud/", audience="my-client-id"
+    )
+
+    with patch("jose.jwt.get_unverified_header") as mock_get_unverified_header:
+        mock_get_unverified_header.return_value = {"kid": "1b94c"}
+
+        with patch("jose.jwt.decode") as mock_jwt_decode:
+            mock_jwt_decode.return_value = {"sub": "1234567890"}
+
+            test_issuer._validate_token(mocked_oidc_token, mocked_oidc_jwks)
+
+            _, kwargs = mock_jwt_decode.call_args
+            assert kwargs["audience"] == "my-client-id"
+            assert kwargs["options"]["verify_aud"]
@@ -0,0 +1,167 @@
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi.exceptions import HTTPException
+
+from openeo_fastapi.client.executor import SyncJobExecutor, SyncResult, _Worker
+
+PROCESS = {"process_graph": {"sleep": {"process_id": "sleep", "arguments": {}}}}
+
+
+def execute(process: dict) -> SyncResult:
+    """Sleep for the seconds in the process, then echo the process graph."""
+    time.sleep(process.get("seconds", 0))
+    if process.get("fail"):
+        raise ValueError("The process failed.")
+    return SyncResult(content=process["process_graph"], costs=1.5)
+
+
+def run(executor: SyncJobExecutor, process: dict, is_disconnected=None):
+    return asyncio.run(executor.run(process, is_disconnected))
+
+
+@pytest.fixture()
+def executor():
+    executor = SyncJobExecutor(
+        execute, max_workers=1, max_queued=1, timeout=20, poll_interval=0.01
+    )
+    yield executor
+    executor.close()
+
+
+def test_run(executor):
+    """Test the result and costs of the process are returned and the worker is reused."""
+    response = run(executor, PROCESS)
+
+    assert response.status_code == 200
+    assert response.media_type == "application/json"
+    assert response.headers["OpenEO-Costs"] == "1.5"
+    assert json.loads(response.body) == PROCESS["process_graph"]
+
+    worker = executor._idle[0]
+    run(executor, PROCESS)
+    assert executor._idle == [worker]
+
+
+def test_run_failed(executor):
+    """Test a failing process returns 500 and keeps the worker."""
+    with pytest.raises(HTTPException) as error:
+        run(executor, {**PROCESS, "fail": True})
+
+    assert error.value.status_code == 500
+    assert "The process failed." in error.value.detail.message
+    assert len(executor._idle) == 1
+
+
+def test_admission_control(executor):
+    """Test requests beyond the workers and the waiting room are refused with 429."""
+
+    async def saturate():
+        running = asyncio.create_task(executor.run({**PROCESS, "seconds": 1}))
+        waiting = asyncio.create_task(executor.run(PROCESS))
+        await asyncio.sleep(0.1)
+
+        with pytest.raises(HTTPException) as error:
+            await executor.run(PROCESS)
+
+        responses = await asyncio.gather(running, waiting)
+        return error.value, responses
+
+    error, responses = asyncio.run(saturate())
+
+    assert error.status_code == 429
+    assert error.detail.code == "TooManyRequests"
+    assert int(error.headers["Retry-After"]) >= 1
+    assert [response.status_code for response in responses] == [200, 200]
+    assert executor._admitted == 0
+
+
+def test_deadline(executor):
+    """Test a process past the deadline returns 504 and its worker is killed."""
+    run(executor, PROCESS)
+    worker = executor._idle[0]
+
+    executor.timeout = 0.5
+    started = time.monotonic()
+    with pytest.raises(HTTPException) as error:
+        run(executor, {**PROCESS, "seconds": 30})
+
+    assert error.value.status_code == 504
+    assert time.monotonic() - started < 5
+    assert not worker.process.is_alive()
+    assert executor._workers == 0
+
+    executor.timeout = 20
+    assert run(executor, PROCESS).status_code == 200
+
+
+def test_client_disconnect(executor):
+    """Test the processing is canceled when the client disconnects."""
+    run(executor, PROCESS)
+    worker = executor._idle[0]
+    disconnect_at = time.monotonic() + 0.5
+
+    async def is_disconnected():
+        return time.monotonic() > disconnect_at
+
+    started = time.monotonic()
+    response = run(executor, {**PROCESS, "seconds": 30}, is_disconnected)
+
+    assert response.status_code == 499
+    assert time.monotonic() - started < 5
+    assert not worker.process.is_alive()
+    assert executor._workers == 0 and executor._admitted == 0
+
+
+def test_request_canceled(executor):
+    """Test a canceled request kills its worker, closes its connection and frees its slot."""
+    run(executor, PROCESS)
+    worker = executor._idle[0]
+
+    async def cancel():
+        task = asyncio.create_task(executor.run({**PROCESS, "seconds": 30}))
+        await asyncio.sleep(0.5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # The discarding of the worker is shielded from the cancellation.
+        while executor._workers:
+            await asyncio.sleep(0.01)
+
+    started = time.monotonic()
+    asyncio.run(cancel())
+
+    assert time.monotonic() - started < 5
+    assert not worker.process.is_alive()
+    assert worker.connection.closed
+    assert executor._workers == 0 and executor._admitted == 0
+
+    assert run(executor, PROCESS).status_code == 200
+
+
+def test_workers_managed_off_the_loop(executor):
+    """Test the worker processes are started and killed in threads, not on the event loop."""
+    threads = []
+    init, kill = _Worker.__init__, _Worker.kill
+
+    def record_init(self, *args):
+        threads.append(("start", threading.current_thread()))
+        init(self, *args)
+
+    def record_kill(self):
+        threads.append(("kill", threading.current_thread()))
+        kill(self)
+
+    executor.timeout = 0.5
+    with patch.object(_Worker, "__init__", record_init), patch.object(
+        _Worker, "kill", record_kill
+    ):
+        with pytest.raises(HTTPException):
+            run(executor, {**PROCESS, "seconds": 30})
+
+    assert [action for action, _ in threads] == ["start", "kill"]
+    assert threading.main_thread() not in [thread for _, thread in threads]
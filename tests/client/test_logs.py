@@ -0,0 +1,114 @@
+import datetime
+import uuid
+
+import pytest
+
+from openeo_fastapi.api.types import Level
+from openeo_fastapi.client.logs import FileJobLogStore, PostgresJobLogStore
+
+
+@pytest.fixture(params=["postgres", "file"])
+def store(request, tmp_path):
+    if request.param == "postgres":
+        return PostgresJobLogStore()
+    return FileJobLogStore(str(tmp_path / "logs"))
+
+
+def test_append_and_read(store):
+    """Test the logs are read page by page after the offset."""
+    job_id = uuid.uuid4()
+    other_job_id = uuid.uuid4()
+
+    assert store.read(job_id) == ([], False)
+
+    appended = store.append(
+        job_id,
+        [{"level": "info", "message": f"Step {i}."} for i in range(5)],
+    )
+    store.log(other_job_id, Level.error, "Other job.")
+    entry = store.log(
+        job_id,
+        "error",
+        "Failed.",
+        code="ProcessFailed",
+        time=datetime.datetime(2024, 1, 1, 12),
+        data={"band": "B04"},
+        path=["load_collection"],
+    )
+
+    ids = [int(e.id) for e in appended + [entry]]
+    assert ids == sorted(ids)
+
+    page, more = store.read(job_id, limit=4)
+    assert [e.message for e in page] == [f"Step {i}." for i in range(4)]
+    assert more
+
+    page, more = store.read(job_id, offset=page[-1].id, limit=4)
+    assert [e.message for e in page] == ["Step 4.", "Failed."]
+    assert not more
+    assert page[-1] == entry
+    assert entry.level == Level.error
+    assert entry.time.__root__ == "2024-01-01T12:00:00Z"
+    assert entry.data == {"band": "B04"} and entry.path == ["load_collection"]
+
+    assert store.read(job_id, offset=entry.id) == ([], False)
+
+
+def test_level_filter(store):
+    """Test the level filter returns the entries of the level and the more severe ones."""
+    job_id = uuid.uuid4()
+    store.append(
+        job_id,
+        [
+            {"level": level, "message": level}
+            for level in ["debug", "info", "warning", "error", "debug", "warning"]
+        ],
+    )
+
+    def messages(level, **kwargs):
+        return [e.message for e in store.read(job_id, level=level, **kwargs)[0]]
+
+    assert messages(Level.debug) == [
+        "debug",
+        "info",
+        "warning",
+        "error",
+        "debug",
+        "warning",
+    ]
+    assert messages(Level.info) == ["info", "warning", "error", "warning"]
+    assert messages(Level.warning) == ["warning", "error", "warning"]
+    assert messages(Level.error) == ["error"]
+
+    page, more = store.read(job_id, level=Level.warning, limit=2)
+    assert more
+    assert messages(Level.warning, offset=page[-1].id) == ["warning"]
+
+
+def test_invalid_offset_and_delete(store):
+    """Test offsets which are not ids are refused, and deleted logs are gone."""
+    job_id = uuid.uuid4()
+    store.append(job_id, [{"level": "info", "message": "Started."}])
+
+    with pytest.raises(ValueError):
+        store.read(job_id, offset="not-an-id")
+
+    store.delete(job_id)
+    assert store.read(job_id) == ([], False)
+
+
+def test_file_store_offsets(tmp_path):
+    """Test the file store refuses offsets within lines and skips lines still being written."""
+    store = FileJobLogStore(str(tmp_path))
+    job_id = uuid.uuid4()
+    entry = store.log(job_id, "info", "Started.")
+
+    with pytest.raises(ValueError):
+        store.read(job_id, offset=str(int(entry.id) - 1))
+    with pytest.raises(ValueError):
+        store.read(uuid.uuid4(), offset="10")
+
+    with open(tmp_path / f"{job_id}.jsonl", "ab") as log_file:
+        log_file.write(b'{"severity": 2, "message": "Half')
+
+    assert store.read(job_id, offset=entry.id) == ([], False)
@@ -0,0 +1,58 @@
+import pytest
+
+from openeo_fastapi.client.policies import PolicyMatcher, compile_policies
+
+ENTITLEMENT = "urn:mace:egi.eu:group:vo.openeo.cloud:role=member#aai.egi.eu"
+
+
+def test_policy_matcher_or():
+    matcher = PolicyMatcher(["groups, /staff", "groups, /trial"])
+
+    assert matcher.exact == {("groups",): frozenset(["/staff", "/trial"])}
+    assert matcher.matches({"groups": ["/other", "/trial"]})
+    assert not matcher.matches({"groups": ["/other"]})
+    assert not matcher.matches({"email": "user@test.org"})
+
+
+def test_policy_matcher_and():
+    matcher = PolicyMatcher(["groups, /staff; email_verified, true"])
+
+    assert matcher.matches({"groups": ["/staff"], "email_verified": True})
+    assert not matcher.matches({"groups": ["/staff"], "email_verified": False})
+    assert not matcher.matches({"groups": ["/staff"]})
+    assert matcher.claims == {"groups", "email_verified"}
+
+
+def test_policy_matcher_nested_and_prefix():
+    matcher = PolicyMatcher(
+        [
+            "realm_access.roles, admin",
+            "eduperson_entitlement, urn:mace:egi.eu:group:vo.openeo.cloud:*",
+        ]
+    )
+
+    assert matcher.matches({"realm_access": {"roles": ["user", "admin"]}})
+    assert not matcher.matches({"realm_access": "admin"})
+    assert matcher.matches({"eduperson_entitlement": [ENTITLEMENT]})
+    assert not matcher.matches(
+        {"eduperson_entitlement": ["urn:mace:egi.eu:group:vo.other:role=member"]}
+    )
+    assert matcher.claims == {"realm_access", "eduperson_entitlement"}
+    assert matcher.has_claims(
+        {"realm_access": {"roles": []}, "eduperson_entitlement": []}
+    )
+    assert not matcher.has_claims({"realm_access": {}, "eduperson_entitlement": []})
+
+
+def test_policy_matcher_invalid():
+    with pytest.raises(ValueError):
+        PolicyMatcher(["groups, /staff, /trial"])
+
+    with pytest.raises(ValueError):
+        PolicyMatcher(["groups, /staff; email_verified"])
+
+
+def test_compile_policies_cached():
+    policies = ("groups,/staff", "groups,/trial")
+
+    assert compile_policies(policies) is compile_policies(policies)
@@ -1,10 +1,29 @@
+import asyncio
+import datetime
 import uuid
 
 import pytest
-from sqlalchemy import BOOLEAN, Column, select
+from sqlalchemy import BOOLEAN, Column, select, text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
 
+from openeo_fastapi.client.psql import engine as engine_module
+from openeo_fastapi.client.psql.engine import (
+    Filter,
+    _list,
+    bulk_create,
+    bulk_delete,
+    bulk_get,
+    bulk_modify,
+    create,
+    get,
+    get_engine,
+    get_pool_status,
+    get_replicas,
+    get_session_factory,
+    update,
+    upsert,
+)
 from openeo_fastapi.client.psql.models import JobORM, UdpORM, UserORM
 
 
@@ -119,3 +138,372 @@ def test_models_extendable(mock_engine):
     with pytest.raises(IntegrityError):
         with session.begin() as sesh:
             sesh.add(old_user)
+
+
+def test_session_factory_reused(mock_engine):
+    """Test the session factory is created once per engine."""
+
+    factory = get_session_factory()
+
+    assert factory is get_session_factory()
+    assert factory.kw["bind"] is mock_engine
+
+    engine_module._engine = None
+    assert get_session_factory() is not factory
+
+
+def test_engine_pool_settings(monkeypatch):
+    """Test the pool and connection settings are applied to the engine."""
+
+    monkeypatch.setenv("POSTGRES_POOL_SIZE", "3")
+    monkeypatch.setenv("POSTGRES_MAX_OVERFLOW", "2")
+    monkeypatch.setenv("POSTGRES_STATEMENT_TIMEOUT", "5000")
+    monkeypatch.setenv("POSTGRES_APPLICATION_NAME", "openeo-test")
+
+    engine_module._engine = None
+    engine = get_engine()
+
+    assert engine.pool.size() == 3
+    assert engine.pool._max_overflow == 2
+
+    with get_session_factory().begin() as sesh:
+        assert sesh.scalar(text("SHOW application_name")) == "openeo-test"
+        assert sesh.scalar(text("SHOW statement_timeout")) == "5s"
+
+        status = get_pool_status()
+        assert status["checked_out"] == 1
+        assert status["checkouts"] == 1
+
+    status = get_pool_status()
+    assert status["checked_out"] == 0
+    assert status["checked_in"] == 1
+    assert status["connects"] == 1
+
+    engine.dispose()
+
+
+def test_list_columns(mock_engine):
+    """Test only the requested columns are loaded when listing."""
+    from openeo_fastapi.client.jobs import Job
+
+    user_uid = uuid.uuid4()
+    job_uid = uuid.uuid4()
+
+    session = sessionmaker(mock_engine)
+    with session.begin() as sesh:
+        sesh.add(
+            JobORM(
+                job_id=job_uid,
+                user_id=user_uid,
+                status="created",
+                process={"process_graph": {"x": {"process_id": "y"}}},
+            )
+        )
+
+    _filter = Filter(column_name="user_id", value=user_uid)
+
+    full = _list(list_model=Job, filter_with=_filter)
+    assert full[0].process.process_graph
+
+    projected = _list(list_model=Job, filter_with=_filter, columns=["job_id", "status"])
+    assert projected[0].job_id == job_uid
+    assert "process" not in projected[0].dict()
+
+
+def test_update_and_upsert(mock_engine):
+    """Test entries are updated and upserted in a single statement."""
+    from openeo_fastapi.client.jobs import Job
+    from openeo_fastapi.client.processes import UserDefinedProcessGraph
+
+    user_uid = uuid.uuid4()
+    job_uid = uuid.uuid4()
+
+    session = sessionmaker(mock_engine)
+    with session.begin() as sesh:
+        sesh.add(
+            JobORM(
+                job_id=job_uid,
+                user_id=user_uid,
+                status="created",
+                process={"process_graph": {"x": {"process_id": "y"}}},
+            )
+        )
+
+    updated = update(update_model=Job, primary_key=job_uid, values={"title": "new"})
+    assert updated.title == "new"
+    assert updated.process.process_graph
+
+    assert not update(
+        update_model=Job, primary_key=uuid.uuid4(), values={"title": "new"}
+    )
+
+    created = datetime.datetime.now()
+    udp = UserDefinedProcessGraph(
+        id="UPSERTPG",
+        user_id=user_uid,
+        process_graph={"a": {"process_id": "b"}},
+        created=created,
+    )
+    assert upsert(upsert_object=udp)
+
+    replaced = UserDefinedProcessGraph(
+        id="UPSERTPG",
+        user_id=user_uid,
+        process_graph={"c": {"process_id": "d"}},
+        created=created + datetime.timedelta(days=1),
+    )
+    assert upsert(upsert_object=replaced, update_columns=["process_graph"])
+
+    found = get(get_model=UserDefinedProcessGraph, primary_key=["UPSERTPG", user_uid])
+    assert found.process_graph == {"c": {"process_id": "d"}}
+    assert found.created == created
+
+
+def test_bulk_operations(mock_engine):
+    """Test many entries are created, got, modified and deleted in chunks."""
+    from openeo_fastapi.api.types import Status
+    from openeo_fastapi.client.jobs import Job
+    from openeo_fastapi.client.processes import UserDefinedProcessGraph
+
+    user_uid = uuid.uuid4()
+    created = datetime.datetime.now()
+
+    jobs = [
+        Job(
+            job_id=uuid.uuid4(),
+            process={"process_graph": {"x": {"process_id": "y"}}},
+            status=Status.created,
+            user_id=user_uid,
+            created=created,
+        )
+        for _ in range(5)
+    ]
+    udps = [
+        UserDefinedProcessGraph(
+            id=f"BULKPG{i}",
+            user_id=user_uid,
+            process_graph={"a": {"process_id": "b"}},
+            created=created,
+        )
+        for i in range(5)
+    ]
+
+    assert bulk_create(create_objects=jobs, chunk_size=2)
+    assert bulk_create(create_objects=udps, chunk_size=2)
+
+    job_ids = [job.job_id for job in jobs]
+    found = bulk_get(get_model=Job, primary_keys=job_ids + [uuid.uuid4()], chunk_size=2)
+    assert {job.job_id for job in found} == set(job_ids)
+
+    udp_keys = [[udp.id, user_uid] for udp in udps]
+    found = bulk_get(get_model=UserDefinedProcessGraph, primary_keys=udp_keys)
+    assert len(found) == 5
+
+    for job in jobs:
+        job.status = Status.running
+        job.title = "not updated"
+    assert bulk_modify(modify_objects=jobs, columns=["status"], chunk_size=2)
+
+    found = bulk_get(get_model=Job, primary_keys=job_ids)
+    assert {job.status for job in found} == {Status.running}
+    assert {job.title for job in found} == {None}
+
+    assert bulk_delete(delete_model=Job, primary_keys=job_ids[:3], chunk_size=2)
+    assert bulk_delete(delete_model=UserDefinedProcessGraph, primary_keys=udp_keys)
+
+    assert len(bulk_get(get_model=Job, primary_keys=job_ids)) == 2
+    assert not bulk_get(get_model=UserDefinedProcessGraph, primary_keys=udp_keys)
+
+
+def test_async_bulk_operations(mock_engine):
+    """Test the async bulk operations against the same database."""
+    from openeo_fastapi.client.processes import UserDefinedProcessGraph
+    from openeo_fastapi.client.psql import async_engine
+
+    user_uid = uuid.uuid4()
+    udps = [
+        UserDefinedProcessGraph(
+            id=f"ASYNCPG{i}",
+            user_id=user_uid,
+            process_graph={"a": {"process_id": "b"}},
+            created=datetime.datetime.now(),
+        )
+        for i in range(3)
+    ]
+    udp_keys = [[udp.id, user_uid] for udp in udps]
+
+    async def run():
+        await async_engine.bulk_create(create_objects=udps, chunk_size=2)
+        for udp in udps:
+            udp.summary = "bulk"
+        await async_engine.bulk_modify(modify_objects=udps, columns=["summary"])
+        found = await async_engine.bulk_get(
+            get_model=UserDefinedProcessGraph, primary_keys=udp_keys, chunk_size=2
+        )
+        await async_engine.bulk_delete(
+            delete_model=UserDefinedProcessGraph, primary_keys=udp_keys
+        )
+        remaining = await async_engine.bulk_get(
+            get_model=UserDefinedProcessGraph, primary_keys=udp_keys
+        )
+        await async_engine.close_async_engine()
+        return found, remaining
+
+    found, remaining = asyncio.run(run())
+
+    assert {udp.summary for udp in found} == {"bulk"}
+    assert not remaining
+
+
+def test_read_replica_routing(mock_engine, monkeypatch):
+    """Test reads go to a healthy replica, and writes and the reads of the writing user to the primary."""
+    from openeo_fastapi.api.types import Status
+    from openeo_fastapi.client.jobs import Job
+
+    live = f"{mock_engine.url.host}:{mock_engine.url.port}"
+    monkeypatch.setenv("POSTGRESQL_REPLICA_HOSTS", f'["127.0.0.1:1", "{live}"]')
+    monkeypatch.setattr(engine_module, "_replicas", None)
+    monkeypatch.setattr(engine_module, "_replica_router", None)
+
+    router, factories = get_replicas()
+    replica_pool = factories[1].kw["bind"].pool
+
+    # Written outside the engine helpers, so the user has no read your writes window.
+    job_uid = uuid.uuid4()
+    session = sessionmaker(mock_engine)
+    with session.begin() as sesh:
+        sesh.add(
+            JobORM(
+                job_id=job_uid,
+                user_id=uuid.uuid4(),
+                status="created",
+                process={"process_graph": {"x": {"process_id": "y"}}},
+            )
+        )
+
+    assert get(get_model=Job, primary_key=job_uid)
+    # The unreachable replica is skipped from now on, the live one served the read.
+    assert router.candidates() == [1]
+    assert replica_pool.checkedin() == 1
+
+    user_uid = uuid.uuid4()
+    job = Job(
+        job_id=uuid.uuid4(),
+        process={"process_graph": {"x": {"process_id": "y"}}},
+        status=Status.created,
+        user_id=user_uid,
+        created=datetime.datetime.now(),
+    )
+    assert create(create_object=job)
+
+    assert router.recently_wrote(user_uid)
+    assert router.candidates(user_uid) == []
+    assert _list(
+        list_model=Job, filter_with=Filter(column_name="user_id", value=user_uid)
+    )
+
+
+def test_async_engine_replicas_and_loops(mock_engine, monkeypatch):
+    """Test async reads use the async replica engines, and the engines of a previous event loop are disposed."""
+    from openeo_fastapi.client.jobs import Job
+    from openeo_fastapi.client.psql import async_engine
+
+    live = f"{mock_engine.url.host}:{mock_engine.url.port}"
+    monkeypatch.setenv("POSTGRESQL_REPLICA_HOSTS", f'["{live}"]')
+    monkeypatch.setattr(engine_module, "_replicas", None)
+    monkeypatch.setattr(engine_module, "_replica_router", None)
+
+    job_uid = uuid.uuid4()
+    session = sessionmaker(mock_engine)
+    with session.begin() as sesh:
+        sesh.add(
+            JobORM(
+                job_id=job_uid,
+                user_id=uuid.uuid4(),
+                status="created",
+                process={"process_graph": {"x": {"process_id": "y"}}},
+            )
+        )
+
+    async def read():
+        found = await async_engine.get(get_model=Job, primary_key=job_uid)
+        return found, async_engine._async_engines()
+
+    found, engines = asyncio.run(read())
+    replica_pool = engines[1].sync_engine.pool
+
+    assert found.job_id == job_uid
+    assert replica_pool.checkedin() == 1
+    # No sync replica engines were created for the async read.
+    assert engine_module._replicas is None
+
+    pools = [engine.sync_engine.pool for engine in engines]
+    found, new_engines = asyncio.run(read())
+
+    assert found.job_id == job_uid
+    assert all(new not in engines for new in new_engines)
+    assert all(
+        engine.sync_engine.pool is not pool for engine, pool in zip(engines, pools)
+    )
+
+    asyncio.run(async_engine.close_async_engine())
+
+
+def test_job_indexes(mock_engine):
+    """Test the indexes for the job and udp queries are created by the revision."""
+
+    session = sessionmaker(mock_engine)
+    with session.begin() as sesh:
+        indexes = dict(
+            sesh.execute(
+                text(
+                    "SELECT indexname, indexdef FROM pg_indexes WHERE tablename IN ('jobs', 'udps')"
+                )
+            ).all()
+        )
+
+    assert "user_id, created DESC" in indexes["ix_jobs_user_id_created"]
+    assert "user_id, status" in indexes["ix_jobs_user_id_status"]
+    assert "WHERE (synchronous = false)" in indexes["ix_jobs_user_id_created_batch"]
+    assert "ix_udps_user_id" in indexes
+
+
+def test_process_graph_compression(monkeypatch):
+    """Test large process graphs are stored compressed and read back transparently."""
+    from openeo_fastapi.client.jobs import Job
+    from openeo_fastapi.client.psql.engine import create, get
+    from openeo_fastapi.client.psql.models import COMPRESSED_KEY
+
+    monkeypatch.setenv("POSTGRES_COMPRESS_MIN_SIZE", "256")
+    engine_module._engine = None
+
+    process = {"process_graph": {"load": {"process_id": "x" * 1024}}}
+    small_process = {"process_graph": {"load": {"process_id": "x"}}}
+    jobs = [
+        Job(
+            job_id=uuid.uuid4(),
+            process=graph,
+            status="created",
+            user_id=uuid.uuid4(),
+            created=datetime.datetime.now(),
+        )
+        for graph in [process, small_process]
+    ]
+    for job in jobs:
+        create(create_object=job)
+
+    with get_session_factory().begin() as sesh:
+        stored = dict(sesh.execute(text("SELECT job_id, process FROM jobs")).all())
+        assert (
+            sesh.scalar(text("SELECT pg_typeof(process)::text FROM jobs LIMIT 1"))
+            == "jsonb"
+        )
+
+    assert stored[jobs[0].job_id][COMPRESSED_KEY] == "zlib"
+    assert COMPRESSED_KEY not in stored[jobs[1].job_id]
+
+    found = get(get_model=Job, primary_key=jobs[0].job_id)
+    assert found.process.process_graph == process["process_graph"]
+
+    get_engine().dispose()
+    engine_module._engine = None
@@ -0,0 +1,227 @@
+import datetime
+import threading
+import time
+import uuid
+
+import pytest
+
+from openeo_fastapi.api.types import Status
+from openeo_fastapi.client.jobs import Job
+from openeo_fastapi.client.psql.engine import create, get
+from openeo_fastapi.client.queue import InMemoryJobQueue, JobWorker, PostgresJobQueue
+from openeo_fastapi.client.scheduler import FairShareScheduler
+
+
+def create_jobs(count: int, user_id: uuid.UUID = None) -> list[Job]:
+    jobs = []
+    for i in range(count):
+        job = Job(
+            job_id=uuid.uuid4(),
+            process={"process_graph": {"x": {"process_id": "y"}}},
+            status=Status.created,
+            user_id=user_id or uuid.uuid4(),
+            created=datetime.datetime.now(),
+        )
+        create(create_object=job)
+        jobs.append(job)
+    return jobs
+
+
+def status(job: Job) -> Status:
+    return get(get_model=Job, primary_key=job.job_id).status
+
+
+@pytest.fixture(params=[PostgresJobQueue, InMemoryJobQueue])
+def job_queue(request, mock_engine):
+    return request.param()
+
+
+def test_queue_claim_and_complete(job_queue):
+    first, second, third = create_jobs(3)
+
+    for job in [first, second, third]:
+        assert job_queue.enqueue(job)
+        assert status(job) == Status.queued
+
+    # A queued job can not be started again.
+    assert not job_queue.enqueue(first)
+
+    claimed = job_queue.claim("worker-a", limit=2)
+    assert [job.job_id for job in claimed] == [first.job_id, second.job_id]
+    assert status(first) == Status.running
+
+    assert job_queue.heartbeat(first.job_id, "worker-a")
+    assert not job_queue.heartbeat(first.job_id, "worker-b")
+
+    assert not job_queue.complete(first.job_id, "worker-b", Status.finished)
+    assert job_queue.complete(first.job_id, "worker-a", Status.finished)
+    assert status(first) == Status.finished
+
+    assert job_queue.complete(second.job_id, "worker-a", Status.error)
+    assert status(second) == Status.error
+
+    assert [job.job_id for job in job_queue.claim("worker-b", limit=2)] == [
+        third.job_id
+    ]
+    assert job_queue.claim("worker-b") == []
+
+    # Finished jobs can be started again.
+    assert job_queue.enqueue(first)
+    assert status(first) == Status.queued
+
+
+def test_queue_cancel(job_queue):
+    queued, running, created = create_jobs(3)
+
+    job_queue.enqueue(queued)
+    job_queue.enqueue(running)
+    job_queue.claim("worker-a")
+    job_queue.claim("worker-a")
+
+    assert job_queue.cancel(queued.job_id)
+    assert status(queued) == Status.canceled
+
+    assert job_queue.cancel(running.job_id)
+    assert status(running) == Status.canceled
+    # The worker is told to stop, and can not overwrite the canceled status.
+    assert not job_queue.heartbeat(running.job_id, "worker-a")
+    assert not job_queue.complete(running.job_id, "worker-a", Status.finished)
+    assert status(running) == Status.canceled
+
+    assert not job_queue.cancel(created.job_id)
+    assert status(created) == Status.created
+
+
+def test_queue_requeue_stale(job_queue):
+    (job,) = create_jobs(1)
+
+    job_queue.enqueue(job)
+    job_queue.claim("worker-a")
+
+    assert job_queue.requeue_stale(stale_after=60) == 0
+    assert job_queue.requeue_stale(stale_after=0) == 1
+    assert status(job) == Status.queued
+
+    assert not job_queue.heartbeat(job.job_id, "worker-a")
+    assert [claimed.job_id for claimed in job_queue.claim("worker-b")] == [job.job_id]
+
+
+@pytest.mark.parametrize("queue_class", [PostgresJobQueue, InMemoryJobQueue])
+def test_queue_scheduler(mock_engine, queue_class):
+    job_queue = queue_class(scheduler=FairShareScheduler(max_running=2))
+    heavy, light = uuid.uuid4(), uuid.uuid4()
+    heavy_jobs = create_jobs(4, user_id=heavy)
+    light_jobs = create_jobs(1, user_id=light)
+    for job in heavy_jobs + light_jobs:
+        job_queue.enqueue(job)
+
+    claimed = job_queue.claim("worker-a", limit=4)
+
+    # The light user is not starved by the heavy user's earlier jobs, whose running jobs are capped.
+    assert [job.job_id for job in claimed] == [
+        heavy_jobs[0].job_id,
+        light_jobs[0].job_id,
+        heavy_jobs[1].job_id,
+    ]
+    assert job_queue.claim("worker-b", limit=4) == []
+
+    job_queue.complete(heavy_jobs[0].job_id, "worker-a", Status.finished)
+    assert [job.job_id for job in job_queue.claim("worker-b", limit=4)] == [
+        heavy_jobs[2].job_id
+    ]
+
+
+def test_postgres_queue_concurrent_claims(mock_engine):
+    job_queue = PostgresJobQueue()
+    jobs = create_jobs(20)
+    for job in jobs:
+        job_queue.enqueue(job)
+
+    claims = {}
+
+    def claim(worker_id):
+        claimed = []
+        while batch := job_queue.claim(worker_id, limit=3):
+            claimed.extend(job.job_id for job in batch)
+        claims[worker_id] = claimed
+
+    workers = [threading.Thread(target=claim, args=(f"worker-{i}",)) for i in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    claimed = [job_id for worker_claims in claims.values() for job_id in worker_claims]
+    assert sorted(claimed) == sorted(job.job_id for job in jobs)
+
+
+def test_job_worker(mock_engine):
+    job_queue = InMemoryJobQueue()
+    succeeds, fails = create_jobs(2)
+    job_queue.enqueue(succeeds)
+    job_queue.enqueue(fails)
+
+    executed = []
+
+    def execute(job):
+        executed.append(job.job_id)
+        if job.job_id == fails.job_id:
+            raise ValueError("The job failed.")
+
+    worker = JobWorker(job_queue, execute, worker_id="worker-a", batch_size=2)
+
+    assert worker.run_once() == 2
+    assert executed == [succeeds.job_id, fails.job_id]
+    assert status(succeeds) == Status.finished
+    assert status(fails) == Status.error
+
+    assert worker.run_once() == 0
+
+
+def test_job_worker_batch_heartbeats(job_queue):
+    """Test the jobs waiting in a claimed batch get heartbeats, so they are not queued again and run twice."""
+    slow, waiting = create_jobs(2)
+    job_queue.enqueue(slow)
+    job_queue.enqueue(waiting)
+
+    executed = []
+    requeued = []
+
+    def execute(job):
+        executed.append(job.job_id)
+        if job.job_id == slow.job_id:
+            time.sleep(1.0)
+            # Another worker looking for stale jobs while the first job still runs.
+            requeued.append(job_queue.requeue_stale(0.5))
+
+    worker = JobWorker(
+        job_queue,
+        execute,
+        worker_id="worker-a",
+        batch_size=2,
+        heartbeat_interval=0.1,
+        stale_after=0.5,
+    )
+
+    assert worker.run_once() == 2
+    assert requeued == [0]
+    assert executed == [slow.job_id, waiting.job_id]
+    assert status(waiting) == Status.finished
+    assert job_queue.claim("worker-b", limit=2) == []
+
+
+def test_job_worker_skips_lost_jobs(job_queue):
+    """Test jobs of a batch that were queued again before their turn are not run by the worker."""
+    first, second = create_jobs(2)
+    job_queue.enqueue(first)
+    job_queue.enqueue(second)
+    claimed = job_queue.claim("worker-a", limit=2)
+
+    # The second job was lost to another worker, e.g. after a pause longer than stale_after.
+    job_queue.cancel(second.job_id)
+
+    executed = []
+    worker = JobWorker(job_queue, executed.append, worker_id="worker-a")
+
+    assert worker.run_jobs(claimed) == {first.job_id: Status.finished}
+    assert executed == [claimed[0]]
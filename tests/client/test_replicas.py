@@ -0,0 +1,54 @@
+import uuid
+
+from openeo_fastapi.client.psql.replicas import ReplicaRouter
+
+
+def test_replica_router_round_robin():
+    router = ReplicaRouter(replica_count=3, retry_after=30, read_your_writes=5)
+
+    assert router.candidates() == [0, 1, 2]
+    assert router.candidates() == [1, 2, 0]
+    assert router.candidates() == [2, 0, 1]
+
+
+def test_replica_router_unhealthy():
+    router = ReplicaRouter(replica_count=2, retry_after=30, read_your_writes=5)
+
+    router.mark_unhealthy(0)
+
+    assert router.candidates() == [1]
+    assert router.candidates() == [1]
+
+    # Marked again without a retry delay, the replica is tried right away.
+    router.retry_after = 0
+    router.mark_unhealthy(0)
+
+    assert sorted(router.candidates()) == [0, 1]
+
+
+def test_replica_router_read_your_writes():
+    router = ReplicaRouter(replica_count=2, retry_after=30, read_your_writes=5)
+    user_id = uuid.uuid4()
+
+    router.record_write(user_id)
+
+    assert router.recently_wrote(user_id)
+    assert router.recently_wrote(str(user_id))
+    assert router.candidates(user_id) == []
+    assert router.candidates(uuid.uuid4())
+    assert router.candidates()
+
+    router = ReplicaRouter(replica_count=2, retry_after=30, read_your_writes=0)
+    router.record_write(user_id)
+
+    assert not router.recently_wrote(user_id)
+
+
+def test_replica_router_without_replicas():
+    router = ReplicaRouter(replica_count=0, retry_after=30, read_your_writes=5)
+    user_id = uuid.uuid4()
+
+    router.record_write(user_id)
+
+    assert router.candidates() == []
+    assert not router.recently_wrote(user_id)
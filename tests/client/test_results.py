@@ -0,0 +1,151 @@
+import asyncio
+import hashlib
+import io
+import os
+import uuid
+
+import pytest
+
+from openeo_fastapi.client.results import (
+    AssetResponse,
+    ResultStore,
+    content_disposition,
+    parse_range,
+)
+
+
+@pytest.fixture()
+def store(tmp_path):
+    return ResultStore(f"file://{tmp_path}", chunk_size=4)
+
+
+def test_write_and_list(store, tmp_path):
+    """Test written files are listed with their sizes and checksums."""
+    job_id = uuid.uuid4()
+    content = b"0123456789"
+
+    asset = store.write(job_id, "out.tif", io.BytesIO(content))
+    assert asset.size == 10
+    assert asset.checksum == "1220" + hashlib.sha256(content).hexdigest()
+    assert asset.media_type == "image/tiff"
+
+    store.write(job_id, "meta/info.json", b"{}", roles=["metadata"])
+    # Files written by other means are listed without checksum.
+    (tmp_path / str(job_id) / "extra.nc").write_bytes(b"abc")
+
+    assets = store.assets(job_id)
+    assert [a.name for a in assets] == ["extra.nc", "meta/info.json", "out.tif"]
+    assert assets[0].size == 3 and assets[0].checksum is None
+    assert assets[1].roles == ["metadata"]
+    assert assets[2] == asset
+
+    assert store.asset(job_id, "out.tif") == asset
+    assert store.local_path(job_id, "out.tif") == str(
+        tmp_path / str(job_id) / "out.tif"
+    )
+    with store.open(job_id, "out.tif") as result:
+        assert result.read() == content
+
+    assert store.assets(uuid.uuid4()) == []
+
+    store.delete(job_id)
+    assert store.assets(job_id) == []
+
+
+def test_paths_stay_in_job(store):
+    """Test names outside the results of the job are not found."""
+    job_id = uuid.uuid4()
+    store.write(job_id, "out.tif", b"data")
+
+    for name in ["../out.tif", "/etc/passwd", "", "_manifest.json", "meta/../../x"]:
+        with pytest.raises(FileNotFoundError):
+            store.asset(job_id, name)
+
+    with pytest.raises(FileNotFoundError):
+        store.asset(job_id, "missing.tif")
+
+
+def test_remote_store():
+    """Test the store works on a filesystem other than the local one."""
+    store = ResultStore(f"memory://results-{uuid.uuid4()}")
+    job_id = uuid.uuid4()
+
+    store.write(job_id, "out.nc", b"netcdf")
+
+    assert store.local_path(job_id, "out.nc") is None
+    assert [(a.name, a.size) for a in store.assets(job_id)] == [("out.nc", 6)]
+
+
+def test_parse_range():
+    """Test single byte ranges are parsed and unsatisfiable ones are refused."""
+    assert parse_range(None, 10) is None
+    assert parse_range("bytes=2-5", 10) == (2, 5)
+    assert parse_range("bytes=2-", 10) == (2, 9)
+    assert parse_range("bytes=5-100", 10) == (5, 9)
+    assert parse_range("bytes=-3", 10) == (7, 9)
+    assert parse_range("bytes=-30", 10) == (0, 9)
+    # Several ranges and malformed headers send the whole file.
+    assert parse_range("bytes=0-1,4-5", 10) is None
+    assert parse_range("items=0-1", 10) is None
+    assert parse_range("bytes=-", 10) is None
+
+    for header in ["bytes=10-", "bytes=5-2", "bytes=-0"]:
+        with pytest.raises(ValueError):
+            parse_range(header, 10)
+
+
+def test_content_disposition():
+    """Test file names are quoted for the ASCII filename and percent-encoded for filename*."""
+    assert (
+        content_disposition("out.tif")
+        == "attachment; filename=\"out.tif\"; filename*=UTF-8''out.tif"
+    )
+    assert content_disposition('a"b\\c;\r\nX-Injected: 1.tif') == (
+        'attachment; filename="a\\"b\\\\c;__X-Injected: 1.tif"; '
+        "filename*=UTF-8''a%22b%5Cc%3B%0D%0AX-Injected%3A%201.tif"
+    )
+    assert content_disposition("NDVI_été.tif") == (
+        "attachment; filename=\"NDVI__t_.tif\"; filename*=UTF-8''NDVI_%C3%A9t%C3%A9.tif"
+    )
+
+
+def send_response(response: AssetResponse, extensions: dict) -> list[dict]:
+    messages = []
+
+    async def receive():
+        await asyncio.sleep(10)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.zerocopysend":
+            message = {
+                **message,
+                "file": os.pread(
+                    message["file"].fileno(), message["count"], message["offset"]
+                ),
+            }
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "extensions": extensions}
+    asyncio.run(response(scope, receive, send))
+    return messages
+
+
+def test_asset_response(store):
+    """Test files are streamed in chunks, or handed to the server for zero-copy sending."""
+    job_id = uuid.uuid4()
+    asset = store.write(job_id, "out.tif", b"0123456789")
+
+    start, *bodies = send_response(
+        AssetResponse(store, job_id, asset, range_header="bytes=1-8"), {}
+    )
+    assert start["status"] == 206
+    assert [body["body"] for body in bodies] == [b"1234", b"5678"]
+    assert [body["more_body"] for body in bodies] == [True, False]
+
+    start, zero_copy = send_response(
+        AssetResponse(store, job_id, asset, range_header="bytes=1-8"),
+        {"http.response.zerocopysend": {}},
+    )
+    assert zero_copy["type"] == "http.response.zerocopysend"
+    assert zero_copy["file"] == b"12345678"
@@ -0,0 +1,116 @@
+import datetime
+import uuid
+
+import pytest
+
+from openeo_fastapi.api.types import Billing, Plan
+from openeo_fastapi.client.queue import QueuedJob
+from openeo_fastapi.client.scheduler import FairShareScheduler
+
+NOW = datetime.datetime(2024, 1, 1, 12)
+
+
+def queued(user_id: uuid.UUID, waited: float) -> QueuedJob:
+    return QueuedJob(
+        job_id=uuid.uuid4(),
+        user_id=user_id,
+        enqueued_at=NOW - datetime.timedelta(seconds=waited),
+    )
+
+
+def test_scheduler_shares_between_users():
+    heavy, light = uuid.uuid4(), uuid.uuid4()
+    # The heavy user queued many jobs before the light user queued one.
+    waiting = [queued(heavy, 100 - i) for i in range(10)] + [queued(light, 1)]
+
+    selected = FairShareScheduler().select(waiting, running={}, limit=2, now=NOW)
+
+    assert [job.user_id for job in selected] == [heavy, light]
+    # The oldest job of the user is dispatched first.
+    assert selected[0] == waiting[0]
+
+    # Users with running jobs wait for those without.
+    selected = FairShareScheduler().select(
+        waiting, running={heavy: 3}, limit=2, now=NOW
+    )
+    assert [job.user_id for job in selected] == [light, heavy]
+
+
+def test_scheduler_weights_and_caps():
+    paid, free = uuid.uuid4(), uuid.uuid4()
+    waiting = [queued(paid, 10) for _ in range(10)] + [
+        queued(free, 10) for _ in range(10)
+    ]
+    plans = {paid: "Paid", free: "free"}
+
+    scheduler = FairShareScheduler(
+        plan_weights={"paid": 3},
+        plan_of=plans.get,
+        default_plan="free",
+    )
+    selected = scheduler.select(waiting, running={}, limit=8, now=NOW)
+    assert [job.user_id for job in selected].count(paid) == 6
+
+    scheduler.max_running = 2
+    scheduler.plan_max_running = {"paid": 3}
+    selected = scheduler.select(waiting, running={free: 1}, limit=8, now=NOW)
+    assert [job.user_id for job in selected].count(paid) == 3
+    assert [job.user_id for job in selected].count(free) == 1
+
+
+def test_scheduler_aging():
+    busy, waiting_long = uuid.uuid4(), uuid.uuid4()
+    waiting = [queued(busy, 1), queued(waiting_long, 600)]
+    running = {busy: 0, waiting_long: 5}
+
+    without_aging = FairShareScheduler().select(waiting, running, limit=1, now=NOW)
+    assert without_aging[0].user_id == busy
+
+    with_aging = FairShareScheduler(aging=0.01).select(
+        waiting, running, limit=1, now=NOW
+    )
+    assert with_aging[0].user_id == waiting_long
+
+
+def test_scheduler_from_billing():
+    billing = Billing(
+        currency="credits",
+        default_plan="free",
+        plans=[
+            Plan(name="free", description="Free plan.", paid=False),
+            Plan(name="Paid", description="Paid plan.", paid=True),
+        ],
+    )
+
+    scheduler = FairShareScheduler.from_billing(billing, plan_weights={"paid": 2})
+    assert scheduler.weight(uuid.uuid4()) == 1.0
+    assert scheduler.default_plan == "free"
+
+    with pytest.raises(ValueError):
+        FairShareScheduler.from_billing(billing, plan_weights={"gold": 2})
+
+
+def test_scheduler_from_billing_with_plan_of():
+    """Test the scheduler of the setup docs example weighs and caps users by their plan."""
+    billing = Billing(
+        currency="credits",
+        default_plan="free",
+        plans=[
+            Plan(name="free", description="Free plan.", paid=False),
+            Plan(name="premium", description="Premium plan.", paid=True),
+        ],
+    )
+    premium, free = uuid.uuid4(), uuid.uuid4()
+
+    scheduler = FairShareScheduler.from_billing(
+        billing,
+        plan_weights={"premium": 3},
+        plan_of={premium: "premium"}.get,
+        max_running=10,
+        aging=0.001,
+    )
+
+    assert scheduler.weight(premium) == 3
+    assert scheduler.weight(free) == 1.0
+    assert scheduler.cap(free) == 10
+    assert scheduler.aging == 0.001
@@ -126,6 +126,18 @@ def s1_collection_item():
         return json.load(f_in)
 
 
+@pytest.fixture(autouse=True)
+def clear_auth_caches():
+    """The auth caches are process wide, clear them so mocked issuer responses don't leak between tests."""
+    auth.ISSUER_CACHE.clear()
+    auth.TOKEN_CACHE.clear()
+    auth.USER_CACHE.clear()
+    yield
+    auth.ISSUER_CACHE.clear()
+    auth.TOKEN_CACHE.clear()
+    auth.USER_CACHE.clear()
+
+
 @pytest.fixture()
 def mocked_oidc_config():
     resp_content_bytes = json.dumps(
@@ -266,6 +278,20 @@ def mocked_oidc_token():
     )
 
 
+@pytest.fixture
+def unexpired_oidc_token():
+    import base64
+    import time
+
+    def encode(part: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(part).encode()).decode().rstrip("=")
+
+    header = encode({"alg": "RS256", "kid": "1b94c"})
+    payload = encode({"sub": "someuser@testing.test", "exp": int(time.time()) + 3600})
+
+    return f"Bearer oidc/egi/{header}.{payload}.MOCKEDSIGNATURE"
+
+
 @pytest.fixture()
 def mocked_oidc_jwks():
     return [